@@ -7,8 +7,20 @@ import os
 from flask import Flask
 
 from app.cli import register_cli
+from app.common.acl_cache import init_company_access_cache
 from app.common.errors import register_error_handlers
+from app.common.invalidation import init_invalidation_bus
+from app.common.jwt import init_jwt
+from app.common.login_throttle import init_login_throttle
+from app.common.passwords import init_password_hasher
+from app.common.principals import init_principal_cache
+from app.common.profiling import register_request_profiling
+from app.common.rate_limits import init_rate_limits
+from app.common.rbac_cache import init_rbac_cache
+from app.common.sharding import init_tenant_shards
+from app.common.revocation import init_token_revocation
 from app.common.tenant import register_tenant_context
+from app.common.tenant_registry import init_tenant_registry
 from app.config import get_config
 from app.extensions import init_extensions
 
@@ -20,8 +32,20 @@ def create_app(config_name: str | None = None) -> Flask:
     app.config.from_object(get_config(resolved_config))
 
     init_extensions(app)
+    init_invalidation_bus(app)
+    init_jwt(app)
+    init_principal_cache(app)
+    init_rbac_cache(app)
+    init_company_access_cache(app)
+    init_password_hasher(app)
+    init_login_throttle(app)
+    init_token_revocation(app)
+    init_tenant_registry(app)
+    init_tenant_shards(app)
+    init_rate_limits(app)
     _register_module_blueprints(app)
     register_error_handlers(app)
+    register_request_profiling(app)
     register_tenant_context(app)
     register_cli(app)
 
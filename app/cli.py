@@ -2,89 +2,59 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+import os
+import tempfile
+import time
 import uuid
+from datetime import datetime, timezone
+from typing import Callable
 
 import click
 from flask import Flask, current_app
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from werkzeug.security import check_password_hash, generate_password_hash
 
-from app.extensions import db
+from app.extensions import db, limiter
 from app.common.access_levels import AccessLevel
+from app.common.permission_catalog import RBAC_PERMISSIONS, RBAC_ROLE_PERMISSIONS
+from app.common.profiling import VIEW_LAYER, aggregate_profiles
+from app.common.rate_limits import init_rate_limits
+from app.common.rbac_version import bump_rbac_version
+from app.common.sharding import DEFAULT_SHARD, copy_tenant, get_shard_router
+from app.common.tenant_registry import invalidate_tenant
+from app.common.jwt import (
+    base64url_encode,
+    create_access_token,
+    decode_token,
+    get_key_ring,
+    get_token_cache,
+)
+from app.common.partitioning import (
+    PARTITIONED_TABLES,
+    move_tenant_to_partition,
+    partition_table,
+    supports_partitioning,
+    tenant_partition_name,
+)
 from app.models.client import Client
 from app.models.company import Company
 from app.models.permission import Permission
 from app.models.role import Role
+from app.models.team import Team, team_members
+from app.models.team_company_access import TeamCompanyAccess
 from app.models.user import User
+from app.models.user_company_access import UserCompanyAccess
+from app.modules.companies.repository import CompanyRepository
+from app.repositories.client_repository import ClientRepository
 from app.repositories.role_repository import RoleRepository
 from app.repositories.user_company_access_repository import UserCompanyAccessRepository
 from app.repositories.user_repository import UserRepository
+from app.services.token_revocation_service import TokenRevocationService
 from app.services.user_service import UserService
 
-RBAC_PERMISSIONS: dict[str, str] = {
-    "tenant.profile.read": "Read tenant profile",
-    "tenant.profile.write": "Update tenant profile",
-    "tenant.users.invite": "Invite tenant users",
-    "tenant.users.manage": "Manage tenant users",
-    "company.read": "Read companies",
-    "company.write": "Manage companies",
-    "employee.read": "Read employees",
-    "employee.write": "Manage employees",
-    "case.read": "Read cases",
-    "case.write": "Manage cases",
-    "case.assign": "Assign cases",
-    "case.event.write": "Write case events",
-    "document.read": "Read documents",
-    "document.upload": "Upload documents",
-    "document.classify": "Classify documents",
-    "document.extraction.read": "Read document extractions",
-    "document.extraction.write": "Manage document extractions",
-    "audit.read": "Read audit logs",
-    "platform.clients.manage": "Manage platform clients",
-    "platform.metrics.read": "Read platform metrics",
-}
-
-RBAC_ROLE_PERMISSIONS: dict[str, list[str]] = {
-    "Super Admin": ["*"],
-    "Admin Cliente": [
-        "tenant.profile.read",
-        "tenant.profile.write",
-        "tenant.users.invite",
-        "tenant.users.manage",
-        "company.read",
-        "company.write",
-        "employee.read",
-        "employee.write",
-        "case.read",
-        "case.write",
-        "case.assign",
-        "case.event.write",
-        "document.read",
-        "document.upload",
-        "document.classify",
-        "document.extraction.read",
-        "document.extraction.write",
-        "audit.read",
-    ],
-    "Asesor": [
-        "company.read",
-        "employee.read",
-        "case.read",
-        "case.write",
-        "case.event.write",
-        "document.read",
-        "document.upload",
-        "document.classify",
-        "document.extraction.read",
-    ],
-    "Operativo": [
-        "company.read",
-        "employee.read",
-        "case.read",
-        "case.event.write",
-        "document.read",
-        "document.upload",
-    ],
-}
-
 
 def register_cli(app: Flask) -> None:
     """Register CLI commands on the Flask app."""
@@ -145,6 +115,434 @@ def register_cli(app: Flask) -> None:
         _ensure_seed_allowed(allow_production)
         seed_smoke()
 
+    @app.cli.command("bench-jwt")
+    @click.option(
+        "--iterations",
+        type=int,
+        default=20000,
+        show_default=True,
+        help="Token verifications per measurement.",
+    )
+    def bench_jwt_command(iterations: int) -> None:
+        """Compare token signing and verification throughput."""
+        bench_jwt(iterations)
+
+    @app.cli.command("bench-hash")
+    @click.option(
+        "--method",
+        "methods",
+        multiple=True,
+        help="werkzeug hash method to measure; repeatable. Defaults to a cost ladder.",
+    )
+    @click.option(
+        "--iterations",
+        type=int,
+        default=5,
+        show_default=True,
+        help="Verifications per method.",
+    )
+    def bench_hash_command(methods: tuple[str, ...], iterations: int) -> None:
+        """Report password verification latency per hash cost on this machine."""
+        bench_hash(list(methods), iterations)
+
+    @app.cli.command("bench-rate-limit")
+    @click.option(
+        "--storage",
+        "storages",
+        multiple=True,
+        help="limits storage URI to measure; repeatable. Defaults to memory:// and a temporary SQLite file.",
+    )
+    @click.option(
+        "--requests",
+        "request_count",
+        type=int,
+        default=2000,
+        show_default=True,
+        help="Authenticated requests per measurement.",
+    )
+    def bench_rate_limit_command(storages: tuple[str, ...], request_count: int) -> None:
+        """Measure the per-request cost of tenant and user rate limiting per storage."""
+        bench_rate_limit(list(storages), request_count)
+
+    @app.cli.command("bench-acl-filter")
+    @click.option(
+        "--size",
+        "sizes",
+        type=int,
+        multiple=True,
+        help="Accessible companies to seed; repeatable. Defaults to 10, 1000 and 50000.",
+    )
+    @click.option("--iterations", type=int, default=5, show_default=True, help="List calls per mode.")
+    @click.option(
+        "--database-url",
+        default="sqlite://",
+        show_default=True,
+        help="Scratch database to seed; its tables are dropped afterwards.",
+    )
+    def bench_acl_filter_command(sizes: tuple[int, ...], iterations: int, database_url: str) -> None:
+        """Compare IN-list and SQL-side ACL filtering for company lists."""
+        bench_acl_filter(list(sizes) or [10, 1000, 50000], iterations, database_url)
+
+    @app.cli.command("profile-report")
+    @click.argument("log_file", type=click.File("r"), default="-")
+    @click.option(
+        "--sort",
+        type=click.Choice(["total", "count", "queries"], case_sensitive=False),
+        default="total",
+        show_default=True,
+        help="Column to sort endpoints by (descending).",
+    )
+    def profile_report_command(log_file, sort: str) -> None:
+        """Aggregate request_profile log lines (REQUEST_PROFILING_ENABLED) per endpoint."""
+        profile_report(log_file, sort.lower())
+
+    @app.cli.command("partition-tables")
+    def partition_tables_command() -> None:
+        """LIST-partition tenant tables by client_id (PostgreSQL only)."""
+        partition_tables()
+
+    @app.cli.command("partition-tenant")
+    @click.argument("client_id")
+    def partition_tenant_command(client_id: str) -> None:
+        """Move one tenant's rows out of the DEFAULT partition into their own."""
+        partition_tenant(client_id)
+
+    @app.cli.command("set-tenant-status")
+    @click.argument("client_id")
+    @click.argument("status", type=click.Choice(["active", "suspended", "disabled"]))
+    def set_tenant_status_command(client_id: str, status: str) -> None:
+        """Activate, suspend or disable a tenant."""
+        set_tenant_status(client_id, status)
+
+    @app.cli.command("prune-revoked-tokens")
+    def prune_revoked_tokens_command() -> None:
+        """Delete revocation entries for access tokens that have expired; run it from cron."""
+        prune_revoked_tokens()
+
+    @app.cli.command("copy-tenant")
+    @click.argument("client_id")
+    @click.option("--from", "source", default=DEFAULT_SHARD, show_default=True, help="Shard to copy from.")
+    @click.option("--to", "target", required=True, help="Shard to copy to (a TENANT_SHARDS name or default).")
+    @click.option("--create-schema", is_flag=True, help="Create missing tables on the target first.")
+    @click.option("--switch", is_flag=True, help="Route the tenant to the target once copied.")
+    def copy_tenant_command(client_id: str, source: str, target: str, create_schema: bool, switch: bool) -> None:
+        """Copy one tenant's rows between shards."""
+        copy_tenant_between_shards(client_id, source, target, create_schema=create_schema, switch=switch)
+
+
+def copy_tenant_between_shards(
+    client_id: str, source: str, target: str, create_schema: bool = False, switch: bool = False
+) -> None:
+    """Copy client_id from source to target and optionally repoint its shard map entry."""
+    router = get_shard_router()
+    for shard in (source, target):
+        if shard not in router.shard_names():
+            raise click.BadParameter(f"Unknown shard {shard!r}; configure it in TENANT_SHARDS.")
+    repository = ClientRepository()
+    if repository.get_by_id(client_id) is None:
+        raise click.ClickException(f"Client {client_id} not found.")
+    if create_schema:
+        db.metadata.create_all(router.engine(target))
+
+    # Writes made during the copy are not carried over: suspend the tenant first.
+    try:
+        copied = copy_tenant(client_id, source, target)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    for table, count in copied.items():
+        click.echo(f"{table}: {count} rows")
+    if switch:
+        repository.set_shard(client_id, None if target == DEFAULT_SHARD else target)
+        invalidate_tenant(client_id)
+        db.session.commit()
+        click.echo(f"Client {client_id} now routes to {target}.")
+
+
+def set_tenant_status(client_id: str, status: str) -> None:
+    """Change a tenant's status and tell every worker's registry."""
+    repository = ClientRepository()
+    client = repository.get_by_id(client_id)
+    if client is None:
+        raise click.ClickException(f"Client {client_id} not found.")
+    repository.update_status(client, status)
+    invalidate_tenant(client_id)
+    db.session.commit()
+    click.echo(f"Client {client.name} is now {status}.")
+
+
+def prune_revoked_tokens() -> None:
+    """Delete expired revocation entries so the table and Bloom filters stay small."""
+    deleted = TokenRevocationService().prune_expired()
+    db.session.commit()
+    click.echo(f"Deleted {deleted} expired revocation entries.")
+
+
+def partition_tables() -> None:
+    """Convert every tenant table that is not partitioned yet."""
+    with db.engine.begin() as connection:
+        if not supports_partitioning(connection):
+            click.echo(f"Partitioning needs PostgreSQL; {connection.dialect.name} keeps plain tables.")
+            return
+        for table in PARTITIONED_TABLES:
+            converted = partition_table(connection, table)
+            click.echo(f"{table}: {'partitioned' if converted else 'unchanged'}")
+
+
+def partition_tenant(client_id: str) -> None:
+    """Give client_id a dedicated partition of every partitioned tenant table."""
+    try:
+        tenant_partition_name(PARTITIONED_TABLES[0], client_id)
+    except ValueError as exc:
+        raise click.BadParameter("client_id must be a UUID") from exc
+    if db.session.get(Client, client_id) is None:
+        raise click.ClickException(f"Client {client_id} not found.")
+
+    with db.engine.begin() as connection:
+        if not supports_partitioning(connection):
+            click.echo(f"Partitioning needs PostgreSQL; {connection.dialect.name} keeps plain tables.")
+            return
+        for table in PARTITIONED_TABLES:
+            moved = move_tenant_to_partition(connection, table, client_id)
+            if moved is None:
+                click.echo(f"{table}: skipped (not partitioned or already split out)")
+            else:
+                click.echo(f"{table}: moved {moved} rows to {tenant_partition_name(table, client_id)}")
+
+
+def profile_report(lines, sort: str = "total") -> None:
+    """Print average ms and SQL statements per decorator layer for each endpoint."""
+    totals = aggregate_profiles(lines)
+    if not totals:
+        click.echo("No request_profile entries found.")
+        return
+
+    layer_names = sorted({name for bucket in totals.values() for name in bucket["layers"]} - {VIEW_LAYER})
+    layer_names.append(VIEW_LAYER)
+    sort_key = {"total": "total_ms", "count": "count", "queries": "queries"}[sort]
+    header = f"{'endpoint':<48}{'n':>6}{'total ms':>10}{'sql':>6}"
+    header += "".join(f"{name:>24}" for name in layer_names)
+    click.echo(header)
+    click.echo(" " * 70 + "".join(f"{'ms / sql':>24}" for _ in layer_names))
+    for (method, endpoint), bucket in sorted(totals.items(), key=lambda item: item[1][sort_key], reverse=True):
+        row = f"{method + ' ' + endpoint:<48}{bucket['count']:>6}{bucket['total_ms']:>10.2f}{bucket['queries']:>6.1f}"
+        for name in layer_names:
+            layer = bucket["layers"].get(name)
+            cell = f"{layer['ms']:.2f} / {layer['queries']:.1f}" if layer else "-"
+            row += f"{cell:>24}"
+        click.echo(row)
+
+
+def bench_acl_filter(sizes: list[int], iterations: int, database_url: str = "sqlite://") -> None:
+    """Time CompanyRepository list modes against a scratch database per size."""
+    tables = [
+        Client.__table__,
+        User.__table__,
+        Company.__table__,
+        UserCompanyAccess.__table__,
+        Team.__table__,
+        team_members,
+        TeamCompanyAccess.__table__,
+    ]
+    engine = create_engine(database_url)
+    click.echo(f"{'companies':>10}{'in (ids loaded)':>20}{'exists':>12}{'join':>12}   ms per list")
+    try:
+        for size in sizes:
+            db.metadata.drop_all(engine, tables=tables)
+            db.metadata.create_all(engine, tables=tables)
+            with Session(engine) as session:
+                client_id, user_id = _seed_acl_bench(session, size)
+                company_repository = CompanyRepository(session)
+                access_repository = UserCompanyAccessRepository(session)
+
+                def in_list() -> list:
+                    allowed = set(access_repository.get_access_map(user_id, client_id))
+                    return company_repository.list(client_id, allowed_company_ids=allowed)
+
+                modes = {
+                    "in": in_list,
+                    "exists": lambda: company_repository.list(client_id, acl_user_id=user_id),
+                    "join": lambda: company_repository.list_with_access(client_id, user_id),
+                }
+                cells = []
+                for func in modes.values():
+                    session.expunge_all()
+                    try:
+                        cells.append(f"{_average_ms(func, iterations):.2f}")
+                    except Exception as exc:  # e.g. SQLite's bound parameter limit
+                        session.rollback()
+                        cells.append(f"failed ({type(exc).__name__})")
+                click.echo(f"{size:>10}{cells[0]:>20}{cells[1]:>12}{cells[2]:>12}")
+    finally:
+        db.metadata.drop_all(engine, tables=tables)
+        engine.dispose()
+
+
+def _seed_acl_bench(session: Session, size: int) -> tuple[str, str]:
+    client_id = str(uuid.uuid4())
+    user_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    timestamps = {"created_at": now, "updated_at": now}
+    session.execute(insert(Client), [{"id": client_id, "name": "bench", "status": "active", **timestamps}])
+    session.execute(
+        insert(User),
+        [{"id": user_id, "client_id": client_id, "email": "bench@example.com", "status": "active", **timestamps}],
+    )
+    company_ids = [str(uuid.uuid4()) for _ in range(size)]
+    # Twice as many companies as the user can see, so the filter has work to do.
+    session.execute(
+        insert(Company),
+        [
+            {
+                "id": company_ids[index] if index < size else str(uuid.uuid4()),
+                "client_id": client_id,
+                "name": f"Company {index:06d}",
+                "tax_id": f"T-{index:06d}",
+                "status": "active",
+                **timestamps,
+            }
+            for index in range(size * 2)
+        ],
+    )
+    session.execute(
+        insert(UserCompanyAccess),
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "client_id": client_id,
+                "user_id": user_id,
+                "company_id": company_id,
+                "access_level": AccessLevel.viewer.value,
+                **timestamps,
+            }
+            for company_id in company_ids
+        ],
+    )
+    session.commit()
+    return client_id, user_id
+
+
+def _average_ms(func: Callable[[], object], iterations: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+def bench_jwt(iterations: int) -> None:
+    """Measure HMAC signing strategies and decode_token with a cold and warm cache."""
+    key_ring = get_key_ring()
+    secret = current_app.config["SECRET_KEY"].encode("utf-8")
+    message = b"eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIiwiY2xpZW50X2lkIjoiMSJ9"
+    signature = key_ring.sign(message)
+
+    def legacy_sign() -> str:
+        return base64url_encode(hmac.new(secret, message, hashlib.sha256).digest())
+
+    _report_throughput("sign (hmac.new per call)", legacy_sign, iterations)
+    _report_throughput("sign (key ring clone)", lambda: key_ring.sign(message), iterations)
+    _report_throughput(
+        "verify (hmac.new per call)",
+        lambda: hmac.compare_digest(signature, legacy_sign()),
+        iterations,
+    )
+    _report_throughput(
+        "verify (key ring clone)",
+        lambda: key_ring.verify(message, signature),
+        iterations,
+    )
+
+    token = create_access_token(str(uuid.uuid4()), str(uuid.uuid4()))
+    cache = get_token_cache()
+    if not cache.enabled:
+        click.echo("JWT_CACHE_SIZE is 0; warm numbers will match cold ones.")
+
+    def cold() -> None:
+        cache.clear()
+        decode_token(token)
+
+    cache.clear()
+    _report_throughput("decode_token (cold)", cold, iterations)
+    decode_token(token)
+    _report_throughput("decode_token (warm)", lambda: decode_token(token), iterations)
+    click.echo(f"token cache: {cache.stats()}")
+
+
+def bench_rate_limit(storages: list[str], request_count: int) -> None:
+    """Time authenticated requests with the limiter off, then on for each storage."""
+    app = current_app._get_current_object()
+    saved = {
+        key: app.config[key]
+        for key in ("RATELIMIT_STORAGE_URI", "RATE_LIMIT_TENANT_DEFAULT", "RATE_LIMIT_PER_USER")
+    }
+    # Generous limits: the benchmark measures bookkeeping, not rejections.
+    app.config["RATE_LIMIT_TENANT_DEFAULT"] = app.config["RATE_LIMIT_PER_USER"] = "100000000/hour"
+    token = create_access_token(str(uuid.uuid4()), str(uuid.uuid4()))
+    headers = {"Authorization": f"Bearer {token}"}
+    client = app.test_client()
+
+    def request_once() -> None:
+        client.get("/health", headers=headers)
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = storages or ["memory://", f"gestium+sqlite:///{os.path.join(directory, 'limits.sqlite3')}"]
+        try:
+            limiter.enabled = False
+            request_once()
+            baseline = _report_throughput("limiter off", request_once, request_count)
+            for uri in storages:
+                app.config["RATELIMIT_STORAGE_URI"] = uri
+                limiter.init_app(app)
+                init_rate_limits(app)
+                limiter.enabled = True
+                request_once()
+                measured = _report_throughput(f"limiter on ({uri})", request_once, request_count)
+                click.echo(f"  overhead: {(1 / measured - 1 / baseline) * 1e6:.1f} us/request")
+        finally:
+            app.config.update(saved)
+            limiter.init_app(app)
+            init_rate_limits(app)
+            limiter.enabled = app.config.get("RATELIMIT_ENABLED", True)
+
+
+BENCH_HASH_METHODS = [
+    "pbkdf2:sha256:260000",
+    "pbkdf2:sha256:600000",
+    "pbkdf2:sha256:1000000",
+    "scrypt:16384:8:1",
+    "scrypt:32768:8:1",
+]
+
+
+def bench_hash(methods: list[str], iterations: int) -> None:
+    """Time check_password_hash, i.e. the CPU cost of one login, per hash method."""
+    configured = current_app.config.get("PASSWORD_HASH_METHOD")
+    methods = methods or list(dict.fromkeys([configured, *BENCH_HASH_METHODS]))
+    click.echo(f"{'method':<28}{'login ms (avg)':>16}{'min':>10}{'max':>10}")
+    for method in methods:
+        pwhash = generate_password_hash("bench-password", method)
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            check_password_hash(pwhash, "bench-password")
+            samples.append((time.perf_counter() - started) * 1000)
+        marker = " *" if method == configured else ""
+        click.echo(
+            f"{method + marker:<28}{sum(samples) / len(samples):>16.1f}"
+            f"{min(samples):>10.1f}{max(samples):>10.1f}"
+        )
+    click.echo("* = PASSWORD_HASH_METHOD")
+
+
+def _report_throughput(label: str, func: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    ops_per_second = iterations / elapsed if elapsed else float("inf")
+    click.echo(f"{label}: {ops_per_second:,.0f} ops/s ({elapsed * 1e6 / iterations:.2f} us/op)")
+    return ops_per_second
+
 
 def seed_default_client() -> None:
     """Create the default client if it does not exist."""
@@ -198,6 +596,7 @@ def seed_rbac() -> None:
                 permissions_by_code,
             )
 
+    bump_rbac_version()
     db.session.commit()
     click.echo("RBAC permissions and roles seeded.")
 
@@ -304,6 +703,7 @@ def _get_or_create_client(name: str, client_id: str | None = None) -> Client:
         updated = True
     if updated:
         db.session.add(client)
+        invalidate_tenant(client.id)
         click.echo(f"Updated client {name}.")
     else:
         click.echo(f"Reused client {name}.")
@@ -381,6 +781,7 @@ def _assign_role(user: User, role: Role) -> None:
         return
     user.roles.append(role)
     db.session.add(user)
+    bump_rbac_version()
     click.echo(f"Assigned role {role.name} to {user.email}.")
 
 
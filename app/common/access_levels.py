@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Iterable
 
 
 class AccessLevel(str, Enum):
@@ -36,3 +37,13 @@ def access_level_ge(user_level: str | AccessLevel, required_level: str | AccessL
     normalized_user = _normalize_level(user_level)
     normalized_required = _normalize_level(required_level)
     return ACCESS_LEVEL_ORDER[normalized_user] >= ACCESS_LEVEL_ORDER[normalized_required]
+
+
+def merge_access_levels(rows: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """Collapse (company_id, access_level) grants to the highest level per company."""
+    levels: dict[str, str] = {}
+    for company_id, access_level in rows:
+        current = levels.get(company_id)
+        if current is None or not access_level_ge(current, access_level):
+            levels[company_id] = access_level
+    return levels
@@ -0,0 +1,85 @@
+"""Request-scoped and optional per-worker cache of company access maps."""
+
+from __future__ import annotations
+
+from flask import Flask, current_app, g, has_app_context, has_request_context
+
+from app.common.cache import TTLCache
+from app.common.invalidation import (
+    TOPIC_COMPANY_ACCESS,
+    publish_invalidation,
+    register_invalidation_handler,
+    topic_key,
+)
+from app.common.metrics import register_metrics_provider
+
+_ACL_CACHE_EXTENSION = "company_access_cache"
+_REQUEST_ATTR = "_company_access_maps"
+
+
+def init_company_access_cache(app: Flask) -> None:
+    """Create the per-worker company access cache (disabled when the size is 0)."""
+    acl_cache = TTLCache(
+        app.config.get("COMPANY_ACCESS_CACHE_SIZE", 0),
+        default_ttl=app.config.get("COMPANY_ACCESS_CACHE_TTL_SECONDS", 30),
+    )
+    app.extensions[_ACL_CACHE_EXTENSION] = acl_cache
+    register_metrics_provider(app, "company_access_cache", acl_cache.stats)
+
+    def _evict(key: str | None) -> None:
+        if key is None:
+            acl_cache.clear()
+            return
+        client_id, _, user_id = key.partition(":")
+        acl_cache.pop((user_id, client_id))
+
+    register_invalidation_handler(app, TOPIC_COMPANY_ACCESS, _evict)
+
+
+def get_company_access_cache() -> TTLCache:
+    """Return the company access cache for the current app."""
+    acl_cache = current_app.extensions.get(_ACL_CACHE_EXTENSION)
+    if acl_cache is None:
+        init_company_access_cache(current_app)
+        acl_cache = current_app.extensions[_ACL_CACHE_EXTENSION]
+    return acl_cache
+
+
+def get_cached_access_map(user_id: str, client_id: str) -> dict[str, str] | None:
+    """Return the company_id -> access_level map if this request or worker has it."""
+    key = (str(user_id), str(client_id))
+    request_maps = _request_maps()
+    if key in request_maps:
+        return request_maps[key]
+    if not has_app_context():
+        return None
+    access_map = get_company_access_cache().get(key)
+    if access_map is not None:
+        request_maps[key] = access_map
+    return access_map
+
+
+def store_access_map(user_id: str, client_id: str, access_map: dict[str, str]) -> None:
+    key = (str(user_id), str(client_id))
+    _request_maps()[key] = access_map
+    if has_app_context():
+        get_company_access_cache().set(key, access_map)
+
+
+def invalidate_company_access(user_id: str, client_id: str) -> None:
+    """Drop cached maps after the user's ACL rows change."""
+    key = (str(user_id), str(client_id))
+    _request_maps().pop(key, None)
+    if has_app_context():
+        get_company_access_cache().pop(key)
+        publish_invalidation(topic_key(TOPIC_COMPANY_ACCESS, client_id, user_id))
+
+
+def _request_maps() -> dict[tuple[str, str], dict[str, str]]:
+    if has_request_context():
+        maps = g.get(_REQUEST_ATTR)
+        if maps is None:
+            maps = {}
+            setattr(g, _REQUEST_ATTR, maps)
+        return maps
+    return {}
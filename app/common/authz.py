@@ -2,17 +2,64 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from flask import g, has_request_context
-from sqlalchemy import and_, or_
+from sqlalchemy import String, and_, literal, null, or_, select, type_coerce, union_all
 
+from app.common.access_levels import access_level_ge, merge_access_levels
+from app.common.acl_cache import get_cached_access_map, get_company_access_cache, store_access_map
+from app.common.permission_catalog import (
+    PERMISSION_BITS,
+    bitmap_has_permission,
+    encode_permission_bitmap,
+)
+from app.common.principals import Principal
+from app.common.rbac_cache import ALL_PERMISSIONS_KEY, UserRoles, get_rbac_cache
+from app.common.rbac_version import get_rbac_version
 from app.extensions import db
+from app.models.company import Company
 from app.models.permission import Permission
 from app.models.rbac import role_permissions, user_roles
 from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_company_access_repository import access_grant_selects
+
+_CONTEXT_ATTR = "authz"
+
+
+@dataclass(frozen=True)
+class AuthorizationContext:
+    """Everything a policy check resolved for the current request."""
+
+    user: Principal | None
+    is_super_admin: bool
+    permissions: frozenset[str]
+    company_id: str | None = None
+    company_exists: bool = False
+    access_level: str | None = None
+
+    def has_permission(self, permission_code: str) -> bool:
+        return self.is_super_admin or permission_code in self.permissions
+
+    def has_company_access(self, required_level: str) -> bool:
+        return self.access_level is not None and access_level_ge(self.access_level, required_level)
+
+
+def current_authorization() -> AuthorizationContext | None:
+    """Return the context resolved by ``authorize`` for this request, if any."""
+    if not has_request_context():
+        return None
+    return g.get(_CONTEXT_ATTR)
 
 
 class AuthorizationService:
-    """Service for resolving permissions and authorization checks."""
+    """Service for resolving permissions and authorization checks.
+
+    Role memberships and role permissions come from the worker-level RBAC
+    snapshot, so steady-state checks are dictionary lookups; ``g`` still
+    memoizes per-request results.
+    """
 
     _CACHE_ATTR = "_authz_cache"
 
@@ -23,26 +70,11 @@ class AuthorizationService:
         if cache_key in cache:
             return cache[cache_key]
 
-        if self._user_is_super_admin(user_id):
-            permissions = {code for (code,) in db.session.query(Permission.code).all()}
-            cache[cache_key] = permissions
-            return permissions
-
-        query = (
-            db.session.query(Permission.code)
-            .join(role_permissions, Permission.id == role_permissions.c.permission_id)
-            .join(Role, Role.id == role_permissions.c.role_id)
-            .join(user_roles, user_roles.c.role_id == Role.id)
-            .filter(user_roles.c.user_id == user_id)
-            .filter(
-                or_(
-                    Role.scope == "platform",
-                    and_(Role.scope == "tenant", Role.client_id == client_id),
-                )
-            )
-            .distinct()
-        )
-        permissions = {code for (code,) in query.all()}
+        roles = self._get_user_roles(user_id, client_id)
+        if roles.is_super_admin:
+            permissions = set(self._all_permission_codes())
+        else:
+            permissions = set().union(*self._get_role_permissions(roles.role_ids).values())
         cache[cache_key] = permissions
         return permissions
 
@@ -50,30 +82,213 @@ class AuthorizationService:
         """Return True if the user has the permission code (or is Super Admin)."""
         if user is None:
             return False
-        if self._user_is_super_admin(user.id):
+        if self._get_user_roles(user.id, user.client_id).is_super_admin:
             return True
         permissions = self.get_user_permissions(user.id, user.client_id)
         return permission_code in permissions
 
-    def _user_is_super_admin(self, user_id: str) -> bool:
+    def permission_claims(self, user_id: str, client_id: str) -> dict:
+        """Build the ``perms`` bitmap and ``pv`` version claims for an access token."""
+        version = get_rbac_version()
+        if self._get_user_roles(user_id, client_id).is_super_admin:
+            codes = PERMISSION_BITS.keys()
+        else:
+            codes = self.get_user_permissions(user_id, client_id)
+        return {"perms": encode_permission_bitmap(codes), "pv": version}
+
+    def permission_from_claims(self, claims: dict, permission_code: str) -> bool | None:
+        """Answer a permission check from token claims, or None if the DB must decide."""
+        encoded_bitmap = claims.get("perms")
+        version = claims.get("pv")
+        if encoded_bitmap is None or version is None:
+            return None
+        if version != get_rbac_version():
+            return None
+        return bitmap_has_permission(encoded_bitmap, permission_code)
+
+    def load_context(
+        self,
+        user_id: str,
+        client_id: str,
+        company_id: str | None = None,
+    ) -> AuthorizationContext:
+        """Resolve user status, permissions and company ACL in a single statement.
+
+        Each branch of the UNION ALL yields (kind, key, value) rows, so the
+        whole policy costs one round trip. Role branches are only included for
+        whatever the RBAC snapshot is missing. The ACL branches (direct and team
+        grants) are skipped when the user's company access map is cached; with
+        the worker ACL cache enabled they load the whole map (to cache it),
+        otherwise only the requested company.
+        Results are written back to the caches.
+        """
+        rbac_cache = get_rbac_cache()
+        roles = rbac_cache.get_user_roles(user_id, client_id)
+        cached_permissions: dict[str, frozenset[str]] = {}
+        missing_role_ids: list[str] = []
+        if roles is not None:
+            cached_permissions, missing_role_ids = rbac_cache.get_role_permissions(roles.role_ids)
+
+        # Enum columns are coerced to plain strings so the union's result type
+        # does not reject values coming from other branches.
+        branches = [
+            select(
+                literal("status").label("kind"),
+                null().label("key"),
+                type_coerce(User.status, String).label("value"),
+            ).where(User.id == user_id, User.client_id == client_id),
+        ]
+        if roles is None:
+            user_role_filter = and_(
+                user_roles.c.user_id == user_id,
+                or_(
+                    Role.scope == "platform",
+                    and_(Role.scope == "tenant", Role.client_id == client_id),
+                ),
+            )
+            branches.append(
+                select(literal("role"), Role.id, type_coerce(Role.scope, String) + ":" + Role.name)
+                .join(user_roles, user_roles.c.role_id == Role.id)
+                .where(user_role_filter)
+            )
+            branches.append(
+                select(literal("permission"), role_permissions.c.role_id, Permission.code)
+                .join(role_permissions, Permission.id == role_permissions.c.permission_id)
+                .join(Role, Role.id == role_permissions.c.role_id)
+                .join(user_roles, user_roles.c.role_id == Role.id)
+                .where(user_role_filter)
+            )
+        elif missing_role_ids:
+            branches.append(
+                select(literal("permission"), role_permissions.c.role_id, Permission.code)
+                .join(role_permissions, Permission.id == role_permissions.c.permission_id)
+                .where(role_permissions.c.role_id.in_(missing_role_ids))
+            )
+        access_map = get_cached_access_map(user_id, client_id) if company_id is not None else None
+        if company_id is not None:
+            branches.append(
+                select(literal("company"), Company.id, null()).where(
+                    Company.id == company_id,
+                    Company.client_id == client_id,
+                )
+            )
+        load_access_map = company_id is not None and access_map is None and get_company_access_cache().enabled
+        if company_id is not None and access_map is None:
+            company_filter = None if load_access_map else [company_id]
+            # Direct and team grants; the highest level per company wins below.
+            for grants in access_grant_selects(user_id, client_id, company_filter):
+                branches.append(grants.with_only_columns(literal("access"), *grants.selected_columns))
+
+        statement = union_all(*branches) if len(branches) > 1 else branches[0]
+        status = None
+        role_ids: set[str] = set()
+        is_super_admin = False
+        loaded_permissions: dict[str, set[str]] = {role_id: set() for role_id in missing_role_ids}
+        company_exists = False
+        access_rows: list[tuple[str, str]] = []
+        for kind, key, value in db.session.execute(statement):
+            if kind == "status":
+                status = value
+            elif kind == "role":
+                role_ids.add(key)
+                loaded_permissions.setdefault(key, set())
+                is_super_admin = is_super_admin or value == "platform:Super Admin"
+            elif kind == "permission":
+                loaded_permissions.setdefault(key, set()).add(value)
+            elif kind == "company":
+                company_exists = True
+            elif kind == "access":
+                access_rows.append((key, value))
+
+        loaded_access_map = merge_access_levels(access_rows)
+        if load_access_map and status is not None:
+            store_access_map(user_id, client_id, loaded_access_map)
+        if access_map is None:
+            access_map = loaded_access_map
+        access_level = access_map.get(company_id) if company_id is not None else None
+
+        if roles is None:
+            roles = UserRoles(role_ids=frozenset(role_ids), is_super_admin=is_super_admin)
+            if status is not None:
+                rbac_cache.set_user_roles(user_id, client_id, roles)
+        for role_id, codes in loaded_permissions.items():
+            rbac_cache.set_role_permissions(role_id, codes)
+            cached_permissions[role_id] = frozenset(codes)
+        permissions = frozenset().union(*cached_permissions.values())
+
+        user = None
+        if status is not None:
+            user = Principal(id=str(user_id), client_id=str(client_id), status=status)
         cache = self._get_request_cache()
-        cache_key = ("super_admin", user_id)
+        cache[("roles", user_id, client_id)] = roles
+        if not roles.is_super_admin:
+            cache[("permissions", user_id, client_id)] = set(permissions)
+        return AuthorizationContext(
+            user=user,
+            is_super_admin=roles.is_super_admin,
+            permissions=permissions,
+            company_id=company_id,
+            company_exists=company_exists,
+            access_level=access_level,
+        )
+
+    def _get_user_roles(self, user_id: str, client_id: str) -> UserRoles:
+        cache = self._get_request_cache()
+        cache_key = ("roles", user_id, client_id)
         if cache_key in cache:
             return cache[cache_key]
 
-        exists = (
-            db.session.query(Role.id)
-            .join(user_roles, user_roles.c.role_id == Role.id)
-            .filter(
-                user_roles.c.user_id == user_id,
-                Role.scope == "platform",
-                Role.name == "Super Admin",
+        rbac_cache = get_rbac_cache()
+        roles = rbac_cache.get_user_roles(user_id, client_id)
+        if roles is None:
+            rows = (
+                db.session.query(Role.id, Role.name, Role.scope)
+                .join(user_roles, user_roles.c.role_id == Role.id)
+                .filter(user_roles.c.user_id == user_id)
+                .filter(
+                    or_(
+                        Role.scope == "platform",
+                        and_(Role.scope == "tenant", Role.client_id == client_id),
+                    )
+                )
+                .all()
             )
-            .first()
-            is not None
-        )
-        cache[cache_key] = exists
-        return exists
+            roles = UserRoles(
+                role_ids=frozenset(row.id for row in rows),
+                is_super_admin=any(
+                    row.scope == "platform" and row.name == "Super Admin" for row in rows
+                ),
+            )
+            rbac_cache.set_user_roles(user_id, client_id, roles)
+        cache[cache_key] = roles
+        return roles
+
+    def _get_role_permissions(self, role_ids: frozenset[str]) -> dict[str, frozenset[str]]:
+        rbac_cache = get_rbac_cache()
+        permissions, missing_role_ids = rbac_cache.get_role_permissions(role_ids)
+        if missing_role_ids:
+            loaded: dict[str, set[str]] = {role_id: set() for role_id in missing_role_ids}
+            rows = (
+                db.session.query(role_permissions.c.role_id, Permission.code)
+                .join(Permission, Permission.id == role_permissions.c.permission_id)
+                .filter(role_permissions.c.role_id.in_(missing_role_ids))
+                .all()
+            )
+            for role_id, code in rows:
+                loaded[role_id].add(code)
+            for role_id, codes in loaded.items():
+                rbac_cache.set_role_permissions(role_id, codes)
+                permissions[role_id] = frozenset(codes)
+        return permissions
+
+    def _all_permission_codes(self) -> frozenset[str]:
+        rbac_cache = get_rbac_cache()
+        cached, _ = rbac_cache.get_role_permissions([ALL_PERMISSIONS_KEY])
+        if ALL_PERMISSIONS_KEY in cached:
+            return cached[ALL_PERMISSIONS_KEY]
+        codes = frozenset(code for (code,) in db.session.query(Permission.code).all())
+        rbac_cache.set_role_permissions(ALL_PERMISSIONS_KEY, codes)
+        return codes
 
     def _get_request_cache(self) -> dict:
         if has_request_context():
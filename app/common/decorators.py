@@ -4,12 +4,16 @@ from functools import wraps
 from typing import Any, Callable
 
 from flask import g, request
-from werkzeug.exceptions import Forbidden, Unauthorized
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound, Unauthorized
 
 from app.common.acl import resolve_company_id
 from app.common.authz import AuthorizationService
 from app.common.jwt import decode_token
-from app.repositories.user_repository import UserRepository
+from app.common.principals import load_principal
+from app.common.profiling import profile_layer
+from app.common.revocation import get_revocation_list
+from app.common.sharding import bind_tenant
+from app.common.tenant_registry import ensure_tenant_active
 from app.services.company_access_service import CompanyAccessService
 
 
@@ -24,44 +28,117 @@ def noop_decorator(func: Callable):
 
 
 def auth_required(func: Callable[..., Any]):
-    """Ensure the request has a valid bearer token and active user."""
+    """Ensure the request has a valid bearer token and active user.
+
+    ``g.user`` is a cached :class:`~app.common.principals.Principal`, not the ORM user.
+    """
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any):
-        auth_header = request.headers.get("Authorization", "")
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
-            raise Unauthorized("missing_token")
-
-        payload = decode_token(parts[1])
-        user_id = payload.get("sub")
-        client_id = payload.get("client_id")
-        if not user_id or not client_id:
-            raise Unauthorized("invalid_token")
-
-        user = UserRepository().get_by_id(str(user_id), str(client_id))
-        if user is None:
-            raise Unauthorized("invalid_credentials")
-        if user.status != "active":
-            raise Forbidden("user_inactive")
-
-        g.user = user
-        g.client_id = user.client_id
+        with profile_layer("auth_required"):
+            payload = _bearer_claims()
+            user = load_principal(str(payload["sub"]), str(payload["client_id"]))
+            _ensure_active(user)
+
+            g.user = user
+            g.client_id = user.client_id
+            g.token_claims = payload
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def authorize(
+    permission: str | None = None,
+    company_access: str | None = None,
+    company_id_arg: str | None = None,
+):
+    """Authenticate, check RBAC and company ACL with a single database round trip.
+
+    Equivalent to stacking ``auth_required``, ``tenant_required``,
+    ``require_permission`` and ``require_company_access``, with the same errors.
+    The resolved :class:`~app.common.authz.AuthorizationContext` is stored on
+    ``g.authz`` for services to reuse.
+    """
+
+    def decorator(func: Callable[..., Any]):
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            with profile_layer("authorize"):
+                payload = _bearer_claims()
+                company_id = None
+                company_error = None
+                if company_access is not None:
+                    try:
+                        company_id = resolve_company_id(company_id_arg)
+                    except BadRequest as exc:
+                        # Raised after the permission check, as the stacked decorators do.
+                        company_error = exc
+                context = AuthorizationService().load_context(
+                    str(payload["sub"]),
+                    str(payload["client_id"]),
+                    company_id=company_id,
+                )
+                _ensure_active(context.user)
+
+                g.user = context.user
+                g.client_id = context.user.client_id
+                g.token_claims = payload
+                g.authz = context
+                if permission is not None and not context.has_permission(permission):
+                    raise Forbidden("missing_permission")
+                if company_error is not None:
+                    raise company_error
+                if company_access is not None:
+                    if context.access_level is None:
+                        raise NotFound("Company access not found.")
+                    if not context.has_company_access(company_access):
+                        raise Forbidden("Insufficient access level.")
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _bearer_claims() -> dict:
+    auth_header = request.headers.get("Authorization", "")
+    parts = auth_header.split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        raise Unauthorized("missing_token")
+
+    payload = decode_token(parts[1])
+    if not payload.get("sub") or not payload.get("client_id"):
+        raise Unauthorized("invalid_token")
+    if get_revocation_list().is_revoked(payload):
+        raise Unauthorized("token_revoked")
+    bind_tenant(str(payload["client_id"]))
+    return payload
+
+
+def _ensure_active(user) -> None:
+    if user is None:
+        raise Unauthorized("invalid_credentials")
+    if user.status != "active":
+        raise Forbidden("user_inactive")
+    ensure_tenant_active(user.client_id)
+
+
 def require_permission(code: str):
     """Ensure the request has a valid user with the required permission."""
 
     def decorator(func: Callable[..., Any]):
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any):
-            if not getattr(g, "user", None):
-                raise Unauthorized("missing_token")
-            if not AuthorizationService().user_has_permission(g.user, code):
-                raise Forbidden("missing_permission")
+            with profile_layer("require_permission"):
+                if not getattr(g, "user", None):
+                    raise Unauthorized("missing_token")
+                service = AuthorizationService()
+                granted = service.permission_from_claims(getattr(g, "token_claims", None) or {}, code)
+                if granted is None:
+                    granted = service.user_has_permission(g.user, code)
+                if not granted:
+                    raise Forbidden("missing_permission")
             return func(*args, **kwargs)
 
         return wrapper
@@ -75,16 +152,17 @@ def require_company_access(required_level: str, company_id_arg: str | None = Non
     def decorator(func: Callable[..., Any]):
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any):
-            if not getattr(g, "user", None):
-                raise Unauthorized("missing_token")
-            company_id = resolve_company_id(company_id_arg)
-            service = CompanyAccessService()
-            service.require_access(
-                user_id=str(g.user.id),
-                company_id=str(company_id),
-                client_id=str(g.client_id),
-                required_level=required_level,
-            )
+            with profile_layer("require_company_access"):
+                if not getattr(g, "user", None):
+                    raise Unauthorized("missing_token")
+                company_id = resolve_company_id(company_id_arg)
+                service = CompanyAccessService()
+                service.require_access(
+                    user_id=str(g.user.id),
+                    company_id=str(company_id),
+                    client_id=str(g.client_id),
+                    required_level=required_level,
+                )
             return func(*args, **kwargs)
 
         return wrapper
@@ -14,6 +14,9 @@ def register_error_handlers(app: Flask) -> None:
             "message": error.description,
         })
         response.status_code = error.code or 500
+        for name, value in error.get_headers():
+            if name.lower() != "content-type":
+                response.headers[name] = value
         return response
 
     @app.errorhandler(Exception)
@@ -0,0 +1,298 @@
+"""Cross-worker cache invalidation bus.
+
+Writers publish topic keys such as ``principal:<client_id>:<user_id>``; keys are
+held on the SQLAlchemy session and only sent once the transaction commits.
+Every worker polls the backend before handling a request (at most every
+INVALIDATION_POLL_SECONDS) and hands each key to the handler registered for
+its topic, so a change made anywhere is evicted everywhere within that delay.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.common.metrics import register_metrics_provider
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+TOPIC_PRINCIPAL = "principal"
+TOPIC_COMPANY_ACCESS = "company_access"
+TOPIC_RBAC = "rbac"
+TOPIC_REVOCATION = "revocation"
+TOPIC_TENANT = "tenant"
+# Published by a backend that may have missed messages; every handler flushes.
+FLUSH_ALL = "*"
+
+_BUS_EXTENSION = "invalidation_bus"
+_HANDLERS_EXTENSION = "invalidation_handlers"
+_PENDING_KEY = "pending_invalidations"
+
+# Called with the key's remainder after "<topic>:", or None to drop everything.
+InvalidationHandler = Callable[[str | None], None]
+
+
+def topic_key(topic: str, *parts: str) -> str:
+    return ":".join([topic, *(str(part) for part in parts)])
+
+
+class InvalidationBackend(ABC):
+    """Transport for published keys; ``poll`` returns keys not yet seen by this worker."""
+
+    name = "none"
+
+    @abstractmethod
+    def publish(self, keys: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    def poll(self) -> list[str]:
+        ...
+
+
+class NullInvalidationBackend(InvalidationBackend):
+    """Single-process deployments: local eviction is all there is."""
+
+    def publish(self, keys: list[str]) -> None:
+        return None
+
+    def poll(self) -> list[str]:
+        return []
+
+
+class SQLiteInvalidationBackend(InvalidationBackend):
+    """Host-wide sequence table in a SQLite file; workers tail it by row id."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, retention_seconds: float = 3600.0) -> None:
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS invalidation_events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        row = connection.execute("SELECT MAX(id) FROM invalidation_events").fetchone()
+        self._last_id = row[0] or 0
+
+    def publish(self, keys: list[str]) -> None:
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT INTO invalidation_events (key, created_at) VALUES (?, ?)",
+                [(key, now) for key in keys],
+            )
+            connection.execute(
+                "DELETE FROM invalidation_events WHERE created_at < ?",
+                (now - self.retention_seconds,),
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def poll(self) -> list[str]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, key FROM invalidation_events WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+            if rows:
+                self._last_id = rows[-1][0]
+        return [key for _, key in rows]
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+
+class PostgresInvalidationBackend(InvalidationBackend):
+    """LISTEN/NOTIFY on the application database, for multi-host clusters."""
+
+    name = "postgres"
+
+    def __init__(self, engine, channel: str = "gestium_invalidation") -> None:
+        if engine.dialect.name != "postgresql":
+            raise ValueError("INVALIDATION_BUS_BACKEND=postgres requires a PostgreSQL database")
+        self.engine = engine
+        self.channel = channel
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def publish(self, keys: list[str]) -> None:
+        with self.engine.begin() as connection:
+            for key in keys:
+                connection.execute(text("SELECT pg_notify(:channel, :key)"), {"channel": self.channel, "key": key})
+
+    def poll(self) -> list[str]:
+        with self._lock:
+            if self._listener is None:
+                self._listener = self._listen()
+                # Anything published before LISTEN took effect is lost.
+                return [FLUSH_ALL]
+            connection = self._listener.driver_connection
+            try:
+                connection.poll()
+            except Exception:
+                logger.warning("invalidation listener lost; reconnecting", exc_info=True)
+                self._listener.invalidate()
+                self._listener = None
+                return [FLUSH_ALL]
+            keys = [notify.payload for notify in connection.notifies]
+            connection.notifies.clear()
+            return keys
+
+    def _listen(self):
+        listener = self.engine.raw_connection()
+        listener.driver_connection.autocommit = True
+        with listener.driver_connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return listener
+
+
+class InvalidationBus:
+    """Per-worker publisher and poller dispatching keys to topic handlers."""
+
+    def __init__(self, backend: InvalidationBackend, poll_seconds: float = 1.0) -> None:
+        self.backend = backend
+        self.poll_seconds = poll_seconds
+        self._polled_at: float | None = None
+        self.published = 0
+        self.received = 0
+        self.polls = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return not isinstance(self.backend, NullInvalidationBackend)
+
+    def publish(self, keys: list[str]) -> None:
+        try:
+            self.backend.publish(keys)
+            self.published += len(keys)
+        except Exception:
+            # Peers still converge when their cache TTLs lapse.
+            self.errors += 1
+            logger.warning("failed to publish invalidations", exc_info=True)
+
+    def poll(self, handlers: dict[str, InvalidationHandler], force: bool = False) -> int:
+        """Apply keys published since the last poll; returns how many were received."""
+        now = time.monotonic()
+        if not force and self._polled_at is not None and now - self._polled_at < self.poll_seconds:
+            return 0
+        self._polled_at = now
+        try:
+            keys = self.backend.poll()
+        except Exception:
+            self.errors += 1
+            logger.warning("failed to poll invalidations", exc_info=True)
+            return 0
+        self.polls += 1
+        self.received += len(keys)
+        for key in keys:
+            _dispatch(handlers, key)
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "published": self.published,
+            "received": self.received,
+            "polls": self.polls,
+            "errors": self.errors,
+        }
+
+
+def _dispatch(handlers: dict[str, InvalidationHandler], key: str) -> None:
+    if key == FLUSH_ALL:
+        for handler in handlers.values():
+            handler(None)
+        return
+    topic, _, rest = key.partition(":")
+    handler = handlers.get(topic)
+    if handler is not None:
+        handler(rest or None)
+
+
+def _create_backend(app: Flask) -> InvalidationBackend:
+    backend = app.config.get("INVALIDATION_BUS_BACKEND", "none")
+    if backend == "sqlite":
+        return SQLiteInvalidationBackend(
+            app.config["INVALIDATION_BUS_SQLITE_PATH"],
+            retention_seconds=app.config.get("INVALIDATION_BUS_RETENTION_SECONDS", 3600.0),
+        )
+    if backend == "postgres":
+        with app.app_context():
+            engine = db.engine
+        return PostgresInvalidationBackend(engine, app.config.get("INVALIDATION_BUS_CHANNEL", "gestium_invalidation"))
+    return NullInvalidationBackend()
+
+
+def init_invalidation_bus(app: Flask) -> None:
+    """Create the worker's bus and poll it before every request."""
+    bus = InvalidationBus(_create_backend(app), poll_seconds=app.config.get("INVALIDATION_POLL_SECONDS", 1.0))
+    app.extensions[_BUS_EXTENSION] = bus
+    register_metrics_provider(app, "invalidation_bus", bus.stats)
+    if not bus.enabled:
+        return
+
+    @app.before_request
+    def _poll_invalidations() -> None:
+        bus.poll(app.extensions.get(_HANDLERS_EXTENSION, {}))
+
+
+def get_invalidation_bus() -> InvalidationBus:
+    """Return the invalidation bus for the current app."""
+    bus = current_app.extensions.get(_BUS_EXTENSION)
+    if bus is None:
+        init_invalidation_bus(current_app)
+        bus = current_app.extensions[_BUS_EXTENSION]
+    return bus
+
+
+def register_invalidation_handler(app: Flask, topic: str, handler: InvalidationHandler) -> None:
+    """Evict this worker's entries for keys published under topic."""
+    app.extensions.setdefault(_HANDLERS_EXTENSION, {})[topic] = handler
+
+
+def poll_invalidations(force: bool = False) -> int:
+    """Apply pending invalidations for the current app now."""
+    handlers = current_app.extensions.get(_HANDLERS_EXTENSION, {})
+    return get_invalidation_bus().poll(handlers, force=force)
+
+
+def publish_invalidation(key: str) -> None:
+    """Queue key for other workers; it is sent when the current transaction commits."""
+    if not has_app_context() or not get_invalidation_bus().enabled:
+        return
+    db.session.info.setdefault(_PENDING_KEY, []).append(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys and has_app_context():
+        get_invalidation_bus().publish(list(dict.fromkeys(keys)))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -6,13 +6,93 @@ import base64
 import hashlib
 import hmac
 import json
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 
-from flask import current_app
+from flask import Flask, current_app
 from werkzeug.exceptions import Unauthorized
 
-
-def _base64url_encode(data: bytes) -> str:
+from app.common.cache import TTLCache
+from app.common.metrics import register_metrics_provider
+
+_TOKEN_CACHE_EXTENSION = "jwt_token_cache"
+_KEY_RING_EXTENSION = "jwt_key_ring"
+
+
+class KeyRing:
+    """HMAC-SHA256 signing keys selected by the ``kid`` header.
+
+    Each key's HMAC state is keyed once and cloned per signature, so signing
+    does not re-run the inner/outer key padding on every call.
+    """
+
+    def __init__(self, keys: dict[str, str], active_kid: str | None = None) -> None:
+        if not keys:
+            raise ValueError("KeyRing requires at least one key.")
+        self._states = {
+            kid: hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+            for kid, secret in keys.items()
+        }
+        self.active_kid = active_kid or next(iter(keys))
+        if self.active_kid not in self._states:
+            raise ValueError(f"Unknown active kid: {self.active_kid}")
+
+    @classmethod
+    def from_config(cls, config) -> "KeyRing":
+        """Build the ring from JWT_SIGNING_KEYS (``kid:secret,...``) or SECRET_KEY."""
+        keys: dict[str, str] = {}
+        for entry in (config.get("JWT_SIGNING_KEYS") or "").split(","):
+            kid, separator, secret = entry.strip().partition(":")
+            if separator and kid and secret:
+                keys[kid] = secret
+        if not keys:
+            keys = {"default": config["SECRET_KEY"]}
+        return cls(keys, config.get("JWT_ACTIVE_KID") or None)
+
+    @property
+    def kids(self) -> list[str]:
+        return list(self._states)
+
+    def sign(self, message: bytes, kid: str | None = None) -> str:
+        state = self._states[kid or self.active_kid].copy()
+        state.update(message)
+        return base64url_encode(state.digest())
+
+    def verify(self, message: bytes, signature: str, kid: str | None = None) -> bool:
+        resolved_kid = kid or self.active_kid
+        if not isinstance(resolved_kid, str) or resolved_kid not in self._states:
+            return False
+        return hmac.compare_digest(signature, self.sign(message, resolved_kid))
+
+
+def init_jwt(app: Flask) -> None:
+    """Build the signing key ring and the per-worker cache of verified tokens."""
+    app.extensions[_KEY_RING_EXTENSION] = KeyRing.from_config(app.config)
+    token_cache = TTLCache(app.config.get("JWT_CACHE_SIZE", 0))
+    app.extensions[_TOKEN_CACHE_EXTENSION] = token_cache
+    register_metrics_provider(app, "jwt_token_cache", token_cache.stats)
+
+
+def get_key_ring() -> KeyRing:
+    """Return the signing key ring for the current app."""
+    key_ring = current_app.extensions.get(_KEY_RING_EXTENSION)
+    if key_ring is None:
+        init_jwt(current_app)
+        key_ring = current_app.extensions[_KEY_RING_EXTENSION]
+    return key_ring
+
+
+def get_token_cache() -> TTLCache:
+    """Return the verified-token cache for the current app."""
+    cache = current_app.extensions.get(_TOKEN_CACHE_EXTENSION)
+    if cache is None:
+        init_jwt(current_app)
+        cache = current_app.extensions[_TOKEN_CACHE_EXTENSION]
+    return cache
+
+
+def base64url_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
 
 
@@ -21,38 +101,65 @@ def _base64url_decode(segment: str) -> bytes:
     return base64.urlsafe_b64decode(segment + padding)
 
 
-def _sign(message: bytes, secret: str) -> str:
-    signature = hmac.new(secret.encode("utf-8"), message, hashlib.sha256).digest()
-    return _base64url_encode(signature)
+def access_token_lifetime() -> timedelta:
+    """Lifetime of issued access tokens (JWT_ACCESS_TOKEN_MINUTES)."""
+    return timedelta(minutes=current_app.config.get("JWT_ACCESS_TOKEN_MINUTES", 60))
 
 
-def create_access_token(user_id: str, client_id: str, expires_minutes: int = 60) -> str:
-    """Create a signed access token."""
+def create_access_token(
+    user_id: str,
+    client_id: str,
+    expires_minutes: int | None = None,
+    extra_claims: dict | None = None,
+) -> str:
+    """Create a signed access token with the active key."""
+    key_ring = get_key_ring()
     now = datetime.now(timezone.utc)
-    payload = {
-        "sub": str(user_id),
-        "client_id": str(client_id),
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(minutes=expires_minutes)).timestamp()),
-    }
-    header = {"alg": "HS256", "typ": "JWT"}
-    encoded_header = _base64url_encode(json.dumps(header, separators=(",", ":")).encode("utf-8"))
-    encoded_payload = _base64url_encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    lifetime = access_token_lifetime() if expires_minutes is None else timedelta(minutes=expires_minutes)
+    payload = dict(extra_claims or {})
+    payload.update(
+        {
+            "sub": str(user_id),
+            "client_id": str(client_id),
+            "jti": uuid.uuid4().hex,
+            "iat": int(now.timestamp()),
+            "exp": int((now + lifetime).timestamp()),
+        }
+    )
+    header = {"alg": "HS256", "typ": "JWT", "kid": key_ring.active_kid}
+    encoded_header = base64url_encode(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+    encoded_payload = base64url_encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
     signing_input = f"{encoded_header}.{encoded_payload}".encode("utf-8")
-    signature = _sign(signing_input, current_app.config["SECRET_KEY"])
+    signature = key_ring.sign(signing_input)
     return f"{encoded_header}.{encoded_payload}.{signature}"
 
 
 def decode_token(token: str) -> dict:
-    """Decode and validate a JWT token."""
+    """Decode and validate a JWT token.
+
+    Verified payloads are cached by signature until their ``exp`` so repeated
+    requests with the same bearer token skip the HMAC and JSON work. Tokens
+    without a ``kid`` header are checked against the active key.
+    """
     try:
         encoded_header, encoded_payload, signature = token.split(".")
     except ValueError as exc:
         raise Unauthorized("invalid_token") from exc
 
-    signing_input = f"{encoded_header}.{encoded_payload}".encode("utf-8")
-    expected_signature = _sign(signing_input, current_app.config["SECRET_KEY"])
-    if not hmac.compare_digest(signature, expected_signature):
+    unsigned_token = f"{encoded_header}.{encoded_payload}"
+    cache = get_token_cache()
+    cached = cache.get(signature)
+    if cached is not None and cached[0] == unsigned_token:
+        return dict(cached[1])
+
+    try:
+        header = json.loads(_base64url_decode(encoded_header))
+    except (ValueError, json.JSONDecodeError) as exc:
+        raise Unauthorized("invalid_token") from exc
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise Unauthorized("invalid_token")
+
+    if not get_key_ring().verify(unsigned_token.encode("utf-8"), signature, header.get("kid")):
         raise Unauthorized("invalid_token")
 
     try:
@@ -63,8 +170,8 @@ def decode_token(token: str) -> dict:
     exp = payload.get("exp")
     if exp is None:
         raise Unauthorized("invalid_token")
-    now = datetime.now(timezone.utc).timestamp()
-    if now > float(exp):
+    if time.time() > float(exp):
         raise Unauthorized("token_expired")
 
-    return payload
+    cache.set(signature, (unsigned_token, payload), expires_at=float(exp))
+    return dict(payload)
@@ -0,0 +1,163 @@
+"""Host-wide rate limit storage in a SQLite file.
+
+Flask-Limiter's default ``memory://`` storage is per process, so every
+gunicorn worker enforces its own counters. ``RATELIMIT_STORAGE_URI`` may point
+at any ``limits`` backend (``redis://``, ``memcached://``); single-host
+deployments without one can use ``gestium+sqlite:////abs/path.sqlite3``
+(SQLAlchemy-style slashes) to share counters between the workers on the
+machine. Importing this module registers
+the scheme.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from math import floor
+import sqlite3
+import threading
+import time
+from typing import Iterator
+
+from limits.errors import ConfigurationError
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+SQLITE_SCHEME = "gestium+sqlite"
+
+
+class SQLiteLimiterStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Counters in a WAL-mode SQLite table; supports fixed and sliding-window-counter strategies."""
+
+    STORAGE_SCHEME = [SQLITE_SCHEME]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        purge_seconds: float = 60.0,
+        **options: float | str | bool,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = uri.split("://", 1)[1][1:]
+        if not self.path:
+            raise ConfigurationError(f"{SQLITE_SCHEME} storage needs a file path: {SQLITE_SCHEME}:////tmp/limits.db")
+        self.purge_seconds = purge_seconds
+        self._purged_at = 0.0
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+            "key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        now = time.time()
+        with self._transaction() as connection:
+            return self._incr(connection, key, expiry, amount, now)
+
+    def get(self, key: str) -> int:
+        row = self._connection().execute(
+            "SELECT value FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        row = self._connection().execute(
+            "SELECT expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else time.time()
+
+    def clear(self, key: str) -> None:
+        self._connection().execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+
+    def check(self) -> bool:
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def reset(self) -> int | None:
+        return self._connection().execute("DELETE FROM rate_limit_counters").rowcount
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        # Read and increment under one write lock: no other worker can slip in between.
+        with self._transaction() as connection:
+            previous_count, previous_ttl, current_count, _ = self._window(
+                connection, previous_key, current_key, expiry, now
+            )
+            if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                return False
+            self._incr(connection, current_key, 2 * expiry, amount, now)
+        return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._window(self._connection(), previous_key, current_key, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self._connection().execute(
+            "DELETE FROM rate_limit_counters WHERE key IN (?, ?)", (previous_key, current_key)
+        )
+
+    def _window(
+        self, connection: sqlite3.Connection, previous_key: str, current_key: str, expiry: int, now: float
+    ) -> tuple[int, float, int, float]:
+        counts = dict(
+            connection.execute(
+                "SELECT key, value FROM rate_limit_counters WHERE key IN (?, ?) AND expires_at > ?",
+                (previous_key, current_key, now),
+            ).fetchall()
+        )
+        previous_count = counts.get(previous_key, 0)
+        current_count = counts.get(current_key, 0)
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def _incr(self, connection: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        connection.execute(
+            "INSERT INTO rate_limit_counters (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "value = CASE WHEN expires_at <= ? THEN excluded.value ELSE value + excluded.value END, "
+            "expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END",
+            (key, amount, now + expiry, now, now),
+        )
+        row = connection.execute("SELECT value FROM rate_limit_counters WHERE key = ?", (key,)).fetchone()
+        if now - self._purged_at >= self.purge_seconds:
+            self._purged_at = now
+            connection.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+        return row[0]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Counters may lose the last writes on power loss; never their consistency.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
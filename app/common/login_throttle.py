@@ -0,0 +1,233 @@
+"""Failed-login counters with exponential backoff, checked before password hashing."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import math
+import sqlite3
+import threading
+import time
+
+from flask import Flask, current_app
+from werkzeug.exceptions import TooManyRequests
+
+from app.common.metrics import register_metrics_provider
+
+_LOGIN_THROTTLE_EXTENSION = "login_throttle"
+
+
+class ThrottleStore(ABC):
+    """Storage interface for failure counters: key -> (failures, last_failure_at)."""
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[int, float] | None:
+        ...
+
+    @abstractmethod
+    def record_failure(self, key: str, now: float, window: float) -> tuple[int, float]:
+        """Increment the counter (restarting it if the window lapsed) and return it.
+
+        Counters idle for longer than window are dropped now and then, so
+        failures for made-up accounts do not pile up.
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        ...
+
+
+class InMemoryThrottleStore(ThrottleStore):
+    """Per-worker store; each gunicorn worker keeps its own counters."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._purged_at = 0.0
+
+    def get(self, key: str) -> tuple[int, float] | None:
+        return self._entries.get(key)
+
+    def record_failure(self, key: str, now: float, window: float) -> tuple[int, float]:
+        with self._lock:
+            failures, last_failure_at = self._entries.get(key, (0, now))
+            if now - last_failure_at > window:
+                failures = 0
+            entry = (failures + 1, now)
+            self._entries[key] = entry
+            if now - self._purged_at >= window:
+                self._purged_at = now
+                self._entries = {
+                    other: value for other, value in self._entries.items() if now - value[1] <= window
+                }
+            return entry
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteThrottleStore(ThrottleStore):
+    """Host-wide store in a SQLite file, shared by every worker on the machine."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._purged_at = 0.0
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS login_failures ("
+                "key TEXT PRIMARY KEY, failures INTEGER NOT NULL, last_failure_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_login_failures_last_failure_at ON login_failures (last_failure_at)"
+            )
+
+    def get(self, key: str) -> tuple[int, float] | None:
+        row = self._connection().execute(
+            "SELECT failures, last_failure_at FROM login_failures WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record_failure(self, key: str, now: float, window: float) -> tuple[int, float]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT INTO login_failures (key, failures, last_failure_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "failures = CASE WHEN ? - last_failure_at > ? THEN 1 ELSE failures + 1 END, "
+                "last_failure_at = excluded.last_failure_at",
+                (key, now, now, window),
+            )
+            row = connection.execute(
+                "SELECT failures, last_failure_at FROM login_failures WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if now - self._purged_at >= window:
+                self._purged_at = now
+                connection.execute("DELETE FROM login_failures WHERE last_failure_at < ?", (now - window,))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return row[0], row[1]
+
+    def reset(self, key: str) -> None:
+        self._connection().execute("DELETE FROM login_failures WHERE key = ?", (key,))
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+
+class LoginThrottle:
+    """Per-account failure counters with exponential backoff, tightened per tenant.
+
+    After ``account_threshold`` failures inside ``window`` seconds, each
+    further attempt on the account is refused until ``base_delay * 2 **
+    (failures - threshold)`` seconds (capped at ``max_delay``) have passed
+    since the last failure. Once the tenant as a whole has seen
+    ``tenant_threshold`` failures, its accounts back off from their first
+    failure; accounts without recent failures are never refused, so a spray
+    against the tenant cannot lock its users out.
+    """
+
+    def __init__(
+        self,
+        store: ThrottleStore,
+        account_threshold: int = 5,
+        tenant_threshold: int = 100,
+        base_delay: float = 1.0,
+        max_delay: float = 900.0,
+        window: float = 900.0,
+    ) -> None:
+        self.store = store
+        self.account_threshold = account_threshold
+        self.tenant_threshold = tenant_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, config) -> "LoginThrottle":
+        if config.get("LOGIN_THROTTLE_STORE", "memory") == "sqlite":
+            store: ThrottleStore = SQLiteThrottleStore(config["LOGIN_THROTTLE_SQLITE_PATH"])
+        else:
+            store = InMemoryThrottleStore()
+        return cls(
+            store,
+            account_threshold=config.get("LOGIN_THROTTLE_ACCOUNT_THRESHOLD", 5),
+            tenant_threshold=config.get("LOGIN_THROTTLE_TENANT_THRESHOLD", 100),
+            base_delay=config.get("LOGIN_THROTTLE_BASE_DELAY_SECONDS", 1.0),
+            max_delay=config.get("LOGIN_THROTTLE_MAX_DELAY_SECONDS", 900.0),
+            window=config.get("LOGIN_THROTTLE_WINDOW_SECONDS", 900.0),
+        )
+
+    @staticmethod
+    def account_key(email: str) -> str:
+        # One bucket per normalized email, however the tenant was given.
+        return f"account:{email}"
+
+    @staticmethod
+    def tenant_key(client_id: str) -> str:
+        return f"tenant:{client_id}"
+
+    def check(self, email: str, client_id: str | None) -> None:
+        """Raise 429 if the account is backing off; no hashing happens first."""
+        now = time.time()
+        threshold = self.account_threshold
+        if client_id and self._under_attack(self.tenant_key(client_id), now):
+            threshold = 1
+        retry_after = self._retry_after(self.account_key(email), threshold, now)
+        if retry_after > 0:
+            self.rejected += 1
+            raise TooManyRequests("login_throttled", retry_after=math.ceil(retry_after))
+
+    def record_failure(self, email: str, client_id: str | None) -> None:
+        """Count a failure for the account and, once it is known, the tenant."""
+        now = time.time()
+        self.store.record_failure(self.account_key(email), now, self.window)
+        if client_id:
+            self.store.record_failure(self.tenant_key(client_id), now, self.window)
+
+    def record_success(self, email: str) -> None:
+        self.store.reset(self.account_key(email))
+
+    def stats(self) -> dict[str, int]:
+        return {"rejected": self.rejected}
+
+    def _under_attack(self, tenant_key: str, now: float) -> bool:
+        entry = self.store.get(tenant_key)
+        return entry is not None and entry[0] >= self.tenant_threshold and now - entry[1] <= self.window
+
+    def _retry_after(self, key: str, threshold: int, now: float) -> float:
+        entry = self.store.get(key)
+        if entry is None:
+            return 0.0
+        failures, last_failure_at = entry
+        if failures < threshold or now - last_failure_at > self.window:
+            return 0.0
+        delay = min(self.max_delay, self.base_delay * 2 ** (failures - threshold))
+        return max(0.0, last_failure_at + delay - now)
+
+
+def init_login_throttle(app: Flask) -> None:
+    """Create the login throttle configured for this app."""
+    throttle = LoginThrottle.from_config(app.config)
+    app.extensions[_LOGIN_THROTTLE_EXTENSION] = throttle
+    register_metrics_provider(app, "login_throttle", throttle.stats)
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Return the login throttle for the current app."""
+    throttle = current_app.extensions.get(_LOGIN_THROTTLE_EXTENSION)
+    if throttle is None:
+        init_login_throttle(current_app)
+        throttle = current_app.extensions[_LOGIN_THROTTLE_EXTENSION]
+    return throttle
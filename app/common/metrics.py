@@ -0,0 +1,22 @@
+"""Registry of per-worker metrics providers."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from flask import Flask, current_app
+
+_METRICS_EXTENSION = "metrics_providers"
+
+MetricsProvider = Callable[[], dict[str, Any]]
+
+
+def register_metrics_provider(app: Flask, name: str, provider: MetricsProvider) -> None:
+    """Register a callable whose snapshot is reported under name."""
+    app.extensions.setdefault(_METRICS_EXTENSION, {})[name] = provider
+
+
+def collect_metrics() -> dict[str, dict[str, Any]]:
+    """Return a snapshot from every registered provider for the current app."""
+    providers: dict[str, MetricsProvider] = current_app.extensions.get(_METRICS_EXTENSION, {})
+    return {name: provider() for name, provider in sorted(providers.items())}
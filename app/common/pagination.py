@@ -0,0 +1,99 @@
+"""Keyset pagination over (sort key, id) with opaque cursors.
+
+A page is fetched with ``WHERE (sort, id) > (:after_sort, :after_id) ORDER BY
+sort, id LIMIT :limit + 1``, so every page is an index range scan no matter
+how deep the client has paged; the extra row only signals that another page
+exists. Cursors are URL-safe base64 JSON of the last row's key values.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+import json
+from typing import Any, Callable, Generic, Mapping, Sequence, TypeVar
+
+from flask import current_app
+from sqlalchemy import tuple_
+from werkzeug.exceptions import BadRequest
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Rows to return and the key of the last row already seen."""
+
+    limit: int
+    after: tuple[str, ...] | None = None
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int = 2) -> tuple[str, ...]:
+    """Return the key values in cursor; raises BadRequest if it was not issued by us."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise BadRequest("invalid_cursor") from None
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(value, str) for value in values):
+        raise BadRequest("invalid_cursor")
+    return tuple(values)
+
+
+def page_request_from_args(args: Mapping[str, str]) -> PageRequest | None:
+    """Build a PageRequest from ``limit`` and ``cursor`` query parameters.
+
+    Returns None when neither is given: callers that predate pagination keep
+    receiving the whole list.
+    """
+    raw_limit = args.get("limit")
+    cursor = args.get("cursor")
+    if raw_limit is None and cursor is None:
+        return None
+    default_limit = current_app.config.get("PAGINATION_DEFAULT_LIMIT", 50)
+    max_limit = current_app.config.get("PAGINATION_MAX_LIMIT", 500)
+    if raw_limit in (None, ""):
+        limit = default_limit
+    else:
+        try:
+            limit = int(raw_limit)
+        except ValueError:
+            raise BadRequest("invalid_limit") from None
+        if limit < 1:
+            raise BadRequest("invalid_limit")
+    return PageRequest(limit=min(limit, max_limit), after=decode_cursor(cursor) if cursor else None)
+
+
+def apply_keyset(query, columns: Sequence, after: Sequence[str] | None = None, limit: int | None = None):
+    """Order query by columns and start after the given key.
+
+    The last column must be unique (the primary key) so ties on the sort key
+    are neither skipped nor repeated. With a limit, one extra row is fetched
+    for ``build_page``.
+    """
+    if after is not None:
+        query = query.filter(tuple_(*columns) > tuple_(*after))
+    query = query.order_by(*(column.asc() for column in columns))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def build_page(rows: list[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Page[T]:
+    """Trim rows fetched by ``apply_keyset`` to a page with the cursor for the next one."""
+    if len(rows) <= limit:
+        return Page(items=rows)
+    items = rows[:limit]
+    return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
@@ -0,0 +1,176 @@
+"""Optional PostgreSQL LIST partitioning of tenant data by client_id.
+
+Partitioned tables keep every tenant in a DEFAULT partition until
+``move_tenant_to_partition`` gives a large tenant its own. Repository queries
+always filter on client_id, so the planner prunes to a single partition.
+Other dialects keep plain tables and every helper here is a no-op.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+PARTITIONED_TABLES = ("employees", "cases", "documents")
+PARTITION_KEY = "client_id"
+
+
+def supports_partitioning(connection: Connection) -> bool:
+    return connection.dialect.name == "postgresql"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def tenant_partition_name(table: str, client_id: str) -> str:
+    return f"{table}_p_{uuid.UUID(str(client_id)).hex}"
+
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    if not supports_partitioning(connection):
+        return False
+    row = connection.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND c.relnamespace = current_schema()::regnamespace"
+        ),
+        {"table": table},
+    ).first()
+    return row is not None
+
+
+def list_partitions(connection: Connection, table: str) -> list[tuple[str, str]]:
+    """Return (partition name, bound expression) for each partition of table."""
+    if not is_partitioned(connection, table):
+        return []
+    rows = connection.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "WHERE parent.relname = :table AND parent.relnamespace = current_schema()::regnamespace "
+            "ORDER BY child.relname"
+        ),
+        {"table": table},
+    )
+    return [(name, bound) for name, bound in rows]
+
+
+def partition_table(connection: Connection, table: str) -> bool:
+    """Rebuild table as LIST-partitioned on client_id with a DEFAULT partition.
+
+    The primary key becomes (client_id, id) and unique indexes gain a leading
+    client_id, as PostgreSQL requires the partition key in every unique
+    constraint. Returns False when there is nothing to do.
+    """
+    if not supports_partitioning(connection) or is_partitioned(connection, table):
+        return False
+    inspector = inspect(connection)
+    if not inspector.has_table(table):
+        return False
+    indexes = inspector.get_indexes(table)
+    foreign_keys = inspector.get_foreign_keys(table)
+    primary_key = inspector.get_pk_constraint(table)["constrained_columns"]
+
+    staging = f"{table}_unpartitioned"
+    connection.execute(text(f'ALTER TABLE "{table}" RENAME TO "{staging}"'))
+    connection.execute(
+        text(
+            f'CREATE TABLE "{table}" (LIKE "{staging}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY LIST ("{PARTITION_KEY}")'
+        )
+    )
+    connection.execute(
+        text(f'CREATE TABLE "{default_partition_name(table)}" PARTITION OF "{table}" DEFAULT')
+    )
+    connection.execute(text(f'INSERT INTO "{table}" SELECT * FROM "{staging}"'))
+    # Dropping the old table frees its index and constraint names for reuse.
+    connection.execute(text(f'DROP TABLE "{staging}"'))
+
+    key_columns = [PARTITION_KEY] + [column for column in primary_key if column != PARTITION_KEY]
+    connection.execute(text(f'ALTER TABLE "{table}" ADD PRIMARY KEY ({_columns(key_columns)})'))
+    for index in indexes:
+        columns = list(index["column_names"])
+        if index["unique"] and PARTITION_KEY not in columns:
+            columns.insert(0, PARTITION_KEY)
+        unique = "UNIQUE " if index["unique"] else ""
+        connection.execute(text(f'CREATE {unique}INDEX "{index["name"]}" ON "{table}" ({_columns(columns)})'))
+    _create_foreign_keys(connection, table, foreign_keys)
+    return True
+
+
+def unpartition_table(connection: Connection, table: str) -> bool:
+    """Fold a partitioned table (and all of its partitions) back into a plain table."""
+    if not is_partitioned(connection, table):
+        return False
+    inspector = inspect(connection)
+    indexes = inspector.get_indexes(table)
+    foreign_keys = inspector.get_foreign_keys(table)
+
+    staging = f"{table}_partitioned"
+    connection.execute(text(f'ALTER TABLE "{table}" RENAME TO "{staging}"'))
+    connection.execute(
+        text(f'CREATE TABLE "{table}" (LIKE "{staging}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    )
+    connection.execute(text(f'INSERT INTO "{table}" SELECT * FROM "{staging}"'))
+    connection.execute(text(f'DROP TABLE "{staging}" CASCADE'))
+
+    connection.execute(text(f'ALTER TABLE "{table}" ADD PRIMARY KEY (id)'))
+    for index in indexes:
+        unique = "UNIQUE " if index["unique"] else ""
+        connection.execute(
+            text(f'CREATE {unique}INDEX "{index["name"]}" ON "{table}" ({_columns(index["column_names"])})')
+        )
+    _create_foreign_keys(connection, table, foreign_keys)
+    return True
+
+
+def move_tenant_to_partition(connection: Connection, table: str, client_id: str) -> int | None:
+    """Give client_id its own partition of table; returns rows moved, or None if skipped.
+
+    Writes to the table are blocked while the tenant's rows move out of the
+    DEFAULT partition; run it inside a single transaction.
+    """
+    if not is_partitioned(connection, table):
+        return None
+    partition = tenant_partition_name(table, client_id)
+    if any(name == partition for name, _ in list_partitions(connection, table)):
+        return None
+    # Validated as a UUID, so it is safe to inline in the partition bound.
+    literal = str(uuid.UUID(str(client_id)))
+    default = default_partition_name(table)
+
+    connection.execute(text(f'LOCK TABLE "{table}" IN SHARE ROW EXCLUSIVE MODE'))
+    connection.execute(
+        text(f'CREATE TABLE "{partition}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    )
+    moved = connection.execute(
+        text(
+            f'WITH moved AS (DELETE FROM "{default}" WHERE "{PARTITION_KEY}" = :client_id RETURNING *) '
+            f'INSERT INTO "{partition}" SELECT * FROM moved'
+        ),
+        {"client_id": literal},
+    ).rowcount
+    connection.execute(
+        text(f"ALTER TABLE \"{table}\" ATTACH PARTITION \"{partition}\" FOR VALUES IN ('{literal}')")
+    )
+    return moved
+
+
+def _columns(columns) -> str:
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+def _create_foreign_keys(connection: Connection, table: str, foreign_keys: list[dict]) -> None:
+    for foreign_key in foreign_keys:
+        name = f'CONSTRAINT "{foreign_key["name"]}" ' if foreign_key.get("name") else ""
+        connection.execute(
+            text(
+                f'ALTER TABLE "{table}" ADD {name}FOREIGN KEY ({_columns(foreign_key["constrained_columns"])}) '
+                f'REFERENCES "{foreign_key["referred_table"]}" ({_columns(foreign_key["referred_columns"])})'
+            )
+        )
@@ -0,0 +1,198 @@
+"""Password hashing and verification behind a bounded process pool."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable
+
+from flask import Flask, current_app, has_app_context
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.common.metrics import register_metrics_provider
+
+_PASSWORD_HASHER_EXTENSION = "password_hasher"
+
+
+class PasswordHasher:
+    """Run key stretching off the request thread with a bounded backlog.
+
+    ``pool_size`` 0 hashes inline but still enforces the backlog bound, so a
+    login storm fails fast with 503 instead of piling up blocked threads.
+    """
+
+    def __init__(
+        self,
+        method: str = "scrypt",
+        salt_length: int = 16,
+        pool_size: int = 0,
+        queue_size: int = 16,
+        retry_after: int = 1,
+        timeout: float | None = 30.0,
+        start_method: str = "spawn",
+    ) -> None:
+        self.method = method
+        self.salt_length = salt_length
+        self._method_prefix: str | None = None
+        self.pool_size = max(0, int(pool_size))
+        self.queue_size = max(1, int(queue_size))
+        self.retry_after = retry_after
+        self.timeout = timeout
+        self.start_method = start_method
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.pool_restarts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config) -> "PasswordHasher":
+        return cls(
+            method=config.get("PASSWORD_HASH_METHOD", "scrypt"),
+            salt_length=config.get("PASSWORD_HASH_SALT_LENGTH", 16),
+            pool_size=config.get("PASSWORD_HASH_POOL_SIZE", 0),
+            queue_size=config.get("PASSWORD_HASH_QUEUE_SIZE", 16),
+            retry_after=config.get("PASSWORD_HASH_RETRY_AFTER", 1),
+            timeout=config.get("PASSWORD_HASH_TIMEOUT_SECONDS", 30.0),
+            start_method=config.get("PASSWORD_HASH_POOL_START_METHOD", "spawn"),
+        )
+
+    def hash(self, password: str, method: str | None = None) -> str:
+        return self._run(
+            generate_password_hash,
+            password,
+            method or self.method,
+            self.salt_length,
+        )
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """Return True if pwhash was not produced with the configured method and cost."""
+        if self._method_prefix is None:
+            # Let werkzeug expand defaults (e.g. "pbkdf2" -> "pbkdf2:sha256:<iterations>").
+            probe = generate_password_hash("probe", self.method, self.salt_length)
+            self._method_prefix = probe.split("$", 1)[0]
+        return pwhash.split("$", 1)[0] != self._method_prefix
+
+    def stats(self) -> dict[str, Any]:
+        average = self.total_seconds / self.completed if self.completed else 0.0
+        return {
+            "method": self.method,
+            "pool_size": self.pool_size,
+            "queue_size": self.queue_size,
+            "queue_depth": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "pool_restarts": self.pool_restarts,
+            "avg_latency_ms": round(average * 1000, 3),
+            "max_latency_ms": round(self.max_seconds * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceUnavailable("password_hash_busy", retry_after=self.retry_after)
+
+        with self._lock:
+            self.pending += 1
+        started = time.perf_counter()
+        try:
+            if self.pool_size == 0:
+                return func(*args)
+            executor = self._get_executor()
+            try:
+                future = executor.submit(func, *args)
+                return future.result(timeout=self.timeout)
+            except TimeoutError:
+                # The hash may still finish in the pool; only this request gives up on it.
+                future.cancel()
+                with self._lock:
+                    self.timed_out += 1
+                raise ServiceUnavailable("password_hash_timeout", retry_after=self.retry_after) from None
+            except BrokenProcessPool:
+                # A pool process died (e.g. OOM-killed); later requests get a fresh pool.
+                self._discard_executor(executor)
+                raise ServiceUnavailable("password_hash_unavailable", retry_after=self.retry_after) from None
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+            self._slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created lazily so the pool is started inside the serving worker, after any fork.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            # Another request may already have replaced it.
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.pool_restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def init_password_hasher(app: Flask) -> None:
+    """Create the per-worker password hasher and expose its metrics."""
+    hasher = PasswordHasher.from_config(app.config)
+    app.extensions[_PASSWORD_HASHER_EXTENSION] = hasher
+    register_metrics_provider(app, "password_hashing", hasher.stats)
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the password hasher for the current app."""
+    hasher = current_app.extensions.get(_PASSWORD_HASHER_EXTENSION)
+    if hasher is None:
+        init_password_hasher(current_app)
+        hasher = current_app.extensions[_PASSWORD_HASHER_EXTENSION]
+    return hasher
+
+
+def hash_password(password: str) -> str:
+    """Hash a password, offloaded to the worker's hashing pool when configured."""
+    if not has_app_context():
+        return generate_password_hash(password)
+    return get_password_hasher().hash(password)
+
+
+def password_needs_rehash(pwhash: str) -> bool:
+    """Return True if pwhash should be upgraded (or downgraded) to the configured cost."""
+    if not has_app_context():
+        return False
+    return get_password_hasher().needs_rehash(pwhash)
+
+
+def verify_password(pwhash: str, password: str) -> bool:
+    """Verify a password hash, offloaded to the worker's hashing pool when configured."""
+    if not has_app_context():
+        return check_password_hash(pwhash, password)
+    return get_password_hasher().verify(pwhash, password)
@@ -0,0 +1,103 @@
+"""RBAC permission catalogue and compact permission bitmaps."""
+
+from __future__ import annotations
+
+import base64
+from typing import Iterable
+
+# Bit positions in access-token permission bitmaps follow this ordering, so
+# new permissions must only ever be appended.
+RBAC_PERMISSIONS: dict[str, str] = {
+    "tenant.profile.read": "Read tenant profile",
+    "tenant.profile.write": "Update tenant profile",
+    "tenant.users.invite": "Invite tenant users",
+    "tenant.users.manage": "Manage tenant users",
+    "company.read": "Read companies",
+    "company.write": "Manage companies",
+    "employee.read": "Read employees",
+    "employee.write": "Manage employees",
+    "case.read": "Read cases",
+    "case.write": "Manage cases",
+    "case.assign": "Assign cases",
+    "case.event.write": "Write case events",
+    "document.read": "Read documents",
+    "document.upload": "Upload documents",
+    "document.classify": "Classify documents",
+    "document.extraction.read": "Read document extractions",
+    "document.extraction.write": "Manage document extractions",
+    "audit.read": "Read audit logs",
+    "platform.clients.manage": "Manage platform clients",
+    "platform.metrics.read": "Read platform metrics",
+}
+
+RBAC_ROLE_PERMISSIONS: dict[str, list[str]] = {
+    "Super Admin": ["*"],
+    "Admin Cliente": [
+        "tenant.profile.read",
+        "tenant.profile.write",
+        "tenant.users.invite",
+        "tenant.users.manage",
+        "company.read",
+        "company.write",
+        "employee.read",
+        "employee.write",
+        "case.read",
+        "case.write",
+        "case.assign",
+        "case.event.write",
+        "document.read",
+        "document.upload",
+        "document.classify",
+        "document.extraction.read",
+        "document.extraction.write",
+        "audit.read",
+    ],
+    "Asesor": [
+        "company.read",
+        "employee.read",
+        "case.read",
+        "case.write",
+        "case.event.write",
+        "document.read",
+        "document.upload",
+        "document.classify",
+        "document.extraction.read",
+    ],
+    "Operativo": [
+        "company.read",
+        "employee.read",
+        "case.read",
+        "case.event.write",
+        "document.read",
+        "document.upload",
+    ],
+}
+
+
+PERMISSION_BITS: dict[str, int] = {code: index for index, code in enumerate(RBAC_PERMISSIONS)}
+
+
+def encode_permission_bitmap(codes: Iterable[str]) -> str:
+    """Encode permission codes as a base64url bitmap; unknown codes are skipped."""
+    bitmap = 0
+    for code in codes:
+        bit = PERMISSION_BITS.get(code)
+        if bit is not None:
+            bitmap |= 1 << bit
+    raw = bitmap.to_bytes((len(PERMISSION_BITS) + 7) // 8, "little")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def bitmap_has_permission(encoded_bitmap: str, code: str) -> bool | None:
+    """Return whether the bitmap grants code, or None if the bitmap cannot answer."""
+    bit = PERMISSION_BITS.get(code)
+    if bit is None or not isinstance(encoded_bitmap, str):
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(encoded_bitmap + "=" * (-len(encoded_bitmap) % 4))
+    except ValueError:
+        return None
+    byte_index = bit // 8
+    if byte_index >= len(raw):
+        return None
+    return bool(raw[byte_index] & (1 << (bit % 8)))
@@ -0,0 +1,80 @@
+"""Per-worker cache of authenticated principals."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from flask import Flask, current_app, has_app_context
+
+from app.common.cache import TTLCache
+from app.common.invalidation import (
+    TOPIC_PRINCIPAL,
+    publish_invalidation,
+    register_invalidation_handler,
+    topic_key,
+)
+from app.common.metrics import register_metrics_provider
+from app.repositories.user_repository import UserRepository
+
+_PRINCIPAL_CACHE_EXTENSION = "principal_cache"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Minimal identity of an authenticated user, safe to share across requests."""
+
+    id: str
+    client_id: str
+    status: str
+
+
+def init_principal_cache(app: Flask) -> None:
+    """Create the per-worker principal cache."""
+    principal_cache = TTLCache(
+        app.config.get("PRINCIPAL_CACHE_SIZE", 0),
+        default_ttl=app.config.get("PRINCIPAL_CACHE_TTL_SECONDS", 30),
+    )
+    app.extensions[_PRINCIPAL_CACHE_EXTENSION] = principal_cache
+    register_metrics_provider(app, "principal_cache", principal_cache.stats)
+
+    def _evict(key: str | None) -> None:
+        if key is None:
+            principal_cache.clear()
+            return
+        client_id, _, user_id = key.partition(":")
+        principal_cache.pop((user_id, client_id))
+
+    register_invalidation_handler(app, TOPIC_PRINCIPAL, _evict)
+
+
+def get_principal_cache() -> TTLCache:
+    """Return the principal cache for the current app."""
+    cache = current_app.extensions.get(_PRINCIPAL_CACHE_EXTENSION)
+    if cache is None:
+        init_principal_cache(current_app)
+        cache = current_app.extensions[_PRINCIPAL_CACHE_EXTENSION]
+    return cache
+
+
+def load_principal(user_id: str, client_id: str) -> Principal | None:
+    """Return the principal for (user_id, client_id), loading it on a cache miss."""
+    cache = get_principal_cache()
+    cache_key = (str(user_id), str(client_id))
+    principal = cache.get(cache_key)
+    if principal is not None:
+        return principal
+
+    user = UserRepository().get_by_id(str(user_id), str(client_id))
+    if user is None:
+        return None
+    principal = Principal(id=user.id, client_id=user.client_id, status=user.status)
+    cache.set(cache_key, principal)
+    return principal
+
+
+def invalidate_principal(user_id: str, client_id: str) -> None:
+    """Drop a cached principal after the user's status or credentials change."""
+    if not has_app_context():
+        return
+    get_principal_cache().pop((str(user_id), str(client_id)))
+    publish_invalidation(topic_key(TOPIC_PRINCIPAL, client_id, user_id))
@@ -0,0 +1,137 @@
+"""Opt-in per-layer timing and SQL counting for the decorator chain."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+import json
+import logging
+import time
+from typing import Any, Iterable, Iterator
+
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.profiling")
+
+PROFILE_EVENT = "request_profile"
+VIEW_LAYER = "view"
+_PROFILE_ATTR = "_request_profile"
+_NULL_LAYER = nullcontext()
+
+
+class RequestProfile:
+    """Wall time and statement counts for one request, split by layer."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.layers: dict[str, dict[str, float]] = {}
+
+    def record(self, name: str, seconds: float, queries: int) -> None:
+        layer = self.layers.setdefault(name, {"ms": 0.0, "queries": 0})
+        layer["ms"] += seconds * 1000
+        layer["queries"] += queries
+
+    def finish(self) -> dict[str, Any]:
+        total_ms = (time.perf_counter() - self.started) * 1000
+        layers = {name: dict(values) for name, values in self.layers.items()}
+        # Whatever the decorators did not account for is the view body (plus hooks).
+        layers[VIEW_LAYER] = {
+            "ms": max(0.0, total_ms - sum(values["ms"] for values in self.layers.values())),
+            "queries": self.queries - sum(int(values["queries"]) for values in self.layers.values()),
+        }
+        return {
+            "total_ms": round(total_ms, 3),
+            "queries": self.queries,
+            "layers": {
+                name: {"ms": round(values["ms"], 3), "queries": int(values["queries"])}
+                for name, values in layers.items()
+            },
+        }
+
+
+def register_request_profiling(app: Flask) -> None:
+    """Record per-layer timings when REQUEST_PROFILING_ENABLED is set."""
+    if not app.config.get("REQUEST_PROFILING_ENABLED", False):
+        return
+
+    # Listen on every Engine, so statements routed to tenant shard engines
+    # (app.common.sharding) are counted along with the default database's.
+    if not event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.listen(Engine, "before_cursor_execute", _count_statement)
+
+    @app.before_request
+    def _start_profile() -> None:
+        setattr(g, _PROFILE_ATTR, RequestProfile())
+
+    @app.after_request
+    def _emit_profile(response: Response) -> Response:
+        profile = g.pop(_PROFILE_ATTR, None)
+        if profile is not None:
+            fields = {
+                "event": PROFILE_EVENT,
+                "method": request.method,
+                "endpoint": request.url_rule.rule if request.url_rule else request.path,
+                "status": response.status_code,
+                **profile.finish(),
+            }
+            logger.info(PROFILE_EVENT, extra={"fields": fields})
+        return response
+
+
+def profile_layer(name: str):
+    """Time a decorator layer's own checks; a no-op unless profiling is on."""
+    if not has_request_context():
+        return _NULL_LAYER
+    profile = g.get(_PROFILE_ATTR)
+    if profile is None:
+        return _NULL_LAYER
+    return _measure(profile, name)
+
+
+@contextmanager
+def _measure(profile: RequestProfile, name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    queries = profile.queries
+    try:
+        yield
+    finally:
+        profile.record(name, time.perf_counter() - started, profile.queries - queries)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    if has_request_context():
+        profile = g.get(_PROFILE_ATTR)
+        if profile is not None:
+            profile.queries += 1
+
+
+def aggregate_profiles(lines: Iterable[str]) -> dict[tuple[str, str], dict[str, Any]]:
+    """Aggregate request_profile log lines into per-endpoint averages."""
+    totals: dict[tuple[str, str], dict[str, Any]] = {}
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(entry, dict) or entry.get("event") != PROFILE_EVENT:
+            continue
+        key = (entry.get("method", "?"), entry.get("endpoint", "?"))
+        bucket = totals.setdefault(key, {"count": 0, "total_ms": 0.0, "queries": 0, "layers": {}})
+        bucket["count"] += 1
+        bucket["total_ms"] += entry.get("total_ms", 0.0)
+        bucket["queries"] += entry.get("queries", 0)
+        for name, values in (entry.get("layers") or {}).items():
+            layer = bucket["layers"].setdefault(name, {"ms": 0.0, "queries": 0})
+            layer["ms"] += values.get("ms", 0.0)
+            layer["queries"] += values.get("queries", 0)
+
+    for bucket in totals.values():
+        count = bucket["count"]
+        bucket["total_ms"] /= count
+        bucket["queries"] /= count
+        for layer in bucket["layers"].values():
+            layer["ms"] /= count
+            layer["queries"] /= count
+    return totals
@@ -0,0 +1,128 @@
+"""Tenant- and user-keyed request rate limits.
+
+Every request carrying a valid bearer token counts against two shared
+sliding-window buckets: one per tenant, sized by the tenant's plan
+(RATE_LIMIT_PLANS), and one per user (RATE_LIMIT_PER_USER). Anonymous
+requests are left to the per-route, per-IP limits. The limiter runs before
+the view's auth decorator, so identity comes straight from the token (whose
+claims are cached by app.common.jwt) and the plan from the tenant registry;
+neither costs a query.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+from flask import Flask, Response, current_app, request
+from flask_limiter.wrappers import LimitGroup
+from werkzeug.exceptions import HTTPException
+
+from app.common.jwt import decode_token
+from app.common.tenant_registry import get_tenant_registry
+from app.config import parse_mapping
+from app.extensions import limiter
+
+TENANT_SCOPE = "tenant"
+USER_SCOPE = "user"
+_IDENTITY_KEY = "gestium.rate_limit_identity"
+_PLANS_EXTENSION = "rate_limit_plans"
+
+
+def request_identity() -> tuple[str, str] | None:
+    """Return (client_id, user_id) from the request's bearer token, or None."""
+    if _IDENTITY_KEY not in request.environ:
+        request.environ[_IDENTITY_KEY] = _identity_from_token()
+    return request.environ[_IDENTITY_KEY]
+
+
+def _identity_from_token() -> tuple[str, str] | None:
+    parts = request.headers.get("Authorization", "").split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        return None
+    try:
+        payload = decode_token(parts[1])
+    except HTTPException:
+        # auth_required rejects the request; nothing to count it against.
+        return None
+    if not payload.get("sub") or not payload.get("client_id"):
+        return None
+    return str(payload["client_id"]), str(payload["sub"])
+
+
+def is_anonymous() -> bool:
+    return request_identity() is None
+
+
+def tenant_key() -> str:
+    identity = request_identity()
+    return identity[0] if identity else ""
+
+
+def user_key() -> str:
+    identity = request_identity()
+    return f"{identity[0]}:{identity[1]}" if identity else ""
+
+
+def tenant_limit() -> str:
+    """Limit string for the current tenant's plan."""
+    identity = request_identity()
+    tenant = get_tenant_registry().get(identity[0]) if identity else None
+    plans = current_app.extensions.get(_PLANS_EXTENSION, {})
+    if tenant is not None and tenant.plan in plans:
+        return plans[tenant.plan]
+    return current_app.config.get("RATE_LIMIT_TENANT_DEFAULT", "")
+
+
+def user_limit() -> str:
+    return current_app.config.get("RATE_LIMIT_PER_USER", "")
+
+
+def init_rate_limits(app: Flask) -> None:
+    """Install the tenant and user buckets as application-wide limits."""
+    app.extensions[_PLANS_EXTENSION] = parse_mapping(app.config.get("RATE_LIMIT_PLANS", ""))
+    # The public application_limits/default_limits share the limiter's single
+    # key_func and scope, so two buckets keyed on tenant and on user need
+    # LimitGroups on the limit manager. That is Flask-Limiter internals:
+    # requirements.txt pins Flask-Limiter exactly, and test_rate_limits breaks
+    # if an upgrade changes it.
+    limiter.limit_manager.set_application_limits(
+        [
+            LimitGroup(
+                limit_provider=tenant_limit,
+                key_function=tenant_key,
+                scope=TENANT_SCOPE,
+                shared=True,
+                exempt_when=is_anonymous,
+                error_message="tenant_rate_limited",
+            ),
+            LimitGroup(
+                limit_provider=user_limit,
+                key_function=user_key,
+                scope=USER_SCOPE,
+                shared=True,
+                exempt_when=is_anonymous,
+                error_message="user_rate_limited",
+            ),
+        ]
+    )
+
+    if app.config.get("RATE_LIMIT_HEADERS", True) and _add_rate_limit_headers not in app.after_request_funcs[None]:
+        app.after_request(_add_rate_limit_headers)
+
+
+def _add_rate_limit_headers(response: Response) -> Response:
+    # Flask-Limiter's own header injection also stamps Retry-After on every
+    # response (even 200s and 503s), so only its limit bookkeeping is reused.
+    limits = limiter.current_limits
+    if not limits:
+        return response
+    # Report whichever bucket (tenant, user or route) is closest to running out.
+    remaining, current = min(((limit.remaining, limit) for limit in limits), key=lambda item: item[0])
+    reset_at = current.reset_at
+    response.headers["X-RateLimit-Limit"] = str(current.limit.amount)
+    response.headers["X-RateLimit-Remaining"] = str(remaining)
+    response.headers["X-RateLimit-Reset"] = str(reset_at)
+    if response.status_code == 429 and "Retry-After" not in response.headers:
+        response.headers["Retry-After"] = str(max(1, math.ceil(reset_at - time.time())))
+    return response
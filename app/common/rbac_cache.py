@@ -0,0 +1,120 @@
+"""Per-worker RBAC snapshot: user -> roles and role -> permissions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Iterable
+
+from flask import Flask, current_app, has_app_context
+
+from app.common.cache import TTLCache
+from app.common.invalidation import TOPIC_RBAC, register_invalidation_handler
+from app.common.metrics import register_metrics_provider
+from app.common.rbac_version import expire_rbac_version, get_rbac_version, rbac_version_age
+
+_RBAC_CACHE_EXTENSION = "rbac_snapshot_cache"
+ALL_PERMISSIONS_KEY = "*"
+
+
+@dataclass(frozen=True)
+class UserRoles:
+    """Role ids a user holds within one tenant (platform roles included)."""
+
+    role_ids: frozenset[str]
+    is_super_admin: bool
+
+
+class RbacSnapshotCache:
+    """LRU/TTL caches stamped with the RBAC version they were loaded under.
+
+    ``sync`` must be called with the current version before reading; a new
+    version drops every entry, so a role change is seen by this worker as soon
+    as it re-reads the version row (at most RBAC_VERSION_TTL_SECONDS later).
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        self.user_roles = TTLCache(max_size, default_ttl=ttl)
+        self.role_permissions = TTLCache(max_size, default_ttl=ttl)
+        self.version: int | None = None
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.user_roles.enabled
+
+    def sync(self, version: int) -> None:
+        if version == self.version:
+            return
+        with self._lock:
+            if version == self.version:
+                return
+            if self.version is not None:
+                self.invalidations += 1
+            self.user_roles.clear()
+            self.role_permissions.clear()
+            self.version = version
+
+    def get_user_roles(self, user_id: str, client_id: str) -> UserRoles | None:
+        return self.user_roles.get((str(user_id), str(client_id)))
+
+    def set_user_roles(self, user_id: str, client_id: str, user_roles: UserRoles) -> None:
+        self.user_roles.set((str(user_id), str(client_id)), user_roles)
+
+    def get_role_permissions(self, role_ids: Iterable[str]) -> tuple[dict[str, frozenset[str]], list[str]]:
+        """Return (cached permissions by role id, role ids that missed)."""
+        found: dict[str, frozenset[str]] = {}
+        missing: list[str] = []
+        for role_id in role_ids:
+            permissions = self.role_permissions.get(role_id)
+            if permissions is None:
+                missing.append(role_id)
+            else:
+                found[role_id] = permissions
+        return found, missing
+
+    def set_role_permissions(self, role_id: str, permissions: Iterable[str]) -> None:
+        self.role_permissions.set(role_id, frozenset(permissions))
+
+    def clear(self) -> None:
+        self.user_roles.clear()
+        self.role_permissions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        user_roles = self.user_roles.stats()
+        role_permissions = self.role_permissions.stats()
+        hits = user_roles["hits"] + role_permissions["hits"]
+        lookups = hits + user_roles["misses"] + role_permissions["misses"]
+        age = rbac_version_age() if has_app_context() else None
+        return {
+            "version": self.version,
+            "invalidations": self.invalidations,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "staleness_seconds": round(age, 3) if age is not None else None,
+            "user_roles": user_roles,
+            "role_permissions": role_permissions,
+        }
+
+
+def init_rbac_cache(app: Flask) -> None:
+    """Create the per-worker RBAC snapshot cache."""
+    rbac_cache = RbacSnapshotCache(
+        app.config.get("RBAC_CACHE_SIZE", 0),
+        ttl=app.config.get("RBAC_CACHE_TTL_SECONDS", 300),
+    )
+    app.extensions[_RBAC_CACHE_EXTENSION] = rbac_cache
+    register_metrics_provider(app, "rbac_cache", rbac_cache.stats)
+    # A role change elsewhere bumps the version row; re-read it right away.
+    register_invalidation_handler(app, TOPIC_RBAC, lambda key: expire_rbac_version(app))
+
+
+def get_rbac_cache() -> RbacSnapshotCache:
+    """Return the RBAC snapshot cache, synced to the current RBAC version."""
+    rbac_cache = current_app.extensions.get(_RBAC_CACHE_EXTENSION)
+    if rbac_cache is None:
+        init_rbac_cache(current_app)
+        rbac_cache = current_app.extensions[_RBAC_CACHE_EXTENSION]
+    if rbac_cache.enabled:
+        rbac_cache.sync(get_rbac_version())
+    return rbac_cache
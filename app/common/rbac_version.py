@@ -0,0 +1,64 @@
+"""RBAC version counter used to detect stale permission snapshots."""
+
+from __future__ import annotations
+
+import time
+
+from flask import Flask, current_app, has_app_context
+
+from app.common.invalidation import TOPIC_RBAC, publish_invalidation
+from app.extensions import db
+from app.models.rbac_version import RbacVersion
+
+_RBAC_VERSION_EXTENSION = "rbac_version"
+_ROW_ID = 1
+
+
+def get_rbac_version() -> int:
+    """Return the current RBAC version, re-read at most every RBAC_VERSION_TTL_SECONDS."""
+    state = current_app.extensions.setdefault(
+        _RBAC_VERSION_EXTENSION, {"version": None, "checked_at": 0.0}
+    )
+    ttl = current_app.config.get("RBAC_VERSION_TTL_SECONDS", 5)
+    now = time.monotonic()
+    if state["version"] is None or now - state["checked_at"] >= ttl:
+        version = db.session.query(RbacVersion.version).filter(RbacVersion.id == _ROW_ID).scalar()
+        state["version"] = int(version or 0)
+        state["checked_at"] = now
+    return state["version"]
+
+
+def bump_rbac_version(session: db.Session | None = None) -> int:
+    """Bump the RBAC version and make this worker see the new value immediately."""
+    session = session or db.session
+    updated = (
+        session.query(RbacVersion)
+        .filter(RbacVersion.id == _ROW_ID)
+        .update({RbacVersion.version: RbacVersion.version + 1}, synchronize_session=False)
+    )
+    if not updated:
+        session.add(RbacVersion(id=_ROW_ID, version=1))
+        session.flush()
+    version = int(session.query(RbacVersion.version).filter(RbacVersion.id == _ROW_ID).scalar())
+    if has_app_context():
+        current_app.extensions[_RBAC_VERSION_EXTENSION] = {
+            "version": version,
+            "checked_at": time.monotonic(),
+        }
+        publish_invalidation(TOPIC_RBAC)
+    return version
+
+
+def expire_rbac_version(app: Flask) -> None:
+    """Make the next get_rbac_version() re-read the version row."""
+    state = app.extensions.get(_RBAC_VERSION_EXTENSION)
+    if state is not None:
+        state["checked_at"] = float("-inf")
+
+
+def rbac_version_age() -> float | None:
+    """Seconds since this worker last confirmed the RBAC version, or None if never."""
+    state = current_app.extensions.get(_RBAC_VERSION_EXTENSION)
+    if not state or state["version"] is None:
+        return None
+    return time.monotonic() - state["checked_at"]
@@ -0,0 +1,223 @@
+"""Access token revocation backed by a per-worker Bloom filter."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import math
+import threading
+import time
+from typing import Any
+
+from flask import Flask, current_app, has_app_context
+
+from app.common.invalidation import (
+    TOPIC_REVOCATION,
+    publish_invalidation,
+    register_invalidation_handler,
+    topic_key,
+)
+from app.common.metrics import register_metrics_provider
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+_REVOCATION_EXTENSION = "token_revocation"
+# Invalidation key asking every worker to rebuild its filter, not just refresh it.
+_REBUILD_KEY = "rebuild"
+
+
+def user_revocation_key(user_id: str) -> str:
+    """Key of the entry revoking every token issued to user_id before its revoked_at."""
+    return f"user:{user_id}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` keys at ``error_rate``."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(1, int(capacity))
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+
+class RevocationList:
+    """Worker-local snapshot of the revoked_tokens table.
+
+    Rows are pulled incrementally by id every ``refresh_seconds`` and the
+    filter is rebuilt from unexpired rows every ``rebuild_seconds`` (or when it
+    outgrows its capacity). Only filter hits are confirmed with a query, so a
+    valid token is checked without touching the database.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.01,
+        refresh_seconds: float = 5.0,
+        rebuild_seconds: float = 300.0,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._filter = BloomFilter(capacity, error_rate)
+        self._last_id = 0
+        self._refreshed_at: float | None = None
+        self._rebuilt_at: float | None = None
+        self._lock = threading.Lock()
+        self.checks = 0
+        self.filter_hits = 0
+        self.confirmed = 0
+        self.refreshes = 0
+        self.rebuilds = 0
+
+    @classmethod
+    def from_config(cls, config) -> "RevocationList":
+        return cls(
+            capacity=config.get("TOKEN_REVOCATION_BLOOM_CAPACITY", 100_000),
+            error_rate=config.get("TOKEN_REVOCATION_BLOOM_ERROR_RATE", 0.01),
+            refresh_seconds=config.get("TOKEN_REVOCATION_REFRESH_SECONDS", 5.0),
+            rebuild_seconds=config.get("TOKEN_REVOCATION_REBUILD_SECONDS", 300.0),
+        )
+
+    def add(self, key: str) -> None:
+        """Make a revocation written by this worker visible immediately."""
+        with self._lock:
+            self._filter.add(key)
+
+    def is_revoked(self, claims: dict[str, Any]) -> bool:
+        self.refresh()
+        self.checks += 1
+        jti = claims.get("jti")
+        keys = [str(jti)] if jti else []
+        if claims.get("sub"):
+            keys.append(user_revocation_key(str(claims["sub"])))
+        candidates = [key for key in keys if key in self._filter]
+        if not candidates:
+            return False
+
+        self.filter_hits += 1
+        for entry in RevokedTokenRepository().list_by_jtis(candidates):
+            if entry.jti == jti or _issued_by(claims, entry.revoked_at):
+                self.confirmed += 1
+                return True
+        return False
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and self._refreshed_at is not None and now - self._refreshed_at < self.refresh_seconds:
+            return
+        with self._lock:
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.refresh_seconds:
+                return
+            repository = RevokedTokenRepository()
+            if self._rebuilt_at is None or now - self._rebuilt_at >= self.rebuild_seconds:
+                # Rebuilding also picks up rows whose ids committed out of order.
+                self._rebuild(repository.list_active_keys(datetime.now(timezone.utc)))
+                self._rebuilt_at = now
+            else:
+                rows = repository.list_keys_since(self._last_id)
+                if self._filter.count + len(rows) > self.capacity:
+                    self._rebuild(repository.list_active_keys(datetime.now(timezone.utc)))
+                    self._rebuilt_at = now
+                else:
+                    self._load(rows)
+            self._refreshed_at = now
+            self.refreshes += 1
+
+    def expire(self, rebuild: bool = False) -> None:
+        """Refresh from the table on the next check, rebuilding the filter if asked."""
+        if rebuild:
+            self._rebuilt_at = None
+        self._refreshed_at = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keys": self._filter.count,
+            "capacity": self.capacity,
+            "last_id": self._last_id,
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "confirmed": self.confirmed,
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+        }
+
+    def _rebuild(self, rows: list[tuple[int, str]]) -> None:
+        self._filter = BloomFilter(max(self.capacity, len(rows)), self.error_rate)
+        self._last_id = 0
+        self._load(rows)
+        self.rebuilds += 1
+
+    def _load(self, rows: list[tuple[int, str]]) -> None:
+        for row_id, key in rows:
+            self._filter.add(key)
+            self._last_id = max(self._last_id, row_id)
+
+
+def _issued_by(claims: dict[str, Any], revoked_at: datetime) -> bool:
+    if revoked_at.tzinfo is None:
+        revoked_at = revoked_at.replace(tzinfo=timezone.utc)
+    issued_at = claims.get("iat")
+    # iat has whole-second precision, so a token from the revocation's own second
+    # is revoked too: it may come from a refresh racing the sign-out.
+    return issued_at is not None and issued_at <= math.floor(revoked_at.timestamp())
+
+
+def signed_out_since(user_id: str, issued_at: datetime) -> bool:
+    """Whether a forced sign-out of user_id revokes credentials issued at issued_at."""
+    if issued_at.tzinfo is None:
+        issued_at = issued_at.replace(tzinfo=timezone.utc)
+    return get_revocation_list().is_revoked({"sub": user_id, "iat": math.floor(issued_at.timestamp())})
+
+
+def init_token_revocation(app: Flask) -> None:
+    """Create the per-worker revocation list; it is loaded on first use."""
+    revocation_list = RevocationList.from_config(app.config)
+    app.extensions[_REVOCATION_EXTENSION] = revocation_list
+    register_metrics_provider(app, "token_revocation", revocation_list.stats)
+    register_invalidation_handler(
+        app,
+        TOPIC_REVOCATION,
+        lambda key: revocation_list.expire(rebuild=key in (None, _REBUILD_KEY)),
+    )
+
+
+def get_revocation_list() -> RevocationList:
+    """Return the revocation list for the current app."""
+    revocation_list = current_app.extensions.get(_REVOCATION_EXTENSION)
+    if revocation_list is None:
+        init_token_revocation(current_app)
+        revocation_list = current_app.extensions[_REVOCATION_EXTENSION]
+    return revocation_list
+
+
+def remember_revocation(key: str) -> None:
+    """Add a freshly written revocation to this worker's filter."""
+    if not has_app_context():
+        return
+    get_revocation_list().add(key)
+    publish_invalidation(TOPIC_REVOCATION)
+
+
+def rebuild_revocations() -> None:
+    """Rebuild every worker's filter from the table, e.g. after expired rows are pruned."""
+    if not has_app_context():
+        return
+    get_revocation_list().expire(rebuild=True)
+    publish_invalidation(topic_key(TOPIC_REVOCATION, _REBUILD_KEY))
@@ -0,0 +1,246 @@
+"""Per-tenant database routing.
+
+TENANT_SHARDS names extra databases (``whale=postgresql://...``); the
+``tenant_shards`` control table, or TENANT_SHARD_MAP for static overrides,
+assigns tenants to them. Once a request is bound to a tenant, ``db.session``
+sends every statement on tenant tables to that tenant's shard engine, each
+with its own connection pool. Control tables always stay on the default
+database, and unmapped tenants live there too.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable
+
+import sqlalchemy as sa
+from flask import Flask, current_app, g
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import util as sql_util
+
+from app.common.metrics import register_metrics_provider
+from app.common.tenant_registry import get_tenant_registry
+from app.config import parse_mapping
+from app.extensions import db
+
+DEFAULT_SHARD = "default"
+# Global tables that are never sharded. Shards keep a copy of their tenants'
+# clients rows only to satisfy foreign keys.
+CONTROL_TABLES = frozenset({"clients", "tenant_shards", "rbac_version", "revoked_tokens"})
+# Tenant tables without a client_id column, reached through a parent that has one.
+# user_roles goes through users so platform role grants move with the tenant.
+TENANT_LINKS = {
+    "role_permissions": ("role_id", "roles"),
+    "user_roles": ("user_id", "users"),
+    "team_members": ("team_id", "teams"),
+}
+
+_SHARDS_EXTENSION = "tenant_shards"
+
+
+class ShardRouter:
+    """Lazily creates one engine per shard and picks the engine for a statement."""
+
+    def __init__(
+        self,
+        urls: dict[str, str],
+        static_map: dict[str, str] | None = None,
+        engine_options: dict[str, Any] | None = None,
+    ) -> None:
+        self.urls = dict(urls)
+        self.static_map = dict(static_map or {})
+        self.engine_options = dict(engine_options or {})
+        self._engines: dict[str, Engine] = {}
+        self._lock = threading.Lock()
+        self.routed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    def shard_names(self) -> list[str]:
+        return [DEFAULT_SHARD, *sorted(self.urls)]
+
+    def engine(self, shard: str) -> Engine:
+        if shard == DEFAULT_SHARD:
+            return db.engine
+        engine = self._engines.get(shard)
+        if engine is not None:
+            return engine
+        if shard not in self.urls:
+            raise KeyError(f"Unknown shard {shard!r}; add it to TENANT_SHARDS.")
+        with self._lock:
+            engine = self._engines.get(shard)
+            if engine is None:
+                engine = sa.create_engine(self.urls[shard], **self.engine_options)
+                self._engines[shard] = engine
+        return engine
+
+    def shard_for(self, client_id: str) -> str:
+        """Return the shard of client_id from the static map or the tenant registry."""
+        client_id = str(client_id)
+        shard = self.static_map.get(client_id)
+        if shard is None:
+            tenant = get_tenant_registry().get(client_id)
+            shard = tenant.shard if tenant is not None else None
+        if shard is None or shard not in self.urls:
+            return DEFAULT_SHARD
+        return shard
+
+    def route(self, mapper: Any = None, clause: Any = None) -> Engine | None:
+        """Return the bound shard's engine for a tenant-table statement, else None.
+
+        Statements touching a control table, and those whose tables cannot be
+        identified (``text()``), stay on the default database.
+        """
+        shard = g.get("tenant_shard")
+        if shard is None or shard == DEFAULT_SHARD:
+            return None
+        names = {table.name for table in _statement_tables(mapper, clause)}
+        if not names or names & CONTROL_TABLES:
+            return None
+        self.routed += 1
+        return self.engine(shard)
+
+    def dispose(self) -> None:
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+
+    def stats(self) -> dict[str, Any]:
+        pools = {}
+        for name, engine in list(self._engines.items()):
+            checked_out = getattr(engine.pool, "checkedout", None)
+            pools[name] = checked_out() if checked_out is not None else None
+        return {"shards": sorted(self.urls), "routed": self.routed, "checked_out": pools}
+
+
+def _statement_tables(mapper: Any, clause: Any) -> list[sa.Table]:
+    tables = []
+    if mapper is not None:
+        tables.append(sa.inspect(mapper).local_table)
+    if isinstance(clause, sa.Table):
+        tables.append(clause)
+    elif isinstance(clause, sa.sql.ClauseElement):
+        # Walks joins, unions and subqueries, and the target of DML statements.
+        tables.extend(sql_util.find_tables(clause, include_crud=True))
+    return tables
+
+
+def init_tenant_shards(app: Flask) -> None:
+    """Create the per-worker shard router from TENANT_SHARDS and TENANT_SHARD_MAP."""
+    previous = app.extensions.get(_SHARDS_EXTENSION)
+    if previous is not None:
+        previous.dispose()
+    router = ShardRouter(
+        parse_mapping(app.config.get("TENANT_SHARDS", "")),
+        static_map=parse_mapping(app.config.get("TENANT_SHARD_MAP", "")),
+        engine_options=app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    )
+    app.extensions[_SHARDS_EXTENSION] = router
+    register_metrics_provider(app, "tenant_shards", router.stats)
+
+
+def get_shard_router() -> ShardRouter:
+    """Return the shard router for the current app."""
+    router = current_app.extensions.get(_SHARDS_EXTENSION)
+    if router is None:
+        init_tenant_shards(current_app)
+        router = current_app.extensions[_SHARDS_EXTENSION]
+    return router
+
+
+def bind_tenant(client_id: str | None) -> str:
+    """Route this request's tenant tables to client_id's shard; returns the shard name."""
+    router = get_shard_router()
+    shard = router.shard_for(client_id) if client_id is not None and router.enabled else DEFAULT_SHARD
+    g.tenant_shard = shard
+    return shard
+
+
+def locate_tenants(lookup: Callable[[Session], Iterable[str]]) -> list[str]:
+    """Return the client ids lookup finds, each on the shard that owns that tenant.
+
+    For requests that arrive without a client_id, such as email-only login or
+    an invitation link. lookup runs on every shard in its own short-lived
+    session; rows that copy-tenant left on a tenant's previous shard are ignored.
+    """
+    router = get_shard_router()
+    if not router.enabled:
+        return list(dict.fromkeys(lookup(db.session)))
+    found: list[str] = []
+    for shard in router.shard_names():
+        with Session(router.engine(shard)) as session:
+            found.extend(client_id for client_id in lookup(session) if router.shard_for(client_id) == shard)
+    return list(dict.fromkeys(found))
+
+
+def copy_tenant(client_id: str, source: str, target: str, batch_size: int = 1000) -> dict[str, int]:
+    """Copy every tenant row of client_id from source to target; returns rows per table.
+
+    The target must already have the schema. Rows are copied in foreign-key
+    order inside one target transaction, so a failed copy leaves nothing behind.
+    Permissions and platform roles (``client_id IS NULL``) are shared, so they
+    are copied once per shard; the tenant's users keep their platform grants.
+    """
+    router = get_shard_router()
+    source_engine = router.engine(source)
+    target_engine = router.engine(target)
+    if source_engine is target_engine:
+        raise ValueError("Source and target shards are the same database.")
+    tables = db.metadata.tables
+    copied: dict[str, int] = {}
+    with source_engine.connect() as reader, target_engine.begin() as writer:
+        clients = tables["clients"]
+        tenant = sa.select(clients).where(clients.c.id == client_id)
+        if writer.execute(tenant).first() is None:
+            copied["clients"] = _copy_rows(reader, writer, tenant, clients, batch_size)
+        permissions = tables["permissions"]
+        existing = set(writer.execute(sa.select(permissions.c.id)).scalars())
+        copied["permissions"] = _copy_rows(
+            reader, writer, sa.select(permissions).where(permissions.c.id.notin_(existing)), permissions, batch_size
+        )
+        roles, grants = tables["roles"], tables["role_permissions"]
+        existing = set(writer.execute(sa.select(roles.c.id).where(roles.c.client_id.is_(None))).scalars())
+        platform_roles = sa.select(roles.c.id).where(roles.c.client_id.is_(None), roles.c.id.notin_(existing))
+        copied["platform roles"] = _copy_rows(
+            reader, writer, sa.select(roles).where(roles.c.id.in_(platform_roles)), roles, batch_size
+        )
+        copied["platform role permissions"] = _copy_rows(
+            reader, writer, sa.select(grants).where(grants.c.role_id.in_(platform_roles)), grants, batch_size
+        )
+        for table in db.metadata.sorted_tables:
+            query = _tenant_rows(table, client_id)
+            if query is None:
+                continue
+            if writer.execute(sa.select(sa.literal(1)).select_from(query.subquery()).limit(1)).first():
+                raise ValueError(f"Tenant already has {table.name} rows on shard {target!r}.")
+            copied[table.name] = _copy_rows(reader, writer, query, table, batch_size)
+    return copied
+
+
+def _tenant_rows(table: sa.Table, client_id: str) -> sa.Select | None:
+    if table.name in CONTROL_TABLES:
+        return None
+    if "client_id" in table.c:
+        return sa.select(table).where(table.c.client_id == client_id)
+    if table.name in TENANT_LINKS:
+        column, parent_name = TENANT_LINKS[table.name]
+        parent = db.metadata.tables[parent_name]
+        return sa.select(table).where(
+            table.c[column].in_(sa.select(parent.c.id).where(parent.c.client_id == client_id))
+        )
+    return None
+
+
+def _copy_rows(reader, writer, query: sa.Select, table: sa.Table, batch_size: int) -> int:
+    result = reader.execution_options(stream_results=True).execute(query).mappings()
+    count = 0
+    while True:
+        rows = result.fetchmany(batch_size)
+        if not rows:
+            return count
+        writer.execute(sa.insert(table), [dict(row) for row in rows])
+        count += len(rows)
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 import uuid
 from typing import Any, Callable
 
 from flask import Flask, current_app, g, request
 from werkzeug.exceptions import BadRequest, NotFound
 
+from app.common.profiling import profile_layer
+from app.common.sharding import bind_tenant
+from app.common.tenant_registry import ensure_tenant_active
+
 CLIENT_ID_HEADER = "X-Client-Id"
 
 
@@ -18,6 +22,9 @@ def register_tenant_context(app: Flask) -> None:
     @app.before_request
     def _resolve_tenant_context() -> None:
         g.client_id = _resolve_client_id()
+        if g.client_id is not None:
+            ensure_tenant_active(str(g.client_id))
+        bind_tenant(g.client_id)
 
 
 def _resolve_client_id() -> uuid.UUID | None:
@@ -41,18 +48,25 @@ def _parse_client_id(value: Any) -> uuid.UUID:
     if isinstance(value, uuid.UUID):
         return value
     try:
-        return uuid.UUID(str(value))
+        return _parse_uuid(str(value))
     except (TypeError, ValueError) as exc:
         raise BadRequest("Invalid client_id format.") from exc
 
 
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> uuid.UUID:
+    # Each worker only ever sees a bounded set of tenant ids; failures are not cached.
+    return uuid.UUID(value)
+
+
 def tenant_required(func: Callable[..., Any]):
     """Ensure the request has a resolved tenant client_id."""
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any):
-        if getattr(g, "client_id", None) is None:
-            raise BadRequest("client_id is required for this resource.")
+        with profile_layer("tenant_required"):
+            if getattr(g, "client_id", None) is None:
+                raise BadRequest("client_id is required for this resource.")
         return func(*args, **kwargs)
 
     return wrapper
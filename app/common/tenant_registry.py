@@ -0,0 +1,140 @@
+"""Per-worker registry of tenant status, plan and shard.
+
+The whole clients table is small, so each worker keeps a snapshot of it and
+re-reads it every TENANT_REGISTRY_TTL_SECONDS or when a status change is
+published on the invalidation bus. Requests check their tenant against the
+snapshot without touching the database.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from werkzeug.exceptions import Forbidden
+
+from app.common.invalidation import (
+    TOPIC_TENANT,
+    publish_invalidation,
+    register_invalidation_handler,
+    topic_key,
+)
+from app.common.metrics import register_metrics_provider
+from app.extensions import db
+from app.repositories.client_repository import ClientRepository
+
+logger = logging.getLogger(__name__)
+
+_TENANT_REGISTRY_EXTENSION = "tenant_registry"
+
+
+@dataclass(frozen=True)
+class TenantInfo:
+    """Snapshot of the tenant fields checked on every request."""
+
+    id: str
+    status: str
+    plan: str | None
+    shard: str | None = None
+
+
+class TenantRegistry:
+    """Worker-local snapshot of every tenant's status and plan.
+
+    A failed refresh keeps the previous snapshot (or none at all), so a
+    database outage never locks every tenant out; tenants missing from the
+    snapshot are allowed through and picked up on the next refresh.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._tenants: dict[str, TenantInfo] = {}
+        self._refreshed_at: float | None = None
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.rejected = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    def get(self, client_id: str) -> TenantInfo | None:
+        self.refresh()
+        self.lookups += 1
+        return self._tenants.get(str(client_id))
+
+    def ensure_active(self, client_id: str) -> None:
+        """Raise Forbidden if the snapshot says the tenant is not active."""
+        tenant = self.get(client_id)
+        if tenant is not None and tenant.status != "active":
+            self.rejected += 1
+            raise Forbidden(f"tenant_{tenant.status}")
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and self._refreshed_at is not None and now - self._refreshed_at < self.ttl_seconds:
+            return
+        with self._lock:
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.ttl_seconds:
+                return
+            # Retry no sooner than the TTL, even if the load fails.
+            self._refreshed_at = now
+            try:
+                # Own session: a refresh mid-request must not touch the request's transaction.
+                with Session(db.engine) as session:
+                    rows = ClientRepository(session).list_registry_rows()
+            except SQLAlchemyError:
+                self.errors += 1
+                logger.warning("failed to load tenant registry; keeping previous snapshot", exc_info=True)
+                return
+            self._tenants = {row[0]: TenantInfo(*row) for row in rows}
+            self.refreshes += 1
+
+    def expire(self) -> None:
+        """Reload the snapshot on the next lookup."""
+        self._refreshed_at = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tenants": len(self._tenants),
+            "lookups": self.lookups,
+            "rejected": self.rejected,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+        }
+
+
+def init_tenant_registry(app: Flask) -> None:
+    """Create the per-worker tenant registry and load it."""
+    registry = TenantRegistry(ttl_seconds=app.config.get("TENANT_REGISTRY_TTL_SECONDS", 30.0))
+    app.extensions[_TENANT_REGISTRY_EXTENSION] = registry
+    register_metrics_provider(app, "tenant_registry", registry.stats)
+    register_invalidation_handler(app, TOPIC_TENANT, lambda key: registry.expire())
+    with app.app_context():
+        registry.refresh()
+
+
+def get_tenant_registry() -> TenantRegistry:
+    """Return the tenant registry for the current app."""
+    registry = current_app.extensions.get(_TENANT_REGISTRY_EXTENSION)
+    if registry is None:
+        init_tenant_registry(current_app)
+        registry = current_app.extensions[_TENANT_REGISTRY_EXTENSION]
+    return registry
+
+
+def ensure_tenant_active(client_id: str) -> None:
+    """Reject requests for suspended or disabled tenants."""
+    get_tenant_registry().ensure_active(str(client_id))
+
+
+def invalidate_tenant(client_id: str) -> None:
+    """Reload tenant snapshots after a tenant's status or plan changes."""
+    if not has_app_context():
+        return
+    get_tenant_registry().expire()
+    publish_invalidation(topic_key(TOPIC_TENANT, client_id))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 
 
 class BaseConfig:
@@ -11,6 +12,67 @@ class BaseConfig:
     SQLALCHEMY_DATABASE_URI = DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     ALLOW_X_CLIENT_ID_HEADER = os.getenv("ALLOW_X_CLIENT_ID_HEADER", "false").lower() == "true"
+    JWT_SIGNING_KEYS = os.getenv("JWT_SIGNING_KEYS", "")
+    JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID", "")
+    JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "1024"))
+    JWT_ACCESS_TOKEN_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_MINUTES", "60"))
+    JWT_EMBED_PERMISSIONS = os.getenv("JWT_EMBED_PERMISSIONS", "false").lower() == "true"
+    REQUEST_PROFILING_ENABLED = os.getenv("REQUEST_PROFILING_ENABLED", "false").lower() == "true"
+    RBAC_VERSION_TTL_SECONDS = float(os.getenv("RBAC_VERSION_TTL_SECONDS", "5"))
+    COMPANY_ACL_FILTER = os.getenv("COMPANY_ACL_FILTER", "join")
+    PAGINATION_DEFAULT_LIMIT = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+    PAGINATION_MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", "500"))
+    COMPANY_ACCESS_CACHE_SIZE = int(os.getenv("COMPANY_ACCESS_CACHE_SIZE", "0"))
+    COMPANY_ACCESS_CACHE_TTL_SECONDS = float(os.getenv("COMPANY_ACCESS_CACHE_TTL_SECONDS", "30"))
+    COMPANY_ACCESS_BULK_CHUNK_SIZE = int(os.getenv("COMPANY_ACCESS_BULK_CHUNK_SIZE", "500"))
+    RBAC_CACHE_SIZE = int(os.getenv("RBAC_CACHE_SIZE", "4096"))
+    RBAC_CACHE_TTL_SECONDS = float(os.getenv("RBAC_CACHE_TTL_SECONDS", "300"))
+    REFRESH_TOKEN_TTL_DAYS = int(os.getenv("REFRESH_TOKEN_TTL_DAYS", "30"))
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_SALT_LENGTH = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", "16"))
+    PASSWORD_HASH_POOL_SIZE = int(os.getenv("PASSWORD_HASH_POOL_SIZE", "0"))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "16"))
+    PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
+    PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "30"))
+    PASSWORD_HASH_POOL_START_METHOD = os.getenv("PASSWORD_HASH_POOL_START_METHOD", "spawn")
+    TOKEN_REVOCATION_BLOOM_CAPACITY = int(os.getenv("TOKEN_REVOCATION_BLOOM_CAPACITY", "100000"))
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_REVOCATION_BLOOM_ERROR_RATE", "0.01"))
+    TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "5"))
+    TOKEN_REVOCATION_REBUILD_SECONDS = float(os.getenv("TOKEN_REVOCATION_REBUILD_SECONDS", "300"))
+    LOGIN_THROTTLE_STORE = os.getenv("LOGIN_THROTTLE_STORE", "memory")
+    LOGIN_THROTTLE_SQLITE_PATH = os.getenv(
+        "LOGIN_THROTTLE_SQLITE_PATH",
+        os.path.join(tempfile.gettempdir(), "gestium-login-throttle.sqlite3"),
+    )
+    LOGIN_THROTTLE_ACCOUNT_THRESHOLD = int(os.getenv("LOGIN_THROTTLE_ACCOUNT_THRESHOLD", "5"))
+    LOGIN_THROTTLE_TENANT_THRESHOLD = int(os.getenv("LOGIN_THROTTLE_TENANT_THRESHOLD", "100"))
+    LOGIN_THROTTLE_BASE_DELAY_SECONDS = float(os.getenv("LOGIN_THROTTLE_BASE_DELAY_SECONDS", "1"))
+    LOGIN_THROTTLE_MAX_DELAY_SECONDS = float(os.getenv("LOGIN_THROTTLE_MAX_DELAY_SECONDS", "900"))
+    LOGIN_THROTTLE_WINDOW_SECONDS = float(os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "900"))
+    PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "4096"))
+    PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+    # memory:// is per worker; use redis://, memcached:// or gestium+sqlite:////path to share counters.
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_IN_MEMORY_FALLBACK_ENABLED = (
+        os.getenv("RATELIMIT_IN_MEMORY_FALLBACK_ENABLED", "true").lower() == "true"
+    )
+    RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "sliding-window-counter")
+    RATE_LIMIT_HEADERS = os.getenv("RATE_LIMIT_HEADERS", "true").lower() == "true"
+    RATE_LIMIT_TENANT_DEFAULT = os.getenv("RATE_LIMIT_TENANT_DEFAULT", "1200/minute")
+    RATE_LIMIT_PLANS = os.getenv("RATE_LIMIT_PLANS", "")
+    RATE_LIMIT_PER_USER = os.getenv("RATE_LIMIT_PER_USER", "300/minute")
+    TENANT_REGISTRY_TTL_SECONDS = float(os.getenv("TENANT_REGISTRY_TTL_SECONDS", "30"))
+    TENANT_SHARDS = os.getenv("TENANT_SHARDS", "")
+    TENANT_SHARD_MAP = os.getenv("TENANT_SHARD_MAP", "")
+    TENANT_PARTITIONING = os.getenv("TENANT_PARTITIONING", "none")
+    INVALIDATION_BUS_BACKEND = os.getenv("INVALIDATION_BUS_BACKEND", "none")
+    INVALIDATION_BUS_SQLITE_PATH = os.getenv(
+        "INVALIDATION_BUS_SQLITE_PATH",
+        os.path.join(tempfile.gettempdir(), "gestium-invalidation.sqlite3"),
+    )
+    INVALIDATION_BUS_CHANNEL = os.getenv("INVALIDATION_BUS_CHANNEL", "gestium_invalidation")
+    INVALIDATION_BUS_RETENTION_SECONDS = float(os.getenv("INVALIDATION_BUS_RETENTION_SECONDS", "3600"))
+    INVALIDATION_POLL_SECONDS = float(os.getenv("INVALIDATION_POLL_SECONDS", "1"))
     ENV = os.getenv("FLASK_ENV", "development")
     DEBUG = False
     TESTING = False
@@ -40,3 +102,13 @@ def get_config(config_name: str) -> type[BaseConfig]:
         "production": ProductionConfig,
     }
     return config_map.get(normalized_name, DevelopmentConfig)
+
+
+def parse_mapping(value: str) -> dict[str, str]:
+    """Parse a ``key=value,key=value`` setting; values may themselves contain ``=``."""
+    mapping = {}
+    for item in value.split(","):
+        key, separator, target = item.strip().partition("=")
+        if separator and key.strip():
+            mapping[key.strip()] = target.strip()
+    return mapping
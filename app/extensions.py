@@ -6,13 +6,31 @@ import json
 import logging
 from datetime import datetime, timezone
 
-from flask import Flask
+from flask import Flask, current_app, has_app_context
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 
-db = SQLAlchemy()
+# Registers the gestium+sqlite:// scheme for RATELIMIT_STORAGE_URI.
+from app.common import limiter_storage  # noqa: F401
+
+
+class TenantRoutingSession(Session):
+    """Session that defers to the shard router (app.common.sharding) for tenant tables."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_app_context():
+            router = current_app.extensions.get("tenant_shards")
+            if router is not None and router.enabled:
+                engine = router.route(mapper, clause)
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={"class_": TenantRoutingSession})
 migrate = Migrate()
 limiter = Limiter(key_func=get_remote_address)
 
@@ -27,6 +45,9 @@ class JsonLogFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            payload.update(fields)
         return json.dumps(payload)
 
 
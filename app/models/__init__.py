@@ -6,7 +6,13 @@ from app.models.company import Company
 from app.models.document import Document
 from app.models.employee import Employee
 from app.models.permission import Permission
+from app.models.rbac_version import RbacVersion
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
 from app.models.role import Role
+from app.models.team import Team
+from app.models.team_company_access import TeamCompanyAccess
+from app.models.tenant_shard import TenantShard
 from app.models.user import User
 from app.models.user_company_access import UserCompanyAccess
 from app.models.user_invitation import UserInvitation
@@ -18,7 +24,13 @@ __all__ = [
     "Document",
     "Employee",
     "Permission",
+    "RbacVersion",
+    "RefreshToken",
+    "RevokedToken",
     "Role",
+    "Team",
+    "TeamCompanyAccess",
+    "TenantShard",
     "User",
     "UserCompanyAccess",
     "UserInvitation",
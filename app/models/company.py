@@ -15,6 +15,7 @@ class Company(BaseModel):
     __table_args__ = (
         db.UniqueConstraint("client_id", "tax_id", name="uq_companies_client_tax_id"),
         db.Index("ix_companies_client_status", "client_id", "status"),
+        db.Index("ix_companies_client_name", "client_id", "name", "id"),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
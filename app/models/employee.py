@@ -18,6 +18,7 @@ class Employee(BaseModel):
             "OR (status = 'active' AND end_date IS NULL)",
             name="ck_employees_status_dates",
         ),
+        db.Index("ix_employees_client_company_name", "client_id", "company_id", "full_name", "id"),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
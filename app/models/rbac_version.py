@@ -0,0 +1,18 @@
+"""RBAC version model."""
+
+from __future__ import annotations
+
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class RbacVersion(BaseModel):
+    """Single-row counter bumped whenever role or permission assignments change."""
+
+    __tablename__ = "rbac_version"
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<RbacVersion id={self.id} version={self.version}>"
@@ -0,0 +1,44 @@
+"""Refresh token model."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class RefreshToken(BaseModel):
+    """Hashed, single-use refresh token belonging to a rotation family."""
+
+    __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        db.Index("ix_refresh_tokens_token_hash", "token_hash", unique=True),
+        db.Index("ix_refresh_tokens_client_family", "client_id", "family_id"),
+        db.Index("ix_refresh_tokens_client_user", "client_id", "user_id"),
+    )
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    client_id = db.Column(db.String(36), db.ForeignKey("clients.id"), nullable=False, index=True)
+    user_id = db.Column(db.String(36), db.ForeignKey("users.id"), nullable=False, index=True)
+    family_id = db.Column(db.String(36), nullable=False)
+    token_hash = db.Column(db.String(64), nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    used_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    revoked_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    user = db.relationship("User", backref=db.backref("refresh_tokens", lazy="dynamic"))
+
+    def __repr__(self) -> str:
+        return (
+            "<RefreshToken id={id} client_id={client_id} user_id={user_id} family_id={family_id} "
+            "expires_at={expires_at} used_at={used_at} revoked_at={revoked_at}>"
+        ).format(
+            id=self.id,
+            client_id=self.client_id,
+            user_id=self.user_id,
+            family_id=self.family_id,
+            expires_at=self.expires_at,
+            used_at=self.used_at,
+            revoked_at=self.revoked_at,
+        )
@@ -0,0 +1,38 @@
+"""Revoked token model."""
+
+from __future__ import annotations
+
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class RevokedToken(BaseModel):
+    """Revoked access token ``jti``, or a ``user:<id>`` entry revoking all older tokens.
+
+    The autoincrement id lets workers fetch only rows added since their last refresh.
+    """
+
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (db.Index("ix_revoked_tokens_jti", "jti", unique=True),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    jti = db.Column(db.String(64), nullable=False)
+    client_id = db.Column(db.String(36), db.ForeignKey("clients.id"), nullable=False, index=True)
+    # No foreign key: this control table stays on the default database while
+    # sharded tenants' users only exist on their shard.
+    user_id = db.Column(db.String(36), nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return (
+            "<RevokedToken id={id} jti={jti} client_id={client_id} user_id={user_id} "
+            "revoked_at={revoked_at} expires_at={expires_at}>"
+        ).format(
+            id=self.id,
+            jti=self.jti,
+            client_id=self.client_id,
+            user_id=self.user_id,
+            revoked_at=self.revoked_at,
+            expires_at=self.expires_at,
+        )
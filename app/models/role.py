@@ -19,6 +19,7 @@ class Role(BaseModel):
             "(scope = 'platform' AND client_id IS NULL)",
             name="ck_roles_scope_client_id",
         ),
+        db.Index("ix_roles_client_scope_name", "client_id", "scope", "name"),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
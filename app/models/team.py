@@ -0,0 +1,35 @@
+"""Team model and membership table for shared company access."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.extensions import db
+from app.models.base import BaseModel
+
+team_members = db.Table(
+    "team_members",
+    db.Column("team_id", db.String(36), db.ForeignKey("teams.id"), nullable=False),
+    db.Column("user_id", db.String(36), db.ForeignKey("users.id"), nullable=False),
+    db.UniqueConstraint("team_id", "user_id", name="uq_team_members_team_user"),
+    # Access resolution starts from the user, so lead with user_id.
+    db.Index("ix_team_members_user_team", "user_id", "team_id"),
+)
+
+
+class Team(BaseModel):
+    """A group of tenant users that share company access levels."""
+
+    __tablename__ = "teams"
+    __table_args__ = (
+        db.UniqueConstraint("client_id", "name", name="uq_teams_client_name"),
+    )
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    client_id = db.Column(db.String(36), db.ForeignKey("clients.id"), nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False)
+
+    members = db.relationship("User", secondary=team_members, backref=db.backref("teams", lazy="dynamic"))
+
+    def __repr__(self) -> str:
+        return f"<Team id={self.id} client_id={self.client_id} name={self.name}>"
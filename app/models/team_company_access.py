@@ -0,0 +1,45 @@
+"""Team-company access model for tenant-scoped ACLs."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.common.access_levels import AccessLevel
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class TeamCompanyAccess(BaseModel):
+    """Access levels granted to every member of a team on a company."""
+
+    __tablename__ = "team_company_access"
+    __table_args__ = (
+        # Also serves the team_id -> company_id lookups of access resolution.
+        db.UniqueConstraint("team_id", "company_id", name="uq_team_company_access_team_company"),
+    )
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Not indexed on its own: lookups arrive through the team or the company, and
+    # a tenant-leading index would tempt the planner away from team_members.
+    client_id = db.Column(db.String(36), db.ForeignKey("clients.id"), nullable=False)
+    team_id = db.Column(db.String(36), db.ForeignKey("teams.id"), nullable=False)
+    company_id = db.Column(db.String(36), db.ForeignKey("companies.id"), nullable=False, index=True)
+    access_level = db.Column(
+        db.Enum(*[level.value for level in AccessLevel], name="company_access_level"),
+        nullable=False,
+    )
+
+    team = db.relationship("Team", backref=db.backref("company_access", lazy="dynamic"))
+    company = db.relationship("Company", backref=db.backref("team_access", lazy="dynamic"))
+
+    def __repr__(self) -> str:
+        return (
+            "<TeamCompanyAccess id={id} client_id={client_id} team_id={team_id} "
+            "company_id={company_id} access_level={access_level}>"
+        ).format(
+            id=self.id,
+            client_id=self.client_id,
+            team_id=self.team_id,
+            company_id=self.company_id,
+            access_level=self.access_level,
+        )
@@ -0,0 +1,21 @@
+"""Tenant shard map model."""
+
+from __future__ import annotations
+
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class TenantShard(BaseModel):
+    """Names the shard (a key of TENANT_SHARDS) holding a tenant's data.
+
+    Tenants without a row live on the default database.
+    """
+
+    __tablename__ = "tenant_shards"
+
+    client_id = db.Column(db.String(36), db.ForeignKey("clients.id"), primary_key=True)
+    shard = db.Column(db.String(64), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TenantShard client_id={self.client_id} shard={self.shard}>"
@@ -15,6 +15,8 @@ class User(BaseModel):
     __tablename__ = "users"
     __table_args__ = (
         db.UniqueConstraint("client_id", "email", name="uq_users_client_email"),
+        # Login without a client_id looks users up by email across tenants.
+        db.Index("ix_users_email_status", "email", "status"),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
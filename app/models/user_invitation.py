@@ -15,6 +15,7 @@ class UserInvitation(BaseModel):
     __table_args__ = (
         db.Index("ix_user_invitations_client_email", "client_id", "email"),
         db.Index("ix_user_invitations_expires_at", "expires_at"),
+        db.Index("ix_user_invitations_token_hash", "token_hash", unique=True),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
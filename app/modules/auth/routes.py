@@ -1,15 +1,18 @@
 """Auth routes."""
 
 from flask import Blueprint, g, request
-from werkzeug.exceptions import BadRequest
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound, Unauthorized
 
 from app.common.decorators import auth_required, require_permission
-from app.common.jwt import create_access_token
+from app.common.jwt import access_token_lifetime
 from app.common.responses import ok
 from app.common.tenant import tenant_required
 from app.extensions import db, limiter
 from app.modules.auth.service import AuthService
+from app.repositories.user_repository import UserRepository
 from app.services.invitation_service import InvitationService
+from app.services.refresh_token_service import RefreshTokenService
+from app.services.token_revocation_service import TokenRevocationService
 
 bp = Blueprint("auth", __name__)
 
@@ -64,21 +67,76 @@ def login_user():
 
     service = AuthService()
     user_id, resolved_client_id = service.authenticate(email, password, client_id)
-    token = create_access_token(user_id, resolved_client_id)
+    token = service.issue_access_token(user_id, resolved_client_id)
+    refresh = RefreshTokenService().issue(user_id, resolved_client_id)
+    db.session.commit()
 
-    return ok(
-        {
-            "access_token": token,
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
+    return ok(_token_response(token, refresh.token))
+
+
+@bp.post("/auth/refresh")
+def refresh_access_token():
+    payload = request.get_json(silent=True) or {}
+    refresh_service = RefreshTokenService()
+    try:
+        refresh = refresh_service.rotate(payload.get("refresh_token"), payload.get("client_id"))
+    except (Forbidden, Unauthorized):
+        # Persist the family revocation triggered by reuse detection or a suspension.
+        db.session.commit()
+        raise
+
+    token = AuthService().issue_access_token(
+        refresh.refresh_token.user_id,
+        refresh.refresh_token.client_id,
     )
+    db.session.commit()
+
+    return ok(_token_response(token, refresh.token))
+
+
+@bp.post("/auth/logout")
+@auth_required
+def logout_user():
+    payload = request.get_json(silent=True) or {}
+    TokenRevocationService().revoke_token(g.token_claims)
+    refresh_token = payload.get("refresh_token")
+    if refresh_token:
+        RefreshTokenService().revoke(refresh_token, g.user.id, g.user.client_id)
+    db.session.commit()
+
+    return ok({"status": "logged_out"})
+
+
+@bp.post("/auth/users/<user_id>/sign-out")
+@auth_required
+@tenant_required
+@require_permission("tenant.users.manage")
+def sign_out_user(user_id: str):
+    user = UserRepository().get_by_id(user_id, str(g.client_id))
+    if user is None:
+        raise NotFound("user_not_found")
+    TokenRevocationService().revoke_user(user.id, user.client_id)
+    db.session.commit()
+
+    return ok({"status": "signed_out"})
+
+
+def _token_response(access_token: str, refresh_token: str) -> dict:
+    return {
+        "access_token": access_token,
+        "token_type": "Bearer",
+        "expires_in": int(access_token_lifetime().total_seconds()),
+        "refresh_token": refresh_token,
+        "refresh_expires_in": int(RefreshTokenService.ttl().total_seconds()),
+    }
 
 
 @bp.get("/auth/me")
 @auth_required
 def get_current_user():
-    user = g.user
+    user = UserRepository().get_by_id(g.user.id, g.user.client_id)
+    if user is None:
+        raise Unauthorized("invalid_credentials")
     return ok(
         {
             "id": user.id,
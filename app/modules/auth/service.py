@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from werkzeug.exceptions import BadRequest, Forbidden, Unauthorized
+from flask import current_app
+from werkzeug.exceptions import BadRequest, Forbidden, ServiceUnavailable, Unauthorized
 
+from app.common.authz import AuthorizationService
+from app.common.jwt import create_access_token
+from app.common.login_throttle import get_login_throttle
+from app.common.sharding import bind_tenant, locate_tenants
+from app.common.tenant_registry import ensure_tenant_active
 from app.repositories.user_repository import UserRepository
 from app.services.user_service import UserService
 
@@ -25,19 +31,45 @@ class AuthService:
         if not password:
             raise BadRequest("password_required")
         normalized_email = self.user_service.normalize_email(email)
+        throttle = get_login_throttle()
+        throttle.check(normalized_email, client_id)
 
         resolved_client_id = client_id
+        if not resolved_client_id:
+            client_ids = locate_tenants(
+                lambda session: [
+                    user.client_id for user in UserRepository(session).list_active_by_email(normalized_email)
+                ]
+            )
+            if len(client_ids) > 1:
+                raise BadRequest("client_id_required")
+            resolved_client_id = client_ids[0] if client_ids else None
+            if resolved_client_id:
+                # The tenant is only known now; an attack on it tightens the check too.
+                throttle.check(normalized_email, resolved_client_id)
+        user = None
         if resolved_client_id:
+            bind_tenant(resolved_client_id)
             user = self.user_repository.get_by_email(normalized_email, resolved_client_id)
-        else:
-            users = self.user_repository.list_active_by_email(normalized_email)
-            if len(users) > 1:
-                raise BadRequest("client_id_required")
-            user = users[0] if users else None
-            resolved_client_id = user.client_id if user is not None else None
         if user is None or not self.user_service.verify_password(user, password):
+            throttle.record_failure(normalized_email, resolved_client_id)
             raise Unauthorized("invalid_credentials")
+        throttle.record_success(normalized_email)
         if user.status != "active":
             raise Forbidden("user_inactive")
+        ensure_tenant_active(user.client_id)
+        if self.user_service.needs_rehash(user):
+            try:
+                self.user_service.rehash_password(user, password)
+            except ServiceUnavailable:
+                # Hashing pool is saturated; upgrade the hash on a later login.
+                pass
 
         return user.id, resolved_client_id
+
+    def issue_access_token(self, user_id: str, client_id: str) -> str:
+        """Create an access token, embedding the permission bitmap when enabled."""
+        extra_claims = None
+        if current_app.config.get("JWT_EMBED_PERMISSIONS", False):
+            extra_claims = AuthorizationService().permission_claims(user_id, client_id)
+        return create_access_token(user_id, client_id, extra_claims=extra_claims)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from sqlalchemy import false, or_
+from sqlalchemy import exists, false, or_
 
+from app.common.pagination import apply_keyset
 from app.extensions import db
 from app.models.company import Company
+from app.models.team import team_members
+from app.models.team_company_access import TeamCompanyAccess
+from app.models.user_company_access import UserCompanyAccess
+from app.repositories.user_company_access_repository import effective_access_subquery
 
 
 class CompanyRepository:
@@ -31,20 +36,83 @@ class CompanyRepository:
             .one_or_none()
         )
 
+    def list_existing_ids(self, company_ids: list[str], client_id: str) -> set[str]:
+        """Return which of company_ids belong to the tenant."""
+        if not company_ids:
+            return set()
+        rows = (
+            self.session.query(Company.id)
+            .filter(Company.client_id == client_id, Company.id.in_(company_ids))
+            .all()
+        )
+        return {row[0] for row in rows}
+
     def list(
         self,
         client_id: str,
         allowed_company_ids: set[str] | None = None,
         status: str | None = None,
         q: str | None = None,
+        acl_user_id: str | None = None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
     ) -> list[Company]:
+        """List tenant companies by (name, id), optionally restricted by ACL.
+
+        ``acl_user_id`` filters with EXISTS against the user's direct and team
+        grants, so the allowed ids never leave the database;
+        ``allowed_company_ids`` binds them as an IN list instead. ``after`` and
+        ``limit`` select a keyset page (see ``app.common.pagination``).
+        """
         query = self.session.query(Company).filter(Company.client_id == client_id)
 
+        if acl_user_id is not None:
+            query = query.filter(
+                or_(
+                    exists().where(
+                        UserCompanyAccess.client_id == client_id,
+                        UserCompanyAccess.user_id == acl_user_id,
+                        UserCompanyAccess.company_id == Company.id,
+                    ),
+                    exists().where(
+                        team_members.c.user_id == acl_user_id,
+                        TeamCompanyAccess.team_id == team_members.c.team_id,
+                        TeamCompanyAccess.client_id == client_id,
+                        TeamCompanyAccess.company_id == Company.id,
+                    ),
+                )
+            )
+
         if allowed_company_ids is not None:
             if not allowed_company_ids:
                 return query.filter(false()).all()
             query = query.filter(Company.id.in_(allowed_company_ids))
 
+        query = self._apply_filters(query, status, q)
+        return apply_keyset(query, (Company.name, Company.id), after, limit).all()
+
+    def list_with_access(
+        self,
+        client_id: str,
+        user_id: str,
+        status: str | None = None,
+        q: str | None = None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Company, str]]:
+        """List companies the user can access, joined with their effective access level."""
+        access = effective_access_subquery(user_id, client_id)
+        query = (
+            self.session.query(Company, access.c.access_level)
+            .join(access, access.c.company_id == Company.id)
+            .filter(Company.client_id == client_id)
+        )
+        query = self._apply_filters(query, status, q)
+        rows = apply_keyset(query, (Company.name, Company.id), after, limit).all()
+        return [(company, access_level) for company, access_level in rows]
+
+    @staticmethod
+    def _apply_filters(query, status: str | None, q: str | None):
         if status:
             query = query.filter(Company.status == status)
 
@@ -56,5 +124,4 @@ class CompanyRepository:
                     Company.tax_id.ilike(like_query),
                 )
             )
-
-        return query.order_by(Company.name.asc()).all()
+        return query
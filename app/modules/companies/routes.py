@@ -5,40 +5,47 @@ from __future__ import annotations
 from flask import Blueprint, g, request
 from werkzeug.exceptions import BadRequest
 
-from app.common.decorators import auth_required, require_company_access, require_permission
+from app.common.decorators import authorize
+from app.common.pagination import page_request_from_args
 from app.common.responses import ok
-from app.common.tenant import tenant_required
 from app.extensions import db
 from app.modules.companies.schemas import (
+    BulkAccessPayload,
     CompanyCreatePayload,
     CompanyResponseSchema,
     CompanyUpdatePayload,
 )
 from app.modules.companies.service import CompanyService
 from app.services.case_service import CaseService
+from app.services.company_access_service import CompanyAccessService
 
 bp = Blueprint("companies", __name__)
 
 
 @bp.get("/companies")
-@auth_required
-@tenant_required
-@require_permission("company.read")
+@authorize("company.read")
 def list_companies():
     service = CompanyService()
-    companies = service.list_companies(
+    page = service.list_companies(
         client_id=str(g.client_id),
         user_id=str(g.user.id),
         status=request.args.get("status"),
         q=request.args.get("q"),
+        page=page_request_from_args(request.args),
+    )
+    return ok(
+        {
+            "companies": [
+                CompanyResponseSchema.dump(company, access_level=access_level)
+                for company, access_level in page.items
+            ],
+            "next_cursor": page.next_cursor,
+        }
     )
-    return ok({"companies": [CompanyResponseSchema.dump(company) for company in companies]})
 
 
 @bp.post("/companies")
-@auth_required
-@tenant_required
-@require_permission("company.write")
+@authorize("company.write")
 def create_company():
     payload = request.get_json(silent=True) or {}
     company_payload = CompanyCreatePayload.from_dict(payload)
@@ -52,11 +59,26 @@ def create_company():
     return ok({"company": CompanyResponseSchema.dump(company)}, status_code=201)
 
 
+@bp.post("/companies/access/bulk")
+@authorize("tenant.users.manage")
+def bulk_company_access():
+    payload = BulkAccessPayload.from_dict(request.get_json(silent=True) or {})
+    service = CompanyAccessService()
+    if payload.action == "grant":
+        counts = service.bulk_grant(
+            str(g.client_id),
+            payload.user_ids,
+            payload.company_ids,
+            payload.access_level,
+        )
+    else:
+        counts = service.bulk_revoke(str(g.client_id), payload.user_ids, payload.company_ids)
+    db.session.commit()
+    return ok({"action": payload.action, **counts})
+
+
 @bp.get("/companies/<company_id>")
-@auth_required
-@tenant_required
-@require_permission("company.read")
-@require_company_access("viewer")
+@authorize("company.read", company_access="viewer")
 def get_company(company_id: str):
     service = CompanyService()
     company = service.get_company(str(g.client_id), company_id)
@@ -64,10 +86,7 @@ def get_company(company_id: str):
 
 
 @bp.patch("/companies/<company_id>")
-@auth_required
-@tenant_required
-@require_permission("company.write")
-@require_company_access("manager")
+@authorize("company.write", company_access="manager")
 def update_company(company_id: str):
     payload = request.get_json(silent=True) or {}
     update_payload = CompanyUpdatePayload.from_dict(payload)
@@ -82,10 +101,7 @@ def update_company(company_id: str):
 
 
 @bp.post("/companies/<company_id>/deactivate")
-@auth_required
-@tenant_required
-@require_permission("company.write")
-@require_company_access("admin")
+@authorize("company.write", company_access="admin")
 def deactivate_company(company_id: str):
     service = CompanyService()
     company = service.deactivate_company(str(g.client_id), company_id)
@@ -94,10 +110,7 @@ def deactivate_company(company_id: str):
 
 
 @bp.post("/companies/<company_id>/activate")
-@auth_required
-@tenant_required
-@require_permission("company.write")
-@require_company_access("admin")
+@authorize("company.write", company_access="admin")
 def activate_company(company_id: str):
     service = CompanyService()
     company = service.activate_company(str(g.client_id), company_id)
@@ -106,10 +119,7 @@ def activate_company(company_id: str):
 
 
 @bp.post("/companies/<company_id>/cases")
-@auth_required
-@tenant_required
-@require_permission("case.write")
-@require_company_access("operator")
+@authorize("case.write", company_access="operator")
 def create_case(company_id: str):
     payload = request.get_json(silent=True) or {}
     title = payload.get("title")
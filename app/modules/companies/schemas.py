@@ -7,8 +7,12 @@ from datetime import datetime
 
 from werkzeug.exceptions import BadRequest
 
+from app.common.access_levels import AccessLevel
 from app.models.company import Company
 
+MAX_BULK_ACCESS_USERS = 100
+MAX_BULK_ACCESS_COMPANIES = 5000
+
 
 def _normalize_name(value: str | None) -> str:
     if value is None:
@@ -76,12 +80,50 @@ class CompanyUpdatePayload:
         return cls(name=name, tax_id=tax_id)
 
 
+def _normalize_ids(value, field: str, limit: int) -> tuple[str, ...]:
+    if not isinstance(value, list) or not value:
+        raise BadRequest(f"{field}_required")
+    ids = tuple(dict.fromkeys(str(item) for item in value if item))
+    if not ids:
+        raise BadRequest(f"{field}_required")
+    if len(ids) > limit:
+        raise BadRequest(f"too_many_{field}")
+    return ids
+
+
+@dataclass(frozen=True)
+class BulkAccessPayload:
+    """Validated payload for bulk company access grants and revocations."""
+
+    action: str
+    user_ids: tuple[str, ...]
+    company_ids: tuple[str, ...]
+    access_level: str | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "BulkAccessPayload":
+        action = payload.get("action")
+        if action not in {"grant", "revoke"}:
+            raise BadRequest("invalid_action")
+        user_ids = _normalize_ids(payload.get("user_ids"), "user_ids", MAX_BULK_ACCESS_USERS)
+        company_ids = _normalize_ids(payload.get("company_ids"), "company_ids", MAX_BULK_ACCESS_COMPANIES)
+        access_level = payload.get("access_level")
+        if action == "grant":
+            if access_level is None:
+                raise BadRequest("access_level_required")
+            if access_level not in {level.value for level in AccessLevel}:
+                raise BadRequest("invalid_access_level")
+        else:
+            access_level = None
+        return cls(action=action, user_ids=user_ids, company_ids=company_ids, access_level=access_level)
+
+
 class CompanyResponseSchema:
     """Serializer for company responses."""
 
     @staticmethod
-    def dump(company: Company) -> dict:
-        return {
+    def dump(company: Company, access_level: str | None = None) -> dict:
+        data = {
             "id": company.id,
             "name": company.name,
             "tax_id": company.tax_id,
@@ -89,3 +131,6 @@ class CompanyResponseSchema:
             "created_at": _format_datetime(company.created_at),
             "updated_at": _format_datetime(company.updated_at),
         }
+        if access_level is not None:
+            data["access_level"] = access_level
+        return data
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from flask import current_app
 from werkzeug.exceptions import NotFound
 
+from app.common.pagination import Page, PageRequest, build_page
 from app.models.company import Company
 from app.modules.companies.repository import CompanyRepository
 from app.modules.companies.schemas import CompanyCreatePayload, CompanyUpdatePayload
@@ -30,14 +32,34 @@ class CompanyService:
         user_id: str,
         status: str | None = None,
         q: str | None = None,
-    ) -> list[Company]:
-        allowed_company_ids = self.access_service.get_allowed_company_ids(user_id, client_id)
-        return self.repository.list(
-            client_id=client_id,
-            allowed_company_ids=allowed_company_ids,
-            status=status,
-            q=q,
-        )
+        page: PageRequest | None = None,
+    ) -> Page[tuple[Company, str]]:
+        """Return a page of (company, access_level) pairs the user can see.
+
+        COMPANY_ACL_FILTER "join" filters in SQL; "in" binds the ids from the
+        user's access map, which is cheaper only while that map is cached.
+        Without ``page`` every company is returned.
+        """
+        after = page.after if page else None
+        limit = page.limit if page else None
+        if current_app.config.get("COMPANY_ACL_FILTER", "join") == "in":
+            access_map = self.access_service.get_access_map(user_id, client_id)
+            companies = self.repository.list(
+                client_id=client_id,
+                allowed_company_ids=set(access_map),
+                status=status,
+                q=q,
+                after=after,
+                limit=limit,
+            )
+            rows = [(company, access_map[company.id]) for company in companies]
+        else:
+            rows = self.repository.list_with_access(
+                client_id, user_id, status=status, q=q, after=after, limit=limit
+            )
+        if page is None:
+            return Page(items=rows)
+        return build_page(rows, page.limit, lambda row: (row[0].name, row[0].id))
 
     def get_company(self, client_id: str, company_id: str) -> Company:
         company = self.repository.get_by_id(company_id, client_id)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from app.common.pagination import apply_keyset
 from app.extensions import db
 from app.models.employee import Employee
 
@@ -29,10 +30,15 @@ class EmployeeRepository:
             .one_or_none()
         )
 
-    def list_by_company(self, company_id: str, client_id: str) -> list[Employee]:
-        return (
-            self.session.query(Employee)
-            .filter(Employee.company_id == company_id, Employee.client_id == client_id)
-            .order_by(Employee.full_name.asc())
-            .all()
+    def list_by_company(
+        self,
+        company_id: str,
+        client_id: str,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[Employee]:
+        """List a company's employees by (full_name, id), one keyset page at a time if limited."""
+        query = self.session.query(Employee).filter(
+            Employee.company_id == company_id, Employee.client_id == client_id
         )
+        return apply_keyset(query, (Employee.full_name, Employee.id), after, limit).all()
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from flask import Blueprint, g, request
 
-from app.common.decorators import auth_required, require_company_access, require_permission
+from app.common.decorators import authorize
+from app.common.pagination import page_request_from_args
 from app.common.responses import ok
-from app.common.tenant import tenant_required
 from app.extensions import db
 from app.modules.employees.schemas import (
     EmployeeCreateRequest,
@@ -20,21 +20,20 @@ bp = Blueprint("employees", __name__)
 
 
 @bp.get("/companies/<company_id>/employees")
-@auth_required
-@tenant_required
-@require_permission("employee.read")
-@require_company_access("viewer")
+@authorize("employee.read", company_access="viewer")
 def list_employees(company_id: str):
     service = EmployeeService()
-    employees = service.list_employees(str(g.client_id), company_id)
-    return ok({"employees": [EmployeeResponseSchema.dump(employee) for employee in employees]})
+    page = service.list_employees(str(g.client_id), company_id, page_request_from_args(request.args))
+    return ok(
+        {
+            "employees": [EmployeeResponseSchema.dump(employee) for employee in page.items],
+            "next_cursor": page.next_cursor,
+        }
+    )
 
 
 @bp.post("/companies/<company_id>/employees")
-@auth_required
-@tenant_required
-@require_permission("employee.write")
-@require_company_access("operator")
+@authorize("employee.write", company_access="operator")
 def create_employee(company_id: str):
     payload = request.get_json(silent=True) or {}
     create_payload = EmployeeCreateRequest.from_dict(payload)
@@ -45,10 +44,7 @@ def create_employee(company_id: str):
 
 
 @bp.get("/companies/<company_id>/employees/<employee_id>")
-@auth_required
-@tenant_required
-@require_permission("employee.read")
-@require_company_access("viewer")
+@authorize("employee.read", company_access="viewer")
 def get_employee(company_id: str, employee_id: str):
     service = EmployeeService()
     employee = service.get_employee(str(g.client_id), company_id, employee_id)
@@ -56,10 +52,7 @@ def get_employee(company_id: str, employee_id: str):
 
 
 @bp.patch("/companies/<company_id>/employees/<employee_id>")
-@auth_required
-@tenant_required
-@require_permission("employee.write")
-@require_company_access("operator")
+@authorize("employee.write", company_access="operator")
 def update_employee(company_id: str, employee_id: str):
     payload = request.get_json(silent=True) or {}
     update_payload = EmployeeUpdateRequest.from_dict(payload)
@@ -70,10 +63,7 @@ def update_employee(company_id: str, employee_id: str):
 
 
 @bp.post("/companies/<company_id>/employees/<employee_id>/terminate")
-@auth_required
-@tenant_required
-@require_permission("employee.write")
-@require_company_access("manager")
+@authorize("employee.write", company_access="manager")
 def terminate_employee(company_id: str, employee_id: str):
     payload = request.get_json(silent=True) or {}
     terminate_payload = EmployeeTerminateRequest.from_dict(payload)
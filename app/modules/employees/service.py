@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from werkzeug.exceptions import NotFound
 
+from app.common.authz import current_authorization
+from app.common.pagination import Page, PageRequest, build_page
 from app.models.employee import Employee
 from app.modules.companies.repository import CompanyRepository
 from app.modules.employees.repository import EmployeeRepository
@@ -26,9 +28,17 @@ class EmployeeService:
         self.repository = repository or EmployeeRepository()
         self.company_repository = company_repository or CompanyRepository()
 
-    def list_employees(self, client_id: str, company_id: str) -> list[Employee]:
+    def list_employees(
+        self,
+        client_id: str,
+        company_id: str,
+        page: PageRequest | None = None,
+    ) -> Page[Employee]:
         self._ensure_company(client_id, company_id)
-        return self.repository.list_by_company(company_id, client_id)
+        if page is None:
+            return Page(items=self.repository.list_by_company(company_id, client_id))
+        employees = self.repository.list_by_company(company_id, client_id, after=page.after, limit=page.limit)
+        return build_page(employees, page.limit, lambda employee: (employee.full_name, employee.id))
 
     def create_employee(
         self,
@@ -104,6 +114,15 @@ class EmployeeService:
         return employee
 
     def _ensure_company(self, client_id: str, company_id: str) -> None:
+        context = current_authorization()
+        if (
+            context is not None
+            and context.company_exists
+            and context.company_id == company_id
+            and context.user.client_id == client_id
+        ):
+            # Already checked by the request's authorization policy.
+            return
         company = self.company_repository.get_by_id(company_id, client_id)
         if company is None:
             raise NotFound("Company not found.")
@@ -0,0 +1,5 @@
+"""Metrics module blueprint exposure."""
+
+from app.modules.metrics.routes import bp
+
+__all__ = ["bp"]
@@ -0,0 +1,18 @@
+"""Metrics routes."""
+
+import os
+
+from flask import Blueprint
+
+from app.common.decorators import auth_required, require_permission
+from app.common.metrics import collect_metrics
+from app.common.responses import ok
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.get("/metrics")
+@auth_required
+@require_permission("platform.metrics.read")
+def get_worker_metrics():
+    return ok({"pid": os.getpid(), "metrics": collect_metrics()})
@@ -1,10 +1,13 @@
 """RBAC routes."""
 
-from flask import Blueprint, g
+from flask import Blueprint, g, request
 
+from app.common.access_levels import access_level_ge
 from app.common.authz import AuthorizationService
 from app.common.decorators import auth_required, require_permission
 from app.common.responses import ok
+from app.modules.rbac.schemas import PermissionCheck
+from app.services.company_access_service import CompanyAccessService
 
 bp = Blueprint("rbac", __name__)
 
@@ -22,3 +25,36 @@ def list_my_permissions():
 @require_permission("company.write")
 def probe_company_write():
     return ok({"ok": True})
+
+
+@bp.post("/rbac/check")
+@auth_required
+def check_permissions():
+    checks = PermissionCheck.list_from_payload(request.get_json(silent=True) or {})
+    user_id = str(g.user.id)
+    client_id = str(g.client_id)
+
+    # Roles and permissions are resolved once and memoized for the request.
+    authz = AuthorizationService()
+    company_ids = [check.company_id for check in checks if check.company_id is not None]
+    access_levels = CompanyAccessService().get_access_levels(user_id, client_id, company_ids)
+
+    results = []
+    for check in checks:
+        result = {
+            "permission": check.permission,
+            "company_id": check.company_id,
+            "access_level": check.access_level,
+            "allowed": True,
+            "reason": None,
+        }
+        if not authz.user_has_permission(g.user, check.permission):
+            result.update(allowed=False, reason="missing_permission")
+        elif check.company_id is not None:
+            level = access_levels.get(check.company_id)
+            if level is None:
+                result.update(allowed=False, reason="company_access_not_found")
+            elif not access_level_ge(level, check.access_level):
+                result.update(allowed=False, reason="insufficient_access_level")
+        results.append(result)
+    return ok({"results": results})
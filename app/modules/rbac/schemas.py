@@ -0,0 +1,51 @@
+"""Schemas for RBAC requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from werkzeug.exceptions import BadRequest
+
+from app.common.access_levels import AccessLevel
+
+MAX_PERMISSION_CHECKS = 100
+
+
+@dataclass(frozen=True)
+class PermissionCheck:
+    """One (permission, company, access level) question from the batch endpoint."""
+
+    permission: str
+    company_id: str | None = None
+    access_level: str | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "PermissionCheck":
+        if not isinstance(payload, dict):
+            raise BadRequest("invalid_check")
+        permission = payload.get("permission")
+        if not isinstance(permission, str) or not permission:
+            raise BadRequest("permission_required")
+        company_id = payload.get("company_id")
+        access_level = payload.get("access_level")
+        if access_level is not None:
+            if company_id is None:
+                raise BadRequest("company_id_required")
+            if access_level not in {level.value for level in AccessLevel}:
+                raise BadRequest("invalid_access_level")
+        elif company_id is not None:
+            access_level = AccessLevel.viewer.value
+        return cls(
+            permission=permission,
+            company_id=str(company_id) if company_id is not None else None,
+            access_level=access_level,
+        )
+
+    @classmethod
+    def list_from_payload(cls, payload: dict) -> list["PermissionCheck"]:
+        checks = payload.get("checks")
+        if not isinstance(checks, list) or not checks:
+            raise BadRequest("checks_required")
+        if len(checks) > MAX_PERMISSION_CHECKS:
+            raise BadRequest("too_many_checks")
+        return [cls.from_dict(check) for check in checks]
@@ -0,0 +1,5 @@
+"""Teams module blueprint exposure."""
+
+from app.modules.teams.routes import bp
+
+__all__ = ["bp"]
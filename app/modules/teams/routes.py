@@ -0,0 +1,61 @@
+"""Team routes."""
+
+from __future__ import annotations
+
+from flask import Blueprint, g, request
+
+from app.common.decorators import authorize
+from app.common.responses import ok
+from app.extensions import db
+from app.modules.teams.schemas import (
+    TeamCompanyAccessPayload,
+    TeamCreatePayload,
+    TeamMemberPayload,
+    TeamResponseSchema,
+)
+from app.services.team_service import TeamService
+
+bp = Blueprint("teams", __name__)
+
+
+@bp.post("/teams")
+@authorize("tenant.users.manage")
+def create_team():
+    payload = TeamCreatePayload.from_dict(request.get_json(silent=True) or {})
+    team = TeamService().create_team(str(g.client_id), payload.name)
+    db.session.commit()
+    return ok({"team": TeamResponseSchema.dump(team)}, status_code=201)
+
+
+@bp.post("/teams/<team_id>/members")
+@authorize("tenant.users.manage")
+def add_team_member(team_id: str):
+    payload = TeamMemberPayload.from_dict(request.get_json(silent=True) or {})
+    added = TeamService().add_member(str(g.client_id), team_id, payload.user_id)
+    db.session.commit()
+    return ok({"added": added})
+
+
+@bp.delete("/teams/<team_id>/members/<user_id>")
+@authorize("tenant.users.manage")
+def remove_team_member(team_id: str, user_id: str):
+    removed = TeamService().remove_member(str(g.client_id), team_id, user_id)
+    db.session.commit()
+    return ok({"removed": removed})
+
+
+@bp.put("/teams/<team_id>/companies/<company_id>")
+@authorize("tenant.users.manage")
+def grant_team_company_access(team_id: str, company_id: str):
+    payload = TeamCompanyAccessPayload.from_dict(request.get_json(silent=True) or {})
+    access = TeamService().grant_company_access(str(g.client_id), team_id, company_id, payload.access_level)
+    db.session.commit()
+    return ok({"access": TeamResponseSchema.dump_access(access)})
+
+
+@bp.delete("/teams/<team_id>/companies/<company_id>")
+@authorize("tenant.users.manage")
+def revoke_team_company_access(team_id: str, company_id: str):
+    removed = TeamService().revoke_company_access(str(g.client_id), team_id, company_id)
+    db.session.commit()
+    return ok({"removed": removed})
@@ -0,0 +1,71 @@
+"""Schemas for team requests and responses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from werkzeug.exceptions import BadRequest
+
+from app.common.access_levels import AccessLevel
+from app.models.team import Team
+from app.models.team_company_access import TeamCompanyAccess
+
+
+@dataclass(frozen=True)
+class TeamCreatePayload:
+    """Validated payload for team creation."""
+
+    name: str
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "TeamCreatePayload":
+        name = payload.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise BadRequest("name_required")
+        return cls(name=name.strip())
+
+
+@dataclass(frozen=True)
+class TeamMemberPayload:
+    """Validated payload for adding a team member."""
+
+    user_id: str
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "TeamMemberPayload":
+        user_id = payload.get("user_id")
+        if not user_id:
+            raise BadRequest("user_id_required")
+        return cls(user_id=str(user_id))
+
+
+@dataclass(frozen=True)
+class TeamCompanyAccessPayload:
+    """Validated payload for granting a team access to a company."""
+
+    access_level: str
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "TeamCompanyAccessPayload":
+        access_level = payload.get("access_level")
+        if access_level is None:
+            raise BadRequest("access_level_required")
+        if access_level not in {level.value for level in AccessLevel}:
+            raise BadRequest("invalid_access_level")
+        return cls(access_level=access_level)
+
+
+class TeamResponseSchema:
+    """Serializers for team responses."""
+
+    @staticmethod
+    def dump(team: Team) -> dict:
+        return {"id": team.id, "name": team.name}
+
+    @staticmethod
+    def dump_access(access: TeamCompanyAccess) -> dict:
+        return {
+            "team_id": access.team_id,
+            "company_id": access.company_id,
+            "access_level": access.access_level,
+        }
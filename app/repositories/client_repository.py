@@ -0,0 +1,44 @@
+"""Client repository."""
+
+from __future__ import annotations
+
+from app.extensions import db
+from app.models.client import Client
+from app.models.tenant_shard import TenantShard
+
+
+class ClientRepository:
+    """Data access layer for Client."""
+
+    def __init__(self, session: db.Session | None = None) -> None:
+        self.session = session or db.session
+
+    def get_by_id(self, client_id: str) -> Client | None:
+        return self.session.get(Client, client_id)
+
+    def list_registry_rows(self) -> list[tuple[str, str, str | None, str | None]]:
+        """Return (id, status, plan, shard) for every tenant."""
+        rows = (
+            self.session.query(Client.id, Client.status, Client.plan, TenantShard.shard)
+            .outerjoin(TenantShard, TenantShard.client_id == Client.id)
+            .all()
+        )
+        return [(row.id, row.status, row.plan, row.shard) for row in rows]
+
+    def update_status(self, client: Client, status: str) -> Client:
+        client.status = status
+        self.session.add(client)
+        self.session.flush()
+        return client
+
+    def set_shard(self, client_id: str, shard: str | None) -> None:
+        """Point the tenant at shard, or back at the default database when None."""
+        entry = self.session.get(TenantShard, client_id)
+        if shard is None:
+            if entry is not None:
+                self.session.delete(entry)
+        elif entry is None:
+            self.session.add(TenantShard(client_id=client_id, shard=shard))
+        else:
+            entry.shard = shard
+        self.session.flush()
@@ -0,0 +1,67 @@
+"""Refresh token repository."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from app.extensions import db
+from app.models.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository:
+    """Data access layer for RefreshToken."""
+
+    def __init__(self, session: db.Session | None = None) -> None:
+        self.session = session or db.session
+
+    def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        self.session.add(refresh_token)
+        self.session.flush()
+        return refresh_token
+
+    def update(self, refresh_token: RefreshToken) -> RefreshToken:
+        self.session.add(refresh_token)
+        self.session.flush()
+        return refresh_token
+
+    def get_by_token_hash(self, token_hash: str) -> RefreshToken | None:
+        return (
+            self.session.query(RefreshToken)
+            .filter(RefreshToken.token_hash == token_hash)
+            .one_or_none()
+        )
+
+    def mark_used(self, refresh_token_id: str, used_at: datetime) -> bool:
+        """Atomically mark an unused token as used; False if another request won."""
+        updated = (
+            self.session.query(RefreshToken)
+            .filter(
+                RefreshToken.id == refresh_token_id,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .update({RefreshToken.used_at: used_at}, synchronize_session=False)
+        )
+        return updated == 1
+
+    def revoke_family(self, family_id: str, client_id: str, revoked_at: datetime) -> int:
+        return (
+            self.session.query(RefreshToken)
+            .filter(
+                RefreshToken.client_id == client_id,
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .update({RefreshToken.revoked_at: revoked_at}, synchronize_session=False)
+        )
+
+    def revoke_user(self, user_id: str, client_id: str, revoked_at: datetime) -> int:
+        return (
+            self.session.query(RefreshToken)
+            .filter(
+                RefreshToken.client_id == client_id,
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .update({RefreshToken.revoked_at: revoked_at}, synchronize_session=False)
+        )
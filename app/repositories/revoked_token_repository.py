@@ -0,0 +1,58 @@
+"""Revoked token repository."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from app.extensions import db
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    """Data access layer for RevokedToken."""
+
+    def __init__(self, session: db.Session | None = None) -> None:
+        self.session = session or db.session
+
+    def create(self, revoked_token: RevokedToken) -> RevokedToken:
+        self.session.add(revoked_token)
+        self.session.flush()
+        return revoked_token
+
+    def delete(self, revoked_token: RevokedToken) -> None:
+        self.session.delete(revoked_token)
+        self.session.flush()
+
+    def get_by_jti(self, jti: str) -> RevokedToken | None:
+        return self.session.query(RevokedToken).filter(RevokedToken.jti == jti).one_or_none()
+
+    def list_by_jtis(self, jtis: list[str]) -> list[RevokedToken]:
+        return self.session.query(RevokedToken).filter(RevokedToken.jti.in_(jtis)).all()
+
+    def list_keys_since(self, last_id: int) -> list[tuple[int, str]]:
+        """Return (id, jti) pairs added after last_id, in id order."""
+        rows = (
+            self.session.query(RevokedToken.id, RevokedToken.jti)
+            .filter(RevokedToken.id > last_id)
+            .order_by(RevokedToken.id)
+            .all()
+        )
+        return [(row.id, row.jti) for row in rows]
+
+    def list_active_keys(self, now: datetime) -> list[tuple[int, str]]:
+        """Return (id, jti) pairs that have not expired yet, in no particular order."""
+        # No ORDER BY: sorting by id would make the planner walk the primary key
+        # instead of ix_revoked_tokens_expires_at.
+        rows = (
+            self.session.query(RevokedToken.id, RevokedToken.jti)
+            .filter(RevokedToken.expires_at > now)
+            .all()
+        )
+        return [(row.id, row.jti) for row in rows]
+
+    def delete_expired(self, now: datetime) -> int:
+        return (
+            self.session.query(RevokedToken)
+            .filter(RevokedToken.expires_at <= now)
+            .delete(synchronize_session=False)
+        )
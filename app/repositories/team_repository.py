@@ -0,0 +1,90 @@
+"""Repository for teams, memberships and team company access."""
+
+from __future__ import annotations
+
+from sqlalchemy import delete, insert, select
+
+from app.common.acl_cache import invalidate_company_access
+from app.extensions import db
+from app.models.team import Team, team_members
+from app.models.team_company_access import TeamCompanyAccess
+
+
+class TeamRepository:
+    """Data access layer for Team and its access grants."""
+
+    def __init__(self, session: db.Session | None = None) -> None:
+        self.session = session or db.session
+
+    def create(self, team: Team) -> Team:
+        self.session.add(team)
+        self.session.flush()
+        return team
+
+    def get_by_id(self, team_id: str, client_id: str) -> Team | None:
+        return (
+            self.session.query(Team)
+            .filter(Team.id == team_id, Team.client_id == client_id)
+            .one_or_none()
+        )
+
+    def get_by_name(self, name: str, client_id: str) -> Team | None:
+        return (
+            self.session.query(Team)
+            .filter(Team.client_id == client_id, Team.name == name)
+            .one_or_none()
+        )
+
+    def list_member_ids(self, team_id: str) -> list[str]:
+        rows = self.session.execute(select(team_members.c.user_id).where(team_members.c.team_id == team_id))
+        return [row[0] for row in rows]
+
+    def add_member(self, team: Team, user_id: str) -> bool:
+        if user_id in self.list_member_ids(team.id):
+            return False
+        self.session.execute(insert(team_members).values(team_id=team.id, user_id=user_id))
+        invalidate_company_access(user_id, team.client_id)
+        return True
+
+    def remove_member(self, team: Team, user_id: str) -> bool:
+        result = self.session.execute(
+            delete(team_members).where(team_members.c.team_id == team.id, team_members.c.user_id == user_id)
+        )
+        invalidate_company_access(user_id, team.client_id)
+        return result.rowcount > 0
+
+    def get_company_access(self, team_id: str, company_id: str) -> TeamCompanyAccess | None:
+        return (
+            self.session.query(TeamCompanyAccess)
+            .filter(TeamCompanyAccess.team_id == team_id, TeamCompanyAccess.company_id == company_id)
+            .one_or_none()
+        )
+
+    def upsert_company_access(self, team: Team, company_id: str, access_level: str) -> TeamCompanyAccess:
+        access = self.get_company_access(team.id, company_id)
+        if access is None:
+            access = TeamCompanyAccess(
+                team_id=team.id,
+                company_id=company_id,
+                client_id=team.client_id,
+                access_level=access_level,
+            )
+        else:
+            access.access_level = access_level
+        self.session.add(access)
+        self.session.flush()
+        self._invalidate_members(team)
+        return access
+
+    def remove_company_access(self, team: Team, company_id: str) -> bool:
+        access = self.get_company_access(team.id, company_id)
+        if access is None:
+            return False
+        self.session.delete(access)
+        self.session.flush()
+        self._invalidate_members(team)
+        return True
+
+    def _invalidate_members(self, team: Team) -> None:
+        for user_id in self.list_member_ids(team.id):
+            invalidate_company_access(user_id, team.client_id)
@@ -2,10 +2,61 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from itertools import islice, product
+from typing import Iterable, Iterator
+import uuid
+
+from sqlalchemy import String, case, delete, func, select, type_coerce, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.common.access_levels import ACCESS_LEVEL_ORDER, merge_access_levels
+from app.common.acl_cache import invalidate_company_access
 from app.extensions import db
+from app.models.team import team_members
+from app.models.team_company_access import TeamCompanyAccess
 from app.models.user_company_access import UserCompanyAccess
 
 
+def access_grant_selects(user_id: str, client_id: str, company_ids: list[str] | None = None) -> list:
+    """SELECTs of (company_id, access_level) granted to the user directly and via teams.
+
+    The direct branch uses ix_user_company_access_client_user; the team branch
+    walks ix_team_members_user_team into uq_team_company_access_team_company.
+    A company may appear in several rows; the effective level is the highest.
+    """
+    direct = select(
+        UserCompanyAccess.company_id,
+        type_coerce(UserCompanyAccess.access_level, String).label("access_level"),
+    ).where(UserCompanyAccess.client_id == client_id, UserCompanyAccess.user_id == user_id)
+    via_team = (
+        select(
+            TeamCompanyAccess.company_id,
+            type_coerce(TeamCompanyAccess.access_level, String).label("access_level"),
+        )
+        .join(team_members, team_members.c.team_id == TeamCompanyAccess.team_id)
+        .where(team_members.c.user_id == user_id, TeamCompanyAccess.client_id == client_id)
+    )
+    if company_ids is not None:
+        direct = direct.where(UserCompanyAccess.company_id.in_(company_ids))
+        via_team = via_team.where(TeamCompanyAccess.company_id.in_(company_ids))
+    return [direct, via_team]
+
+
+def effective_access_subquery(user_id: str, client_id: str):
+    """Subquery of (company_id, access_level) with one row per accessible company."""
+    grants = union_all(*access_grant_selects(user_id, client_id)).subquery()
+    rank = func.max(
+        case({level.value: order for level, order in ACCESS_LEVEL_ORDER.items()}, value=grants.c.access_level)
+    )
+    access_level = case({order: level.value for level, order in ACCESS_LEVEL_ORDER.items()}, value=rank)
+    return (
+        select(grants.c.company_id, access_level.label("access_level"))
+        .group_by(grants.c.company_id)
+        .subquery("effective_access")
+    )
+
+
 class UserCompanyAccessRepository:
     """Data access layer for UserCompanyAccess."""
 
@@ -29,15 +80,24 @@ class UserCompanyAccessRepository:
         )
 
     def list_company_ids_for_user(self, user_id: str, client_id: str) -> list[str]:
-        rows = (
-            self.session.query(UserCompanyAccess.company_id)
-            .filter(
-                UserCompanyAccess.user_id == user_id,
-                UserCompanyAccess.client_id == client_id,
-            )
-            .all()
-        )
-        return [row[0] for row in rows]
+        return list(self.get_access_map(user_id, client_id))
+
+    def get_access_map(self, user_id: str, client_id: str) -> dict[str, str]:
+        """Return company_id -> effective access_level for every company the user can access."""
+        statement = union_all(*access_grant_selects(user_id, client_id))
+        return merge_access_levels(self.session.execute(statement).all())
+
+    def get_access_levels(
+        self,
+        user_id: str,
+        company_ids: list[str],
+        client_id: str,
+    ) -> dict[str, str]:
+        """Return company_id -> effective access_level for the given companies in one query."""
+        if not company_ids:
+            return {}
+        statement = union_all(*access_grant_selects(user_id, client_id, company_ids))
+        return merge_access_levels(self.session.execute(statement).all())
 
     def upsert_access(
         self,
@@ -59,6 +119,7 @@ class UserCompanyAccessRepository:
             access.access_level = access_level
             self.session.add(access)
         self.session.flush()
+        invalidate_company_access(user_id, client_id)
         return access
 
     def remove_access(self, user_id: str, company_id: str, client_id: str) -> bool:
@@ -67,4 +128,99 @@ class UserCompanyAccessRepository:
             return False
         self.session.delete(access)
         self.session.flush()
+        invalidate_company_access(user_id, client_id)
         return True
+
+    def bulk_upsert_access(
+        self,
+        user_ids: list[str],
+        company_ids: list[str],
+        client_id: str,
+        access_level: str,
+        chunk_size: int = 500,
+    ) -> int:
+        """Grant access_level on every (user, company) pair with chunked native upserts.
+
+        Uses ``INSERT ... ON CONFLICT (user_id, company_id) DO UPDATE`` and only
+        touches rows whose level changes, so the result counts inserted plus
+        updated rows. Nothing is committed here.
+        """
+        insert = _dialect_insert(self.session)
+        if insert is None:
+            affected = 0
+            for user_id, company_id in product(user_ids, company_ids):
+                access = self.get_user_access(user_id, company_id, client_id)
+                if access is None or access.access_level != access_level:
+                    self.upsert_access(user_id, company_id, client_id, access_level)
+                    affected += 1
+            return affected
+
+        now = datetime.now(timezone.utc)
+        rows = (
+            {
+                "id": str(uuid.uuid4()),
+                "client_id": client_id,
+                "user_id": user_id,
+                "company_id": company_id,
+                "access_level": access_level,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_id, company_id in product(user_ids, company_ids)
+        )
+        affected = 0
+        for chunk in _chunks(rows, chunk_size):
+            statement = insert(UserCompanyAccess).values(chunk)
+            statement = statement.on_conflict_do_update(
+                index_elements=[UserCompanyAccess.user_id, UserCompanyAccess.company_id],
+                set_={
+                    "access_level": statement.excluded.access_level,
+                    "updated_at": statement.excluded.updated_at,
+                },
+                where=UserCompanyAccess.access_level != statement.excluded.access_level,
+            )
+            affected += self.session.execute(statement).rowcount
+        self._invalidate(user_ids, client_id)
+        return affected
+
+    def bulk_remove_access(
+        self,
+        user_ids: list[str],
+        company_ids: list[str],
+        client_id: str,
+        chunk_size: int = 500,
+    ) -> int:
+        """Delete access for every (user, company) pair; returns the rows removed."""
+        affected = 0
+        for user_chunk in _chunks(user_ids, chunk_size):
+            for company_chunk in _chunks(company_ids, chunk_size):
+                statement = delete(UserCompanyAccess).where(
+                    UserCompanyAccess.client_id == client_id,
+                    UserCompanyAccess.user_id.in_(user_chunk),
+                    UserCompanyAccess.company_id.in_(company_chunk),
+                )
+                affected += self.session.execute(
+                    statement, execution_options={"synchronize_session": False}
+                ).rowcount
+        self._invalidate(user_ids, client_id)
+        return affected
+
+    @staticmethod
+    def _invalidate(user_ids: Iterable[str], client_id: str) -> None:
+        for user_id in user_ids:
+            invalidate_company_access(user_id, client_id)
+
+
+def _dialect_insert(session):
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    return None
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
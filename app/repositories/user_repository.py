@@ -33,6 +33,17 @@ class UserRepository:
             .all()
         )
 
+    def list_existing_ids(self, user_ids: list[str], client_id: str) -> set[str]:
+        """Return which of user_ids belong to the tenant."""
+        if not user_ids:
+            return set()
+        rows = (
+            self.session.query(User.id)
+            .filter(User.client_id == client_id, User.id.in_(user_ids))
+            .all()
+        )
+        return {row[0] for row in rows}
+
     def create(self, user: User) -> User:
         self.session.add(user)
         self.session.flush()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from app.common.rbac_version import bump_rbac_version
 from app.extensions import db
 from app.models.role import Role
 from app.models.user import User
@@ -21,6 +22,7 @@ class UserRoleRepository:
         if role not in user.roles:
             user.roles.append(role)
             self.session.flush()
+            bump_rbac_version(self.session)
 
     def remove_role(self, user_id: str, role_id: str) -> None:
         user = self.session.get(User, user_id)
@@ -30,6 +32,7 @@ class UserRoleRepository:
         if role in user.roles:
             user.roles.remove(role)
             self.session.flush()
+            bump_rbac_version(self.session)
 
     def list_user_roles(self, user_id: str) -> list[Role]:
         user = self.session.get(User, user_id)
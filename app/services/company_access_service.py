@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
-from werkzeug.exceptions import Forbidden, NotFound
+from typing import Sequence
+
+from flask import current_app
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound
 
 from app.common.access_levels import access_level_ge
+from app.common.acl_cache import get_cached_access_map, store_access_map
+from app.modules.companies.repository import CompanyRepository
 from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_repository import UserRepository
 
 
 class CompanyAccessService:
-    """Service for evaluating company access levels."""
+    """Service for evaluating company access levels.
+
+    Checks read the user's ``company_id -> access_level`` map, loaded once per
+    request (and kept per worker when COMPANY_ACCESS_CACHE_SIZE is set).
+    """
 
-    def __init__(self, repository: UserCompanyAccessRepository | None = None) -> None:
+    def __init__(
+        self,
+        repository: UserCompanyAccessRepository | None = None,
+        user_repository: UserRepository | None = None,
+        company_repository: CompanyRepository | None = None,
+    ) -> None:
         self.repository = repository or UserCompanyAccessRepository()
+        self.user_repository = user_repository or UserRepository()
+        self.company_repository = company_repository or CompanyRepository()
 
     def require_access(
         self,
@@ -20,13 +37,61 @@ class CompanyAccessService:
         company_id: str,
         client_id: str,
         required_level: str,
-    ):
-        access = self.repository.get_user_access(user_id, company_id, client_id)
-        if access is None:
+    ) -> str:
+        access_level = self.get_access_map(user_id, client_id).get(str(company_id))
+        if access_level is None:
             raise NotFound("Company access not found.")
-        if not access_level_ge(access.access_level, required_level):
+        if not access_level_ge(access_level, required_level):
             raise Forbidden("Insufficient access level.")
-        return access
+        return access_level
+
+    def get_access_map(self, user_id: str, client_id: str) -> dict[str, str]:
+        access_map = get_cached_access_map(user_id, client_id)
+        if access_map is None:
+            access_map = self.repository.get_access_map(user_id, client_id)
+            store_access_map(user_id, client_id, access_map)
+        return access_map
+
+    def get_access_levels(self, user_id: str, client_id: str, company_ids: list[str]) -> dict[str, str]:
+        access_map = get_cached_access_map(user_id, client_id)
+        if access_map is not None:
+            return {company_id: access_map[company_id] for company_id in company_ids if company_id in access_map}
+        return self.repository.get_access_levels(user_id, sorted(set(company_ids)), client_id)
 
     def get_allowed_company_ids(self, user_id: str, client_id: str) -> set[str]:
-        return set(self.repository.list_company_ids_for_user(user_id, client_id))
+        return set(self.get_access_map(user_id, client_id))
+
+    def bulk_grant(
+        self,
+        client_id: str,
+        user_ids: Sequence[str],
+        company_ids: Sequence[str],
+        access_level: str,
+    ) -> dict[str, int]:
+        """Grant access_level on users x companies; the caller commits."""
+        self._ensure_tenant_members(client_id, user_ids, company_ids)
+        affected = self.repository.bulk_upsert_access(
+            list(user_ids),
+            list(company_ids),
+            client_id,
+            access_level,
+            chunk_size=current_app.config.get("COMPANY_ACCESS_BULK_CHUNK_SIZE", 500),
+        )
+        return {"pairs": len(user_ids) * len(company_ids), "affected": affected}
+
+    def bulk_revoke(self, client_id: str, user_ids: Sequence[str], company_ids: Sequence[str]) -> dict[str, int]:
+        """Revoke access on users x companies; the caller commits."""
+        self._ensure_tenant_members(client_id, user_ids, company_ids)
+        affected = self.repository.bulk_remove_access(
+            list(user_ids),
+            list(company_ids),
+            client_id,
+            chunk_size=current_app.config.get("COMPANY_ACCESS_BULK_CHUNK_SIZE", 500),
+        )
+        return {"pairs": len(user_ids) * len(company_ids), "affected": affected}
+
+    def _ensure_tenant_members(self, client_id: str, user_ids: Sequence[str], company_ids: Sequence[str]) -> None:
+        if len(self.user_repository.list_existing_ids(list(user_ids), client_id)) != len(set(user_ids)):
+            raise BadRequest("user_not_found")
+        if len(self.company_repository.list_existing_ids(list(company_ids), client_id)) != len(set(company_ids)):
+            raise BadRequest("company_not_found")
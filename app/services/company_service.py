@@ -10,7 +10,8 @@ class CompanyService(ModuleCompanyService):
     """# DEPRECATED: use app.modules.companies.service.CompanyService."""
 
     def list_companies(self, user_id: str, client_id: str) -> list[Company]:
-        return super().list_companies(client_id=client_id, user_id=user_id)
+        page = super().list_companies(client_id=client_id, user_id=user_id)
+        return [company for company, _ in page.items]
 
     def get_company(self, company_id: str, client_id: str) -> Company:
         return super().get_company(client_id=client_id, company_id=company_id)
@@ -8,8 +8,10 @@ import hashlib
 import secrets
 
 from werkzeug.exceptions import BadRequest, Conflict
-from werkzeug.security import generate_password_hash
 
+from app.common.passwords import hash_password
+from app.common.principals import invalidate_principal
+from app.common.sharding import bind_tenant, locate_tenants
 from app.models.user import User
 from app.models.user_invitation import UserInvitation
 from app.repositories.user_invitation_repository import UserInvitationRepository
@@ -109,6 +111,11 @@ class InvitationService:
         self.validate_password(password)
 
         token_hash = self.hash_token(token)
+        client_ids = locate_tenants(lambda session: _invitation_client_ids(session, token_hash))
+        if not client_ids:
+            raise BadRequest("token_invalid")
+        # The link carries no tenant; the invitation and user live on its shard.
+        bind_tenant(client_ids[0])
         invitation = self.invitation_repository.get_by_token_hash(token_hash)
         if invitation is None:
             raise BadRequest("token_invalid")
@@ -126,10 +133,16 @@ class InvitationService:
         if user.status == "disabled":
             raise Conflict("user_disabled")
 
-        user.password_hash = generate_password_hash(password)
+        user.password_hash = hash_password(password)
         user.status = "active"
         self.user_repository.update(user)
+        invalidate_principal(user.id, user.client_id)
 
         invitation.used_at = self._current_time(invitation.expires_at)
         self.invitation_repository.update(invitation)
         return user
+
+
+def _invitation_client_ids(session, token_hash: str) -> list[str]:
+    invitation = UserInvitationRepository(session).get_by_token_hash(token_hash)
+    return [invitation.client_id] if invitation is not None else []
@@ -0,0 +1,129 @@
+"""Refresh token service layer."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import secrets
+import uuid
+
+from flask import current_app
+from werkzeug.exceptions import BadRequest, Forbidden, HTTPException, Unauthorized
+
+from app.common.principals import load_principal
+from app.common.revocation import signed_out_since
+from app.common.sharding import bind_tenant, locate_tenants
+from app.common.tenant_registry import ensure_tenant_active
+from app.models.refresh_token import RefreshToken
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+
+@dataclass(frozen=True)
+class RefreshTokenResult:
+    refresh_token: RefreshToken
+    token: str
+
+
+class RefreshTokenService:
+    """Issue and rotate refresh tokens with reuse detection.
+
+    Only a SHA-256 of each token is stored, so renewal costs one indexed
+    lookup instead of a password hash verification.
+    """
+
+    def __init__(self, repository: RefreshTokenRepository | None = None) -> None:
+        self.repository = repository or RefreshTokenRepository()
+
+    @staticmethod
+    def generate_token() -> str:
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def ttl() -> timedelta:
+        return timedelta(days=current_app.config.get("REFRESH_TOKEN_TTL_DAYS", 30))
+
+    @staticmethod
+    def _current_time(reference: datetime | None = None) -> datetime:
+        if reference is not None and reference.tzinfo is None:
+            return datetime.now(timezone.utc).replace(tzinfo=None)
+        return datetime.now(timezone.utc)
+
+    def issue(self, user_id: str, client_id: str, family_id: str | None = None) -> RefreshTokenResult:
+        token = self.generate_token()
+        refresh_token = RefreshToken(
+            client_id=client_id,
+            user_id=user_id,
+            family_id=family_id or str(uuid.uuid4()),
+            token_hash=self.hash_token(token),
+            expires_at=self._current_time() + self.ttl(),
+        )
+        self.repository.create(refresh_token)
+        return RefreshTokenResult(refresh_token=refresh_token, token=token)
+
+    def rotate(self, token: str, client_id: str | None = None) -> RefreshTokenResult:
+        """Consume a refresh token and issue its successor in the same family.
+
+        Presenting a token that was already rotated or revoked, one whose tenant
+        or user is no longer active, or one issued up to a forced sign-out of
+        its user revokes the whole family; the caller must commit before
+        propagating the error. Without client_id the token's tenant is looked
+        up on every shard.
+        """
+        if not token:
+            raise BadRequest("refresh_token_required")
+
+        token_hash = self.hash_token(token)
+        if not client_id:
+            client_ids = locate_tenants(lambda session: _refresh_token_client_ids(session, token_hash))
+            client_id = client_ids[0] if client_ids else None
+        if client_id:
+            # Refresh tokens live on their tenant's shard.
+            bind_tenant(str(client_id))
+        current = self.repository.get_by_token_hash(token_hash)
+        if current is None:
+            raise Unauthorized("refresh_token_invalid")
+
+        now = self._current_time(current.expires_at)
+        if current.used_at is not None or current.revoked_at is not None:
+            self.repository.revoke_family(current.family_id, current.client_id, now)
+            raise Unauthorized("refresh_token_reused")
+        if current.expires_at <= now:
+            raise Unauthorized("refresh_token_expired")
+
+        try:
+            ensure_tenant_active(current.client_id)
+            principal = load_principal(current.user_id, current.client_id)
+            if principal is None:
+                raise Unauthorized("invalid_credentials")
+            if principal.status != "active":
+                raise Forbidden("user_inactive")
+            # Catches a successor minted by a rotation that raced a forced sign-out.
+            if signed_out_since(current.user_id, current.created_at):
+                raise Unauthorized("refresh_token_revoked")
+        except HTTPException:
+            # A suspended, disabled or signed-out user must sign in again.
+            self.repository.revoke_family(current.family_id, current.client_id, now)
+            raise
+
+        if not self.repository.mark_used(current.id, now):
+            self.repository.revoke_family(current.family_id, current.client_id, now)
+            raise Unauthorized("refresh_token_reused")
+        return self.issue(current.user_id, current.client_id, family_id=current.family_id)
+
+    def revoke(self, token: str, user_id: str, client_id: str) -> bool:
+        """Revoke the family of a refresh token owned by user_id; False if not found."""
+        current = self.repository.get_by_token_hash(self.hash_token(token))
+        if current is None or current.user_id != user_id or current.client_id != client_id:
+            return False
+        self.repository.revoke_family(current.family_id, client_id, self._current_time(current.expires_at))
+        return True
+
+
+def _refresh_token_client_ids(session, token_hash: str) -> list[str]:
+    refresh_token = RefreshTokenRepository(session).get_by_token_hash(token_hash)
+    return [refresh_token.client_id] if refresh_token is not None else []
@@ -0,0 +1,60 @@
+"""Service layer for teams and team-based company access."""
+
+from __future__ import annotations
+
+from werkzeug.exceptions import Conflict, NotFound
+
+from app.models.team import Team
+from app.models.team_company_access import TeamCompanyAccess
+from app.modules.companies.repository import CompanyRepository
+from app.repositories.team_repository import TeamRepository
+from app.repositories.user_repository import UserRepository
+
+
+class TeamService:
+    """Manage teams; members inherit every company access granted to the team."""
+
+    def __init__(
+        self,
+        repository: TeamRepository | None = None,
+        user_repository: UserRepository | None = None,
+        company_repository: CompanyRepository | None = None,
+    ) -> None:
+        self.repository = repository or TeamRepository()
+        self.user_repository = user_repository or UserRepository()
+        self.company_repository = company_repository or CompanyRepository()
+
+    def create_team(self, client_id: str, name: str) -> Team:
+        if self.repository.get_by_name(name, client_id) is not None:
+            raise Conflict("team_name_taken")
+        return self.repository.create(Team(client_id=client_id, name=name))
+
+    def get_team(self, client_id: str, team_id: str) -> Team:
+        team = self.repository.get_by_id(team_id, client_id)
+        if team is None:
+            raise NotFound("Team not found.")
+        return team
+
+    def add_member(self, client_id: str, team_id: str, user_id: str) -> bool:
+        team = self.get_team(client_id, team_id)
+        if self.user_repository.get_by_id(user_id, client_id) is None:
+            raise NotFound("User not found.")
+        return self.repository.add_member(team, user_id)
+
+    def remove_member(self, client_id: str, team_id: str, user_id: str) -> bool:
+        return self.repository.remove_member(self.get_team(client_id, team_id), user_id)
+
+    def grant_company_access(
+        self,
+        client_id: str,
+        team_id: str,
+        company_id: str,
+        access_level: str,
+    ) -> TeamCompanyAccess:
+        team = self.get_team(client_id, team_id)
+        if self.company_repository.get_by_id(company_id, client_id) is None:
+            raise NotFound("Company not found.")
+        return self.repository.upsert_company_access(team, company_id, access_level)
+
+    def revoke_company_access(self, client_id: str, team_id: str, company_id: str) -> bool:
+        return self.repository.remove_company_access(self.get_team(client_id, team_id), company_id)
@@ -0,0 +1,77 @@
+"""Access token revocation service layer."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from werkzeug.exceptions import BadRequest
+
+from app.common.jwt import access_token_lifetime
+from app.common.revocation import rebuild_revocations, remember_revocation, user_revocation_key
+from app.models.revoked_token import RevokedToken
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+class TokenRevocationService:
+    """Record revoked access tokens for logout and forced sign-out."""
+
+    def __init__(
+        self,
+        repository: RevokedTokenRepository | None = None,
+        refresh_token_repository: RefreshTokenRepository | None = None,
+    ) -> None:
+        self.repository = repository or RevokedTokenRepository()
+        self.refresh_token_repository = refresh_token_repository or RefreshTokenRepository()
+
+    def revoke_token(self, claims: dict[str, Any]) -> RevokedToken:
+        """Revoke a single access token until it would have expired anyway."""
+        jti = claims.get("jti")
+        if not jti:
+            raise BadRequest("token_not_revocable")
+        existing = self.repository.get_by_jti(str(jti))
+        if existing is not None:
+            return existing
+        now = datetime.now(timezone.utc)
+        revoked_token = self.repository.create(
+            RevokedToken(
+                jti=str(jti),
+                client_id=str(claims["client_id"]),
+                user_id=str(claims["sub"]),
+                revoked_at=now,
+                expires_at=datetime.fromtimestamp(int(claims["exp"]), timezone.utc),
+            )
+        )
+        remember_revocation(revoked_token.jti)
+        return revoked_token
+
+    def revoke_user(self, user_id: str, client_id: str) -> RevokedToken:
+        """Revoke every access and refresh token issued to the user so far."""
+        # Whole seconds like iat: tokens minted during this second are revoked too.
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        key = user_revocation_key(user_id)
+        existing = self.repository.get_by_jti(key)
+        if existing is not None:
+            # Re-insert rather than update so other workers see a new id on refresh.
+            self.repository.delete(existing)
+        revoked_token = self.repository.create(
+            RevokedToken(
+                jti=key,
+                client_id=client_id,
+                user_id=user_id,
+                revoked_at=now,
+                # Outlives every access token issued before now.
+                expires_at=now + access_token_lifetime(),
+            )
+        )
+        self.refresh_token_repository.revoke_user(user_id, client_id, now)
+        remember_revocation(key)
+        return revoked_token
+
+    def prune_expired(self, now: datetime | None = None) -> int:
+        """Delete entries whose tokens have expired; filters are rebuilt without them."""
+        deleted = self.repository.delete_expired(now or datetime.now(timezone.utc))
+        if deleted:
+            rebuild_revocations()
+        return deleted
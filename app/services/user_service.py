@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from werkzeug.security import check_password_hash, generate_password_hash
-
+from app.common.passwords import hash_password, password_needs_rehash, verify_password
+from app.common.principals import invalidate_principal
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 
@@ -32,18 +32,31 @@ class UserService:
         user = self.repository.get_by_id(user_id, client_id)
         if not user:
             return None
-        user.password_hash = generate_password_hash(password)
+        user.password_hash = hash_password(password)
         user.status = "active"
-        return self.repository.update(user)
+        self.repository.update(user)
+        invalidate_principal(user.id, user.client_id)
+        return user
 
     def disable_user(self, user_id: str, client_id: str) -> User | None:
         user = self.repository.get_by_id(user_id, client_id)
         if not user:
             return None
         user.status = "disabled"
-        return self.repository.update(user)
+        self.repository.update(user)
+        invalidate_principal(user.id, user.client_id)
+        return user
 
     def verify_password(self, user: User, password: str) -> bool:
         if not user.password_hash:
             return False
-        return check_password_hash(user.password_hash, password)
+        return verify_password(user.password_hash, password)
+
+    def needs_rehash(self, user: User) -> bool:
+        if not user.password_hash:
+            return False
+        return password_needs_rehash(user.password_hash)
+
+    def rehash_password(self, user: User, password: str) -> User:
+        user.password_hash = hash_password(password)
+        return self.repository.update(user)
@@ -5,6 +5,8 @@
   const tbody = table.querySelector('tbody');
   const message = document.getElementById('companies-message');
   const refreshButton = document.getElementById('refresh-companies');
+  const moreButton = document.getElementById('more-companies');
+  let nextCursor = null;
 
   const setMessage = (text, isError = false) => {
     message.textContent = text;
@@ -17,10 +19,10 @@
     return { Authorization: `Bearer ${token}` };
   };
 
-  const renderCompanies = (companies) => {
-    tbody.innerHTML = '';
+  const renderCompanies = (companies, append = false) => {
+    if (!append) tbody.innerHTML = '';
 
-    if (!companies.length) {
+    if (!append && !companies.length) {
       tbody.innerHTML = '<tr><td colspan="4" class="ff-empty">No hay empresas disponibles.</td></tr>';
       return;
     }
@@ -39,16 +41,26 @@
     });
   };
 
-  const loadCompanies = async () => {
+  const setNextCursor = (cursor) => {
+    nextCursor = cursor || null;
+    if (moreButton) moreButton.hidden = !nextCursor;
+  };
+
+  const loadCompanies = async (append = false) => {
     const headers = getAuthHeaders();
     if (!headers) {
       setMessage('Debes iniciar sesión para consultar empresas.', true);
       return;
     }
 
+    const params = new URLSearchParams();
+    if (append && nextCursor) params.set('cursor', nextCursor);
+    const query = params.toString();
+
     setMessage('Cargando empresas…');
+    if (moreButton) moreButton.disabled = true;
     try {
-      const response = await fetch('/companies', { headers });
+      const response = await fetch(query ? `/companies?${query}` : '/companies', { headers });
       const data = await response.json();
 
       if (!response.ok) {
@@ -56,13 +68,17 @@
         return;
       }
 
-      renderCompanies(data.companies || []);
+      renderCompanies(data.companies || [], append);
+      setNextCursor(data.next_cursor);
       setMessage('');
     } catch (error) {
       setMessage('Error de red al consultar empresas.', true);
+    } finally {
+      if (moreButton) moreButton.disabled = false;
     }
   };
 
-  refreshButton?.addEventListener('click', loadCompanies);
+  refreshButton?.addEventListener('click', () => loadCompanies());
+  moreButton?.addEventListener('click', () => loadCompanies(true));
   loadCompanies();
 })();
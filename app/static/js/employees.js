@@ -6,6 +6,8 @@
   const tbody = table.querySelector('tbody');
   const message = document.getElementById('employees-message');
   const refreshButton = document.getElementById('refresh-employees');
+  const moreButton = document.getElementById('more-employees');
+  let nextCursor = null;
 
   const setMessage = (text, isError = false) => {
     message.textContent = text;
@@ -18,10 +20,10 @@
     return;
   }
 
-  const renderEmployees = (employees) => {
-    tbody.innerHTML = '';
+  const renderEmployees = (employees, append = false) => {
+    if (!append) tbody.innerHTML = '';
 
-    if (!employees.length) {
+    if (!append && !employees.length) {
       tbody.innerHTML = '<tr><td colspan="4" class="ff-empty">No hay empleados para esta empresa.</td></tr>';
       return;
     }
@@ -38,10 +40,20 @@
     });
   };
 
-  const loadEmployees = async () => {
+  const setNextCursor = (cursor) => {
+    nextCursor = cursor || null;
+    if (moreButton) moreButton.hidden = !nextCursor;
+  };
+
+  const loadEmployees = async (append = false) => {
+    const params = new URLSearchParams();
+    if (append && nextCursor) params.set('cursor', nextCursor);
+    const query = params.toString();
+
     setMessage('Cargando empleados…');
+    if (moreButton) moreButton.disabled = true;
     try {
-      const response = await fetch(`/companies/${companyId}/employees`, {
+      const response = await fetch(`/companies/${companyId}/employees${query ? `?${query}` : ''}`, {
         headers: { Authorization: `Bearer ${token}` },
       });
       const data = await response.json();
@@ -51,13 +63,17 @@
         return;
       }
 
-      renderEmployees(data.employees || []);
+      renderEmployees(data.employees || [], append);
+      setNextCursor(data.next_cursor);
       setMessage('');
     } catch (error) {
       setMessage('Error de red al consultar empleados.', true);
+    } finally {
+      if (moreButton) moreButton.disabled = false;
     }
   };
 
-  refreshButton?.addEventListener('click', loadEmployees);
+  refreshButton?.addEventListener('click', () => loadEmployees());
+  moreButton?.addEventListener('click', () => loadEmployees(true));
   loadEmployees();
 })();
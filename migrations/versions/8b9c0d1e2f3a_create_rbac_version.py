@@ -0,0 +1,24 @@
+"""create rbac_version table"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "8b9c0d1e2f3a"
+down_revision = "7a8b9c0d1e2f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rbac_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rbac_version")
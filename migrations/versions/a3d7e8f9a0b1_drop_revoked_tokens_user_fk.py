@@ -0,0 +1,37 @@
+"""drop revoked_tokens.user_id foreign key so sharded tenants can revoke tokens"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a3d7e8f9a0b1"
+down_revision = "f2c6d7e8f9a0"
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys are unnamed; batch mode needs a convention to address them.
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+USER_FK = "fk_revoked_tokens_user_id_users"
+
+
+def upgrade() -> None:
+    # revoked_tokens is a control table on the default database, but a sharded
+    # tenant's users only exist on its shard.
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        names = [USER_FK]
+    else:
+        names = [
+            foreign_key["name"]
+            for foreign_key in sa.inspect(bind).get_foreign_keys("revoked_tokens")
+            if foreign_key["referred_table"] == "users"
+        ]
+    with op.batch_alter_table("revoked_tokens", naming_convention=NAMING_CONVENTION) as batch_op:
+        for name in names:
+            batch_op.drop_constraint(name, type_="foreignkey")
+        batch_op.create_index("ix_revoked_tokens_user_id", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("revoked_tokens", naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_index("ix_revoked_tokens_user_id")
+        batch_op.create_foreign_key(USER_FK, "users", ["user_id"], ["id"])
@@ -0,0 +1,69 @@
+"""create teams, team_members and team_company_access tables"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "be2f3a4b5c6d"
+down_revision = "ad1e2f3a4b5c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "teams",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("client_id", sa.String(length=36), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["client_id"], ["clients.id"]),
+        sa.UniqueConstraint("client_id", "name", name="uq_teams_client_name"),
+    )
+    op.create_index("ix_teams_client_id", "teams", ["client_id"], unique=False)
+
+    op.create_table(
+        "team_members",
+        sa.Column("team_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.UniqueConstraint("team_id", "user_id", name="uq_team_members_team_user"),
+    )
+    op.create_index("ix_team_members_user_team", "team_members", ["user_id", "team_id"], unique=False)
+
+    access_level = sa.Enum("viewer", "operator", "manager", "admin", name="company_access_level")
+    if op.get_bind().dialect.name == "postgresql":
+        # The enum type already exists for user_company_access.
+        access_level = postgresql.ENUM(
+            "viewer", "operator", "manager", "admin", name="company_access_level", create_type=False
+        )
+    op.create_table(
+        "team_company_access",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("client_id", sa.String(length=36), nullable=False),
+        sa.Column("team_id", sa.String(length=36), nullable=False),
+        sa.Column("company_id", sa.String(length=36), nullable=False),
+        sa.Column("access_level", access_level, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["client_id"], ["clients.id"]),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"]),
+        sa.UniqueConstraint("team_id", "company_id", name="uq_team_company_access_team_company"),
+    )
+    op.create_index("ix_team_company_access_client_id", "team_company_access", ["client_id"], unique=False)
+    op.create_index("ix_team_company_access_company_id", "team_company_access", ["company_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_team_company_access_company_id", table_name="team_company_access")
+    op.drop_index("ix_team_company_access_client_id", table_name="team_company_access")
+    op.drop_table("team_company_access")
+    op.drop_index("ix_team_members_user_team", table_name="team_members")
+    op.drop_table("team_members")
+    op.drop_index("ix_teams_client_id", table_name="teams")
+    op.drop_table("teams")
@@ -0,0 +1,38 @@
+"""add tenant-leading composite indexes matching repository queries"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "cf3a4b5c6d7e"
+down_revision = "be2f3a4b5c6d"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, unique)
+INDEXES = [
+    ("ix_employees_client_company_name", "employees", ["client_id", "company_id", "full_name"], False),
+    ("ix_companies_client_name", "companies", ["client_id", "name"], False),
+    ("ix_users_email_status", "users", ["email", "status"], False),
+    ("ix_roles_client_scope_name", "roles", ["client_id", "scope", "name"], False),
+    ("ix_refresh_tokens_client_user", "refresh_tokens", ["client_id", "user_id"], False),
+    ("ix_user_invitations_token_hash", "user_invitations", ["token_hash"], True),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns, unique in INDEXES:
+        # user_invitations is created outside this migration chain in some installs.
+        if inspector.has_table(table):
+            op.create_index(name, table, columns, unique=unique)
+    # Team grants are reached through team_members; a tenant-only index made the
+    # planner walk every grant in the tenant instead.
+    op.drop_index("ix_team_company_access_client_id", table_name="team_company_access")
+
+
+def downgrade() -> None:
+    op.create_index("ix_team_company_access_client_id", "team_company_access", ["client_id"], unique=False)
+    inspector = sa.inspect(op.get_bind())
+    for name, table, _, _ in reversed(INDEXES):
+        if inspector.has_table(table):
+            op.drop_index(name, table_name=table)
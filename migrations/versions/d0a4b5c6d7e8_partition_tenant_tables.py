@@ -0,0 +1,27 @@
+"""optionally LIST-partition tenant tables by client_id (PostgreSQL only)"""
+
+from alembic import op
+from flask import current_app
+
+from app.common.partitioning import PARTITIONED_TABLES, partition_table, unpartition_table
+
+revision = "d0a4b5c6d7e8"
+down_revision = "cf3a4b5c6d7e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite and installs without TENANT_PARTITIONING keep plain tables; run
+    # `flask partition-tables` later to convert them.
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql" or current_app.config.get("TENANT_PARTITIONING", "none") != "list":
+        return
+    for table in PARTITIONED_TABLES:
+        partition_table(bind, table)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        unpartition_table(bind, table)
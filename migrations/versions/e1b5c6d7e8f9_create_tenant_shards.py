@@ -0,0 +1,25 @@
+"""create tenant_shards control table"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e1b5c6d7e8f9"
+down_revision = "d0a4b5c6d7e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_shards",
+        sa.Column("client_id", sa.String(length=36), nullable=False),
+        sa.Column("shard", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("client_id"),
+        sa.ForeignKeyConstraint(["client_id"], ["clients.id"]),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tenant_shards")
@@ -0,0 +1,33 @@
+"""append id to the list sort indexes for keyset pagination"""
+
+from alembic import op
+
+revision = "f2c6d7e8f9a0"
+down_revision = "e1b5c6d7e8f9"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns before, columns after)
+INDEXES = [
+    ("ix_companies_client_name", "companies", ["client_id", "name"], ["client_id", "name", "id"]),
+    (
+        "ix_employees_client_company_name",
+        "employees",
+        ["client_id", "company_id", "full_name"],
+        ["client_id", "company_id", "full_name", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    # Pages are read with (sort, id) > cursor ORDER BY sort, id; without the id
+    # tie-breaker in the index every page sorts all of the tenant's rows.
+    for name, table, _, columns in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, columns, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False)
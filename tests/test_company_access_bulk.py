@@ -0,0 +1,196 @@
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.extensions import db
+from app.models.client import Client
+from app.models.company import Company
+from app.models.role import Role
+from app.models.user import User
+from app.models.user_company_access import UserCompanyAccess
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_client(db_session, name: str = "Acme") -> Client:
+    client = Client(name=name)
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def create_user(db_session, client_id: str, email: str) -> User:
+    user = User(client_id=client_id, email=email, status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def create_companies(db_session, client_id: str, count: int) -> list[Company]:
+    companies = [
+        Company(client_id=client_id, name=f"Company {index}", tax_id=f"T-{index}")
+        for index in range(count)
+    ]
+    db_session.add_all(companies)
+    db_session.commit()
+    return companies
+
+
+def auth_header_for(user: User) -> dict[str, str]:
+    token = create_access_token(user.id, user.client_id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def assign_role(db_session, user: User, role_name: str) -> None:
+    role = Role.query.filter_by(name=role_name, scope="tenant", client_id=user.client_id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+
+
+def access_levels(user: User) -> dict[str, str]:
+    rows = UserCompanyAccess.query.filter_by(user_id=user.id).all()
+    return {row.company_id: row.access_level for row in rows}
+
+
+def bulk(client, admin: User, payload: dict):
+    g.pop("_authz_cache", None)
+    g.pop("_company_access_maps", None)
+    return client.post("/companies/access/bulk", json=payload, headers=auth_header_for(admin))
+
+
+def test_bulk_grant_upserts_and_reports_counts(client, db_session, app):
+    tenant = create_client(db_session)
+    admin = create_user(db_session, tenant.id, "admin@example.com")
+    advisors = [create_user(db_session, tenant.id, f"advisor{index}@example.com") for index in range(2)]
+    seed_rbac()
+    assign_role(db_session, admin, "Admin Cliente")
+    companies = create_companies(db_session, tenant.id, 5)
+    UserCompanyAccessRepository(db_session).upsert_access(advisors[0].id, companies[0].id, tenant.id, "viewer")
+    db_session.commit()
+    app.config["COMPANY_ACCESS_BULK_CHUNK_SIZE"] = 3
+
+    payload = {
+        "action": "grant",
+        "user_ids": [advisor.id for advisor in advisors],
+        "company_ids": [company.id for company in companies],
+        "access_level": "operator",
+    }
+    response = bulk(client, admin, payload)
+
+    assert response.status_code == 200
+    assert response.get_json() == {"action": "grant", "pairs": 10, "affected": 10}
+    for advisor in advisors:
+        assert access_levels(advisor) == {company.id: "operator" for company in companies}
+
+    response = bulk(client, admin, payload)
+    assert response.get_json()["affected"] == 0
+
+
+def test_bulk_grant_uses_chunked_statements(client, db_session, app):
+    tenant = create_client(db_session)
+    admin = create_user(db_session, tenant.id, "admin@example.com")
+    advisor = create_user(db_session, tenant.id, "advisor@example.com")
+    seed_rbac()
+    assign_role(db_session, admin, "Admin Cliente")
+    companies = create_companies(db_session, tenant.id, 40)
+    app.config["COMPANY_ACCESS_BULK_CHUNK_SIZE"] = 25
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO USER_COMPANY_ACCESS"):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = bulk(
+            client,
+            admin,
+            {
+                "action": "grant",
+                "user_ids": [advisor.id],
+                "company_ids": [company.id for company in companies],
+                "access_level": "viewer",
+            },
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.get_json()["affected"] == 40
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in statement.upper() for statement in statements)
+
+
+def test_bulk_revoke_deletes_pairs(client, db_session):
+    tenant = create_client(db_session)
+    admin = create_user(db_session, tenant.id, "admin@example.com")
+    advisor = create_user(db_session, tenant.id, "advisor@example.com")
+    seed_rbac()
+    assign_role(db_session, admin, "Admin Cliente")
+    companies = create_companies(db_session, tenant.id, 3)
+    repository = UserCompanyAccessRepository(db_session)
+    for company in companies:
+        repository.upsert_access(advisor.id, company.id, tenant.id, "viewer")
+    db_session.commit()
+
+    response = bulk(
+        client,
+        admin,
+        {"action": "revoke", "user_ids": [advisor.id], "company_ids": [companies[0].id, companies[1].id]},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {"action": "revoke", "pairs": 2, "affected": 2}
+    assert access_levels(advisor) == {companies[2].id: "viewer"}
+
+
+def test_bulk_access_rejects_foreign_ids(client, db_session):
+    tenant = create_client(db_session)
+    other_tenant = create_client(db_session, "Globex")
+    admin = create_user(db_session, tenant.id, "admin@example.com")
+    outsider = create_user(db_session, other_tenant.id, "outsider@example.com")
+    seed_rbac()
+    assign_role(db_session, admin, "Admin Cliente")
+    companies = create_companies(db_session, tenant.id, 1)
+
+    response = bulk(
+        client,
+        admin,
+        {
+            "action": "grant",
+            "user_ids": [outsider.id],
+            "company_ids": [companies[0].id],
+            "access_level": "viewer",
+        },
+    )
+
+    assert response.status_code == 400
+    assert access_levels(outsider) == {}
+
+
+def test_bulk_access_requires_user_management(client, db_session):
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id, "ops@example.com")
+    seed_rbac()
+    assign_role(db_session, user, "Operativo")
+    companies = create_companies(db_session, tenant.id, 1)
+
+    response = bulk(
+        client,
+        user,
+        {"action": "grant", "user_ids": [user.id], "company_ids": [companies[0].id], "access_level": "admin"},
+    )
+
+    assert response.status_code == 403
@@ -1,6 +1,9 @@
 import pytest
+from flask import g
+from sqlalchemy import event
 
 from app.cli import seed_rbac
+from app.common.acl_cache import init_company_access_cache
 from app.common.jwt import create_access_token
 from app.extensions import db
 from app.models.client import Client
@@ -73,6 +76,7 @@ def test_list_companies_filters_by_acl(client, db_session):
     assert response.status_code == 200
     payload = response.get_json()
     assert [company["id"] for company in payload["companies"]] == [company_a.id]
+    assert payload["companies"][0]["access_level"] == "viewer"
 
 
 def test_list_companies_without_acl_returns_empty(client, db_session):
@@ -163,3 +167,36 @@ def test_create_company_assigns_admin_access(client, db_session):
 
     assert access is not None
     assert access.access_level == "admin"
+
+
+def test_company_access_map_is_cached_per_worker_and_invalidated(app, client, db_session):
+    app.config["COMPANY_ACCESS_CACHE_SIZE"] = 16
+    init_company_access_cache(app)
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id)
+    seed_rbac()
+    assign_role(db_session, user, "Operativo")
+    company_a = create_company(db_session, tenant.id, "Alpha", "A-123")
+    company_b = create_company(db_session, tenant.id, "Beta", "B-456")
+    assign_access(db_session, user, company_a, "viewer")
+    headers = auth_header_for(user)
+    assert client.get(f"/companies/{company_a.id}", headers=headers).status_code == 200
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    g.pop("_company_access_maps", None)
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"/companies/{company_a.id}", headers=headers)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    assert not any("user_company_access" in statement for statement in statements)
+    assert client.get(f"/companies/{company_b.id}", headers=headers).status_code == 404
+
+    assign_access(db_session, user, company_b, "manager")
+    g.pop("_company_access_maps", None)
+    assert client.get(f"/companies/{company_b.id}", headers=headers).status_code == 200
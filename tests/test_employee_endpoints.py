@@ -1,6 +1,8 @@
 from datetime import date
 
 import pytest
+from flask import g
+from sqlalchemy import event
 
 from app.cli import seed_rbac
 from app.common.jwt import create_access_token
@@ -83,6 +85,20 @@ def assign_access(db_session, user: User, company: Company, level: str) -> None:
     db_session.commit()
 
 
+def record_queries(func) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return statements
+
+
 def test_viewer_can_list_but_not_create_employees(client, db_session):
     tenant = create_client(db_session)
     user = create_user(db_session, tenant.id)
@@ -205,3 +221,36 @@ def test_cross_company_employee_access_is_denied(client, db_session):
     )
 
     assert response.status_code == 404
+
+
+def test_update_employee_authorizes_in_one_round_trip(client, db_session):
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id)
+    seed_rbac()
+    assign_role(db_session, user, "Admin Cliente")
+    company = create_company(db_session, tenant.id, "Alpha", "A-123")
+    assign_access(db_session, user, company, "operator")
+    employee = create_employee(db_session, tenant.id, company.id)
+    headers = auth_header_for(user)
+    # Warm up the worker-level caches (token revocation snapshot, RBAC version).
+    client.get(f"/companies/{company.id}/employees/{employee.id}", headers=headers)
+    g.pop("_authz_cache", None)
+
+    responses = []
+    statements = record_queries(
+        lambda: responses.append(
+            client.patch(
+                f"/companies/{company.id}/employees/{employee.id}",
+                headers=headers,
+                json={"full_name": "Ada King"},
+            )
+        )
+    )
+
+    assert responses[0].status_code == 200
+    assert g.authz.access_level == "operator"
+    assert g.authz.has_permission("employee.write")
+    # Authorization, employee load, update and the post-commit reload.
+    assert len(statements) == 4
+    assert sum("UNION ALL" in statement for statement in statements) == 1
+    assert not any("FROM companies" in statement and "UNION" not in statement for statement in statements)
@@ -0,0 +1,122 @@
+import pytest
+from sqlalchemy import text
+
+from app.common.acl_cache import get_company_access_cache, invalidate_company_access
+from app.common.invalidation import (
+    FLUSH_ALL,
+    InvalidationBackend,
+    InvalidationBus,
+    SQLiteInvalidationBackend,
+    get_invalidation_bus,
+    init_invalidation_bus,
+    poll_invalidations,
+)
+from app.common.principals import Principal, get_principal_cache, invalidate_principal
+from app.common.rbac_version import bump_rbac_version, get_rbac_version
+from app.extensions import db
+
+
+def enable_bus(app, path: str) -> None:
+    app.config["INVALIDATION_BUS_BACKEND"] = "sqlite"
+    app.config["INVALIDATION_BUS_SQLITE_PATH"] = path
+    app.config["INVALIDATION_POLL_SECONDS"] = 0
+    app.config["PRINCIPAL_CACHE_SIZE"] = 16
+    app.config["COMPANY_ACCESS_CACHE_SIZE"] = 16
+    init_invalidation_bus(app)
+
+
+@pytest.fixture()
+def workers(app, tmp_path):
+    from app import create_app
+
+    other = create_app("testing")
+    path = str(tmp_path / "bus.sqlite3")
+    enable_bus(app, path)
+    enable_bus(other, path)
+    for worker in (app, other):
+        with worker.app_context():
+            db.create_all()
+            get_principal_cache().max_size = 16
+            get_company_access_cache().max_size = 16
+    return app, other
+
+
+def test_commit_evicts_principal_in_other_worker(workers):
+    app, other = workers
+    principal = Principal(id="u1", client_id="c1", status="active")
+    with other.app_context():
+        get_principal_cache().set(("u1", "c1"), principal)
+
+    with app.app_context():
+        invalidate_principal("u1", "c1")
+        db.session.commit()
+
+    with other.app_context():
+        assert get_principal_cache().get(("u1", "c1")) == principal
+        assert poll_invalidations(force=True) == 1
+        assert get_principal_cache().get(("u1", "c1")) is None
+
+
+def test_other_worker_polls_before_each_request(workers):
+    app, other = workers
+    with other.app_context():
+        get_company_access_cache().set(("u1", "c1"), {"company": "admin"})
+
+    with app.app_context():
+        invalidate_company_access("u1", "c1")
+        db.session.commit()
+
+    other.test_client().get("/health")
+    with other.app_context():
+        assert get_company_access_cache().get(("u1", "c1")) is None
+
+
+def test_rollback_discards_pending_keys(workers):
+    app, other = workers
+    with app.app_context():
+        db.session.execute(text("SELECT 1"))
+        invalidate_principal("u1", "c1")
+        db.session.rollback()
+        db.session.commit()
+        assert get_invalidation_bus().published == 0
+
+    with other.app_context():
+        assert poll_invalidations(force=True) == 0
+
+
+def test_rbac_bump_is_seen_without_waiting_for_ttl(workers):
+    app, other = workers
+    app.config["RBAC_VERSION_TTL_SECONDS"] = 3600
+    other.config["RBAC_VERSION_TTL_SECONDS"] = 3600
+    with other.app_context():
+        before = get_rbac_version()
+
+    with app.app_context():
+        bump_rbac_version()
+        db.session.commit()
+
+    with other.app_context():
+        assert get_rbac_version() == before
+        poll_invalidations(force=True)
+        assert get_rbac_version() == before + 1
+
+
+def test_flush_all_clears_every_topic(app, tmp_path):
+    backend = SQLiteInvalidationBackend(str(tmp_path / "bus.sqlite3"))
+    bus = InvalidationBus(backend, poll_seconds=0)
+    seen = []
+    handlers = {"principal": seen.append, "company_access": seen.append}
+
+    backend.publish([FLUSH_ALL, "principal:c1:u1", "unknown:key"])
+
+    assert bus.poll(handlers) == 3
+    assert seen == [None, None, "c1:u1"]
+
+
+def test_incomplete_backend_fails_when_built():
+    class PublishOnly(InvalidationBackend):
+        def publish(self, keys):
+            return None
+
+    with pytest.raises(TypeError):
+        PublishOnly()
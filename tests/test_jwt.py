@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from werkzeug.exceptions import Unauthorized
+
+from app.common.jwt import (
+    base64url_encode,
+    create_access_token,
+    decode_token,
+    get_token_cache,
+    init_jwt,
+)
+
+
+def test_decode_token_caches_verified_payload(app):
+    with app.app_context():
+        token = create_access_token("user-1", "client-1")
+        cache = get_token_cache()
+
+        first = decode_token(token)
+        second = decode_token(token)
+
+        assert first == second
+        assert first["sub"] == "user-1"
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+
+def test_cached_signature_rejects_different_payload(app):
+    with app.app_context():
+        token = create_access_token("user-1", "client-1")
+        decode_token(token)
+
+        header, _, signature = token.split(".")
+        forged_payload = base64url_encode(b'{"sub":"user-2","client_id":"client-1","exp":9999999999}')
+
+        with pytest.raises(Unauthorized):
+            decode_token(f"{header}.{forged_payload}.{signature}")
+
+
+def test_expired_cached_token_is_rejected(app, monkeypatch):
+    with app.app_context():
+        token = create_access_token("user-1", "client-1", expires_minutes=1)
+        decode_token(token)
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 120)
+
+        with pytest.raises(Unauthorized) as exc_info:
+            decode_token(token)
+        assert exc_info.value.description == "token_expired"
+
+
+def test_token_cache_is_bounded(app):
+    app.config["JWT_CACHE_SIZE"] = 2
+    with app.app_context():
+        init_jwt(app)
+        for index in range(5):
+            decode_token(create_access_token(f"user-{index}", "client-1"))
+
+        stats = get_token_cache().stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 3
+
+
+def test_key_rotation_keeps_previous_kid_valid(app):
+    app.config["JWT_SIGNING_KEYS"] = "2024-01:first-secret,2024-02:second-secret"
+    app.config["JWT_ACTIVE_KID"] = "2024-01"
+    with app.app_context():
+        init_jwt(app)
+        old_token = create_access_token("user-1", "client-1")
+
+        app.config["JWT_ACTIVE_KID"] = "2024-02"
+        init_jwt(app)
+        new_token = create_access_token("user-1", "client-1")
+
+        assert decode_token(old_token)["sub"] == "user-1"
+        assert decode_token(new_token)["sub"] == "user-1"
+        assert old_token.split(".")[2] != new_token.split(".")[2]
+
+
+def test_retired_kid_is_rejected(app):
+    app.config["JWT_SIGNING_KEYS"] = "2024-01:first-secret"
+    with app.app_context():
+        init_jwt(app)
+        token = create_access_token("user-1", "client-1")
+
+        app.config["JWT_SIGNING_KEYS"] = "2024-02:second-secret"
+        init_jwt(app)
+
+        with pytest.raises(Unauthorized):
+            decode_token(token)
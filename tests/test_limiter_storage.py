@@ -0,0 +1,59 @@
+import pytest
+from limits import parse
+from limits.errors import ConfigurationError
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+
+from app.common import limiter_storage
+from app.common.limiter_storage import SQLiteLimiterStorage
+
+
+@pytest.fixture()
+def uri(tmp_path):
+    return f"gestium+sqlite:///{tmp_path / 'limits.sqlite3'}"
+
+
+def test_scheme_is_registered_with_limits(uri):
+    assert isinstance(storage_from_string(uri), SQLiteLimiterStorage)
+    with pytest.raises(ConfigurationError):
+        storage_from_string("gestium+sqlite://")
+
+
+@pytest.mark.parametrize("strategy", [FixedWindowRateLimiter, SlidingWindowCounterRateLimiter])
+def test_workers_share_counters(uri, strategy):
+    # Two storages on one file stand in for two gunicorn workers.
+    first = strategy(storage_from_string(uri))
+    second = strategy(storage_from_string(uri))
+    limit = parse("3/minute")
+
+    assert first.hit(limit, "tenant", "a")
+    assert second.hit(limit, "tenant", "a")
+    assert first.hit(limit, "tenant", "a")
+    assert not second.hit(limit, "tenant", "a")
+    assert second.hit(limit, "tenant", "b")
+    assert first.get_window_stats(limit, "tenant", "a")[1] == 0
+
+    first.clear(limit, "tenant", "a")
+    assert second.hit(limit, "tenant", "a")
+
+
+def test_counters_expire(uri, monkeypatch):
+    storage = storage_from_string(uri)
+    now = [1_000_000.0]
+    monkeypatch.setattr(limiter_storage.time, "time", lambda: now[0])
+
+    assert storage.incr("key", 10) == 1
+    assert storage.incr("key", 10, amount=2) == 3
+    assert storage.get_expiry("key") == now[0] + 10
+
+    now[0] += 11
+    assert storage.get("key") == 0
+    assert storage.incr("key", 10) == 1
+
+
+def test_bench_rate_limit_reports_overhead(app):
+    result = app.test_cli_runner().invoke(args=["bench-rate-limit", "--requests", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert "limiter off" in result.output
+    assert result.output.count("overhead:") == 2
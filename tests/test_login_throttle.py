@@ -0,0 +1,154 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app.common.login_throttle import (
+    InMemoryThrottleStore,
+    LoginThrottle,
+    SQLiteThrottleStore,
+    ThrottleStore,
+    init_login_throttle,
+)
+from app.extensions import db
+from app.models.client import Client
+from app.models.user import User
+
+
+@pytest.fixture()
+def db_session(app):
+    app.config["LOGIN_THROTTLE_ACCOUNT_THRESHOLD"] = 3
+    init_login_throttle(app)
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session) -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(
+        client_id=tenant.id,
+        email="user@example.com",
+        status="active",
+        password_hash=generate_password_hash("supersecret"),
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_repeated_failures_are_rejected_before_password_check(client, db_session, monkeypatch):
+    user = create_user(db_session)
+    payload = {"email": user.email, "password": "wrong", "client_id": user.client_id}
+    for _ in range(3):
+        assert client.post("/auth/login", json=payload).status_code == 401
+
+    verifications = []
+    monkeypatch.setattr(
+        "app.common.passwords.check_password_hash",
+        lambda *args: verifications.append(args) or True,
+    )
+    response = client.post("/auth/login", json={**payload, "password": "supersecret"})
+
+    assert response.status_code == 429
+    assert response.get_json()["message"] == "login_throttled"
+    assert int(response.headers["Retry-After"]) >= 1
+    assert verifications == []
+
+
+def test_successful_login_resets_account_counter(client, db_session):
+    user = create_user(db_session)
+    bad = {"email": user.email, "password": "wrong", "client_id": user.client_id}
+    good = {**bad, "password": "supersecret"}
+
+    for _ in range(2):
+        client.post("/auth/login", json=bad)
+    assert client.post("/auth/login", json=good).status_code == 200
+    for _ in range(2):
+        assert client.post("/auth/login", json=bad).status_code == 401
+
+
+@pytest.mark.parametrize("store_kind", ["memory", "sqlite"])
+def test_backoff_grows_exponentially(store_kind, tmp_path, monkeypatch):
+    if store_kind == "sqlite":
+        store = SQLiteThrottleStore(str(tmp_path / "throttle.sqlite3"))
+    else:
+        store = InMemoryThrottleStore()
+    throttle = LoginThrottle(store, account_threshold=2, base_delay=1.0, max_delay=60.0)
+    now = 1_000_000.0
+    monkeypatch.setattr("app.common.login_throttle.time.time", lambda: now)
+
+    for _ in range(4):
+        throttle.record_failure("user@example.com", "tenant-1")
+
+    key = throttle.account_key("user@example.com")
+    assert throttle._retry_after(key, throttle.account_threshold, now) == pytest.approx(4.0)
+    assert throttle._retry_after(key, throttle.account_threshold, now + 5) == 0.0
+
+
+@pytest.mark.parametrize("store_kind", ["memory", "sqlite"])
+def test_idle_counters_are_purged(store_kind, tmp_path):
+    if store_kind == "sqlite":
+        store = SQLiteThrottleStore(str(tmp_path / "throttle.sqlite3"))
+    else:
+        store = InMemoryThrottleStore()
+    now = 1_000_000.0
+    for index in range(50):
+        store.record_failure(f"account:attacker-{index}@example.com", now, window=900.0)
+
+    store.record_failure("account:user@example.com", now + 901, window=900.0)
+
+    assert store.get("account:attacker-0@example.com") is None
+    assert store.get("account:user@example.com") == (1, now + 901)
+    if store_kind == "memory":
+        assert len(store._entries) == 1
+    else:
+        assert store._connection().execute("SELECT COUNT(*) FROM login_failures").fetchone()[0] == 1
+
+
+def test_email_only_and_scoped_attempts_share_one_account_bucket(app, client, db_session):
+    user = create_user(db_session)
+    scoped = {"email": user.email, "password": "wrong", "client_id": user.client_id}
+    email_only = {"email": user.email.upper(), "password": "wrong"}
+
+    assert client.post("/auth/login", json=scoped).status_code == 401
+    assert client.post("/auth/login", json=email_only).status_code == 401
+    assert client.post("/auth/login", json=scoped).status_code == 401
+
+    assert client.post("/auth/login", json={**email_only, "password": "supersecret"}).status_code == 429
+    assert client.post("/auth/login", json={**scoped, "password": "supersecret"}).status_code == 429
+
+
+def test_tenant_failures_tighten_backoff_without_locking_out_the_tenant(app, client, db_session):
+    app.config["LOGIN_THROTTLE_TENANT_THRESHOLD"] = 2
+    init_login_throttle(app)
+    user = create_user(db_session)
+    other = User(
+        client_id=user.client_id,
+        email="other@example.com",
+        status="active",
+        password_hash=generate_password_hash("supersecret"),
+    )
+    db_session.add(other)
+    db_session.commit()
+
+    # Email-only failures count toward the tenant once it is resolved.
+    for _ in range(2):
+        assert client.post("/auth/login", json={"email": user.email, "password": "wrong"}).status_code == 401
+    # Below the account threshold, but the tenant is under attack.
+    assert client.post("/auth/login", json={"email": user.email, "password": "supersecret"}).status_code == 429
+
+    assert client.post("/auth/login", json={"email": other.email, "password": "supersecret"}).status_code == 200
+    assert client.post("/auth/login", json={"email": other.email, "password": "wrong"}).status_code == 401
+    assert client.post("/auth/login", json={"email": other.email, "password": "supersecret"}).status_code == 429
+
+
+def test_throttle_stores_must_implement_the_interface():
+    class Incomplete(ThrottleStore):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
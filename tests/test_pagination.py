@@ -0,0 +1,179 @@
+from datetime import date
+
+import pytest
+from flask import g
+from sqlalchemy import event, insert
+from werkzeug.exceptions import BadRequest
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.common.pagination import decode_cursor, encode_cursor
+from app.extensions import db
+from app.models.client import Client
+from app.models.company import Company
+from app.models.employee import Employee
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture()
+def tenant(db_session):
+    client = Client(name="Acme")
+    db_session.add(client)
+    db_session.commit()
+    user = User(client_id=client.id, email="admin@example.com", status="active")
+    db_session.add(user)
+    db_session.commit()
+    seed_rbac()
+    role = Role.query.filter_by(name="Admin Cliente", scope="tenant", client_id=client.id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+    return user.id, client.id
+
+
+def add_companies(db_session, user_id: str, client_id: str, names: list[str]) -> list[str]:
+    companies = [
+        Company(client_id=client_id, name=name, tax_id=f"T-{index}") for index, name in enumerate(names)
+    ]
+    db_session.add_all(companies)
+    db_session.flush()
+    access = UserCompanyAccessRepository(db_session)
+    for company in companies:
+        access.upsert_access(user_id, company.id, client_id, "admin")
+    db_session.commit()
+    return [company.id for company in companies]
+
+
+def get(client, path: str, user: tuple[str, str]):
+    # The test app context outlives each request, so drop what the last one left on g.
+    g.pop("_authz_cache", None)
+    g.pop("_company_access_maps", None)
+    g.pop("tenant_shard", None)
+    token = create_access_token(*user)
+    return client.get(path, headers={"Authorization": f"Bearer {token}"})
+
+
+def collect_pages(client, path: str, user: tuple[str, str], key: str, limit: int) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        suffix = f"&cursor={cursor}" if cursor else ""
+        response = get(client, f"{path}?limit={limit}{suffix}", user)
+        assert response.status_code == 200
+        payload = response.get_json()
+        pages.append(payload[key])
+        cursor = payload["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = encode_cursor(["Ñandú S.A.", "id-1"])
+    assert decode_cursor(cursor) == ("Ñandú S.A.", "id-1")
+    for bad in ("not-base64!", encode_cursor(["only-one"]), encode_cursor({"a": 1}), encode_cursor([1, 2])):
+        with pytest.raises(BadRequest, match="invalid_cursor"):
+            decode_cursor(bad)
+
+
+@pytest.mark.parametrize("acl_filter", ["join", "in"])
+def test_companies_page_through_ties_without_gaps(app, client, db_session, tenant, acl_filter):
+    app.config["COMPANY_ACL_FILTER"] = acl_filter
+    user_id, client_id = tenant
+    ids = add_companies(db_session, user_id, client_id, ["Beta", "Alpha", "Beta", "Beta", "Gamma", "Alpha", "Delta"])
+
+    pages = collect_pages(client, "/companies", tenant, "companies", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    listed = [company for page in pages for company in page]
+    assert sorted(company["id"] for company in listed) == sorted(ids)
+    keys = [(company["name"], company["id"]) for company in listed]
+    assert keys == sorted(keys)
+
+
+def test_last_full_page_has_no_next_cursor(client, db_session, tenant):
+    user_id, client_id = tenant
+    add_companies(db_session, user_id, client_id, ["A", "B", "C", "D"])
+
+    payload = get(client, "/companies?limit=4", tenant).get_json()
+
+    assert len(payload["companies"]) == 4
+    assert payload["next_cursor"] is None
+
+
+def test_unpaged_request_returns_every_row(app, client, db_session, tenant):
+    app.config["PAGINATION_DEFAULT_LIMIT"] = 2
+    user_id, client_id = tenant
+    ids = add_companies(db_session, user_id, client_id, ["A", "B", "C", "D", "E"])
+
+    payload = get(client, "/companies", tenant).get_json()
+
+    assert sorted(company["id"] for company in payload["companies"]) == sorted(ids)
+    assert payload["next_cursor"] is None
+    first = get(client, f"/companies?cursor={encode_cursor(['A', ids[0]])}", tenant).get_json()
+    assert len(first["companies"]) == 2
+
+
+def test_invalid_paging_parameters_are_rejected(app, client, db_session, tenant):
+    assert get(client, "/companies?cursor=%25%25", tenant).status_code == 400
+    assert get(client, "/companies?limit=0", tenant).status_code == 400
+    assert get(client, "/companies?limit=ten", tenant).status_code == 400
+
+    user_id, client_id = tenant
+    add_companies(db_session, user_id, client_id, ["A", "B", "C"])
+    app.config["PAGINATION_MAX_LIMIT"] = 2
+    payload = get(client, "/companies?limit=1000", tenant).get_json()
+    assert len(payload["companies"]) == 2
+    assert payload["next_cursor"] is not None
+
+
+def test_employees_page_without_offset(client, db_session, tenant):
+    user_id, client_id = tenant
+    (company_id,) = add_companies(db_session, user_id, client_id, ["Alpha"])
+    names = [f"Employee {index % 4}" for index in range(10)]
+    db_session.execute(
+        insert(Employee),
+        [
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                "client_id": client_id,
+                "company_id": company_id,
+                "full_name": name,
+                "status": "active",
+                "start_date": date(2024, 1, 1),
+            }
+            for index, name in enumerate(names)
+        ],
+    )
+    db_session.commit()
+
+    statements: list[tuple[str, tuple]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM employees" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        pages = collect_pages(client, f"/companies/{company_id}/employees", tenant, "employees", limit=4)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    listed = [(employee["full_name"], employee["id"]) for page in pages for employee in page]
+    assert listed == sorted(listed)
+    assert len(set(listed)) == 10
+    assert len(statements) == 3
+    for statement, parameters in statements:
+        # SQLite always renders "LIMIT ? OFFSET ?"; keyset pages never skip rows.
+        assert "OFFSET ?" not in statement or parameters[-1] == 0
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+
+from app.common.partitioning import PARTITIONED_TABLES, tenant_partition_name
+from app.extensions import db
+from app.models.client import Client
+from app.modules.employees.repository import EmployeeRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def test_tenant_partition_name_is_stable_and_short():
+    name = tenant_partition_name("employees", "6F1C0B7E-3C1A-4E7B-9C57-2B1D6A0C9E11")
+
+    assert name == "employees_p_6f1c0b7e3c1a4e7b9c572b1d6a0c9e11"
+    assert len(name) <= 63
+    with pytest.raises(ValueError):
+        tenant_partition_name("employees", "not-a-uuid")
+
+
+def test_partition_commands_are_noops_on_sqlite(app, db_session):
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["partition-tenant", tenant.id])
+    assert result.exit_code == 0
+    assert "needs PostgreSQL" in result.output
+
+    result = runner.invoke(args=["partition-tables"])
+    assert result.exit_code == 0
+    assert "needs PostgreSQL" in result.output
+
+
+def test_partition_tenant_rejects_unknown_clients(app, db_session):
+    runner = app.test_cli_runner()
+
+    assert runner.invoke(args=["partition-tenant", "nope"]).exit_code == 2
+    result = runner.invoke(args=["partition-tenant", "6f1c0b7e-3c1a-4e7b-9c57-2b1d6a0c9e11"])
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+def test_partitioned_table_queries_filter_on_client_id(db_session):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    repository = EmployeeRepository()
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        repository.get_by_id("employee", "client")
+        repository.list_by_company("company", "client")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    # Partition pruning needs the partition key in every WHERE clause.
+    for statement in statements:
+        tables = [table for table in PARTITIONED_TABLES if f"FROM {table}" in statement]
+        for table in tables:
+            assert f"{table}.client_id = ?" in statement.split("WHERE", 1)[1]
+    assert len(statements) == 2
@@ -0,0 +1,148 @@
+import os
+
+import pytest
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import generate_password_hash
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.common.passwords import PasswordHasher, get_password_hasher, init_password_hasher
+from app.extensions import db
+from app.models.client import Client
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session, email: str = "user@example.com") -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(
+        client_id=tenant.id,
+        email=email,
+        status="active",
+        password_hash=generate_password_hash("supersecret"),
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_saturated_hash_queue_fails_fast_with_retry_after(client, db_session):
+    user = create_user(db_session)
+    hasher = get_password_hasher()
+    for _ in range(hasher.queue_size):
+        hasher._slots.acquire()
+    try:
+        response = client.post(
+            "/auth/login",
+            json={"email": user.email, "password": "supersecret", "client_id": user.client_id},
+        )
+    finally:
+        for _ in range(hasher.queue_size):
+            hasher._slots.release()
+
+    assert response.status_code == 503
+    assert response.get_json()["message"] == "password_hash_busy"
+    assert response.headers["Retry-After"] == "1"
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_slow_hash_times_out_with_retry_after(app, client, db_session):
+    user = create_user(db_session)
+    # A freshly spawned pool cannot start a worker within a millisecond.
+    hasher = PasswordHasher(pool_size=1, timeout=0.001)
+    app.extensions["password_hasher"] = hasher
+    try:
+        response = client.post(
+            "/auth/login",
+            json={"email": user.email, "password": "supersecret", "client_id": user.client_id},
+        )
+    finally:
+        hasher.shutdown()
+
+    assert response.status_code == 503
+    assert response.get_json()["message"] == "password_hash_timeout"
+    assert response.headers["Retry-After"] == "1"
+    assert hasher.stats()["timed_out"] == 1
+    assert hasher.stats()["queue_depth"] == 0
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(pool_size=1, queue_size=2)
+    try:
+        pwhash = hasher.hash("supersecret", method="pbkdf2:sha256:1000")
+        assert hasher.verify(pwhash, "supersecret")
+        assert not hasher.verify(pwhash, "wrong")
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["queue_depth"] == 0
+
+
+def test_broken_pool_is_replaced_after_a_503():
+    hasher = PasswordHasher(pool_size=1, queue_size=2)
+    try:
+        # Stands in for a pool process killed by the OOM killer.
+        with pytest.raises(ServiceUnavailable) as excinfo:
+            hasher._run(os._exit, 1)
+        assert excinfo.value.description == "password_hash_unavailable"
+        assert excinfo.value.retry_after == 1
+
+        pwhash = hasher.hash("supersecret", method="pbkdf2:sha256:1000")
+        assert hasher.verify(pwhash, "supersecret")
+    finally:
+        hasher.shutdown()
+
+    assert hasher.stats()["pool_restarts"] == 1
+
+
+def test_metrics_endpoint_reports_hashing_stats(client, db_session):
+    user = create_user(db_session)
+    seed_rbac()
+    super_admin = Role.query.filter_by(name="Super Admin", scope="platform", client_id=None).one()
+    UserRoleRepository(db_session).assign_role(user.id, super_admin.id)
+    db_session.commit()
+
+    client.post(
+        "/auth/login",
+        json={"email": user.email, "password": "supersecret", "client_id": user.client_id},
+    )
+    token = create_access_token(user.id, user.client_id)
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    metrics = response.get_json()["metrics"]
+    assert metrics["password_hashing"]["completed"] >= 1
+    assert "queue_depth" in metrics["password_hashing"]
+    assert "hits" in metrics["jwt_token_cache"]
+
+
+def test_login_rehashes_to_configured_cost(client, db_session, app):
+    app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:1000"
+    init_password_hasher(app)
+    user = create_user(db_session)
+    assert user.password_hash.startswith("scrypt:")
+
+    payload = {"email": user.email, "password": "supersecret", "client_id": user.client_id}
+    assert client.post("/auth/login", json=payload).status_code == 200
+
+    db_session.refresh(user)
+    upgraded_hash = user.password_hash
+    assert upgraded_hash.startswith("pbkdf2:sha256:1000$")
+
+    assert client.post("/auth/login", json=payload).status_code == 200
+    db_session.refresh(user)
+    assert user.password_hash == upgraded_hash
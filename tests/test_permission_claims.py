@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import event
+
+from app.cli import seed_rbac
+from app.common.jwt import decode_token
+from app.common.permission_catalog import (
+    RBAC_PERMISSIONS,
+    bitmap_has_permission,
+    encode_permission_bitmap,
+)
+from app.extensions import db
+from app.models.client import Client
+from app.models.role import Role
+from app.models.user import User
+from app.modules.auth.service import AuthService
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    app.config["JWT_EMBED_PERMISSIONS"] = True
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user_with_role(db_session, role_name: str) -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(client_id=tenant.id, email="user@example.com", status="active")
+    db_session.add(user)
+    db_session.commit()
+    seed_rbac()
+    role = Role.query.filter_by(name=role_name, scope="tenant", client_id=tenant.id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+    return user
+
+
+def count_queries(func) -> int:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_bitmap_round_trip_follows_catalogue_order():
+    encoded = encode_permission_bitmap({"company.read", "audit.read"})
+
+    assert bitmap_has_permission(encoded, "company.read") is True
+    assert bitmap_has_permission(encoded, "audit.read") is True
+    assert bitmap_has_permission(encoded, "company.write") is False
+    assert bitmap_has_permission(encoded, "not.in.catalogue") is None
+    assert len(RBAC_PERMISSIONS) <= 8 * len(encoded)
+
+
+def test_token_permissions_skip_rbac_queries(client, db_session):
+    user = create_user_with_role(db_session, "Admin Cliente")
+    token = AuthService().issue_access_token(user.id, user.client_id)
+    claims = decode_token(token)
+    assert "perms" in claims and "pv" in claims
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.get("/rbac/probe/company-write", headers=headers)
+    queries = count_queries(
+        lambda: client.get("/rbac/probe/company-write", headers=headers)
+    )
+
+    assert queries == 0
+
+
+def test_stale_permission_version_falls_back_to_database(client, db_session):
+    user = create_user_with_role(db_session, "Admin Cliente")
+    token = AuthService().issue_access_token(user.id, user.client_id)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/rbac/probe/company-write", headers=headers).status_code == 200
+
+    role = Role.query.filter_by(name="Admin Cliente", client_id=user.client_id).one()
+    UserRoleRepository(db_session).remove_role(user.id, role.id)
+    db_session.commit()
+
+    response = client.get("/rbac/probe/company-write", headers=headers)
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "missing_permission"
@@ -0,0 +1,85 @@
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app.common.jwt import create_access_token
+from app.common.principals import get_principal_cache
+from app.extensions import db
+from app.models.client import Client
+from app.models.user import User
+from app.services.user_service import UserService
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_client(db_session) -> Client:
+    client = Client(name="Acme")
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def create_user(db_session, client_id: str, email: str = "user@example.com") -> User:
+    user = User(client_id=client_id, email=email, status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def auth_header_for(user: User) -> dict[str, str]:
+    token = create_access_token(user.id, user.client_id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def count_queries(func) -> int:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_repeat_requests_reuse_cached_principal(client, db_session):
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id)
+    headers = auth_header_for(user)
+
+    response = client.get("/rbac/me/permissions", headers=headers)
+    assert response.status_code == 200
+
+    # The test app context outlives requests, so drop the request-scoped RBAC cache.
+    g.pop("_authz_cache", None)
+    first_stats = get_principal_cache().stats()
+    queries = count_queries(lambda: client.get("/rbac/me/permissions", headers=headers))
+
+    assert get_principal_cache().stats()["hits"] == first_stats["hits"] + 1
+    # Neither the user nor its roles are reloaded; both come from worker caches.
+    assert queries == 0
+
+
+def test_disable_user_invalidates_cached_principal(client, db_session):
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id)
+    headers = auth_header_for(user)
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    UserService().disable_user(user.id, tenant.id)
+    db_session.commit()
+
+    response = client.get("/auth/me", headers=headers)
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "user_inactive"
@@ -0,0 +1,98 @@
+import json
+import logging
+
+import pytest
+from flask import g
+from sqlalchemy import create_engine, text
+
+from app.common.jwt import create_access_token
+from app.common.profiling import _PROFILE_ATTR, RequestProfile, register_request_profiling
+from app.extensions import JsonLogFormatter, db
+from app.models.client import Client
+from app.models.user import User
+
+
+@pytest.fixture()
+def profiled_app(app):
+    app.config["REQUEST_PROFILING_ENABLED"] = True
+    register_request_profiling(app)
+    return app
+
+
+@pytest.fixture()
+def db_session(profiled_app):
+    with profiled_app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session) -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(client_id=tenant.id, email="user@example.com", status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_request_profile_is_logged_per_layer(profiled_app, db_session, caplog):
+    user = create_user(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+    client = profiled_app.test_client()
+
+    with caplog.at_level(logging.INFO, logger="app.profiling"):
+        response = client.get("/rbac/probe/company-write", headers=headers)
+
+    assert response.status_code == 403
+    record = next(record for record in caplog.records if record.name == "app.profiling")
+    fields = record.fields
+    assert fields["endpoint"] == "/rbac/probe/company-write"
+    assert fields["status"] == 403
+    assert set(fields["layers"]) == {"auth_required", "require_permission", "view"}
+    assert fields["queries"] == sum(layer["queries"] for layer in fields["layers"].values())
+    assert fields["layers"]["require_permission"]["queries"] >= 1
+    assert json.loads(JsonLogFormatter().format(record))["event"] == "request_profile"
+
+
+def test_statements_on_shard_engines_are_counted(profiled_app):
+    shard_engine = create_engine("sqlite://")
+    profile = RequestProfile()
+
+    with profiled_app.test_request_context():
+        setattr(g, _PROFILE_ATTR, profile)
+        with shard_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    assert profile.queries == 1
+    shard_engine.dispose()
+
+
+def test_profile_report_aggregates_per_endpoint(profiled_app, tmp_path):
+    entries = [
+        {
+            "event": "request_profile",
+            "method": "GET",
+            "endpoint": "/companies",
+            "total_ms": total,
+            "queries": 3,
+            "layers": {
+                "authorize": {"ms": total / 2, "queries": 1},
+                "view": {"ms": total / 2, "queries": 2},
+            },
+        }
+        for total in (2.0, 4.0)
+    ]
+    log_file = tmp_path / "app.log"
+    log_file.write_text(
+        "\n".join(["not json", json.dumps({"message": "other"})] + [json.dumps(entry) for entry in entries])
+    )
+
+    result = profiled_app.test_cli_runner().invoke(args=["profile-report", str(log_file)])
+
+    assert result.exit_code == 0, result.output
+    row = next(line for line in result.output.splitlines() if line.startswith("GET /companies"))
+    assert row.split()[2:5] == ["2", "3.00", "3.0"]
+    assert "1.50 / 1.0" in row and "1.50 / 2.0" in row
@@ -0,0 +1,146 @@
+"""EXPLAIN every repository query and fail if SQLite falls back to a table scan."""
+
+from datetime import datetime, timezone
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app.common.authz import AuthorizationService
+from app.extensions import db
+from app.models.team import Team
+from app.modules.companies.repository import CompanyRepository
+from app.modules.employees.repository import EmployeeRepository
+from app.repositories.permission_repository import PermissionRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.role_repository import RoleRepository
+from app.repositories.team_repository import TeamRepository
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_invitation_repository import UserInvitationRepository
+from app.repositories.user_repository import UserRepository
+
+CLIENT_ID = "00000000-0000-0000-0000-000000000001"
+USER_ID = "00000000-0000-0000-0000-000000000002"
+COMPANY_ID = "00000000-0000-0000-0000-000000000003"
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+QUERY_SHAPES = {
+    "user.get_by_id": lambda: UserRepository().get_by_id(USER_ID, CLIENT_ID),
+    "user.get_by_email": lambda: UserRepository().get_by_email("a@example.com", CLIENT_ID),
+    "user.list_active_by_email": lambda: UserRepository().list_active_by_email("a@example.com"),
+    "user.list_existing_ids": lambda: UserRepository().list_existing_ids([USER_ID], CLIENT_ID),
+    "company.get_by_id": lambda: CompanyRepository().get_by_id(COMPANY_ID, CLIENT_ID),
+    "company.list_existing_ids": lambda: CompanyRepository().list_existing_ids([COMPANY_ID], CLIENT_ID),
+    "company.list": lambda: CompanyRepository().list(CLIENT_ID),
+    "company.list_filtered": lambda: CompanyRepository().list(CLIENT_ID, status="active", q="acme"),
+    "company.list_allowed_ids": lambda: CompanyRepository().list(CLIENT_ID, allowed_company_ids={COMPANY_ID}),
+    "company.list_acl_exists": lambda: CompanyRepository().list(CLIENT_ID, acl_user_id=USER_ID),
+    "company.list_with_access": lambda: CompanyRepository().list_with_access(CLIENT_ID, USER_ID),
+    "company.list_page": lambda: CompanyRepository().list(CLIENT_ID, after=("Acme", COMPANY_ID), limit=50),
+    "company.list_with_access_page": lambda: CompanyRepository().list_with_access(
+        CLIENT_ID, USER_ID, after=("Acme", COMPANY_ID), limit=50
+    ),
+    "employee.get_by_id": lambda: EmployeeRepository().get_by_id("e", CLIENT_ID),
+    "employee.list_by_company": lambda: EmployeeRepository().list_by_company(COMPANY_ID, CLIENT_ID),
+    "employee.list_by_company_page": lambda: EmployeeRepository().list_by_company(
+        COMPANY_ID, CLIENT_ID, after=("Ada", "e"), limit=50
+    ),
+    "access.get_user_access": lambda: UserCompanyAccessRepository().get_user_access(USER_ID, COMPANY_ID, CLIENT_ID),
+    "access.get_access_map": lambda: UserCompanyAccessRepository().get_access_map(USER_ID, CLIENT_ID),
+    "access.get_access_levels": lambda: UserCompanyAccessRepository().get_access_levels(
+        USER_ID, [COMPANY_ID], CLIENT_ID
+    ),
+    "access.bulk_remove_access": lambda: UserCompanyAccessRepository().bulk_remove_access(
+        [USER_ID], [COMPANY_ID], CLIENT_ID
+    ),
+    "team.get_by_id": lambda: TeamRepository().get_by_id("t", CLIENT_ID),
+    "team.list_member_ids": lambda: TeamRepository().list_member_ids("t"),
+    "team.get_company_access": lambda: TeamRepository().get_company_access("t", COMPANY_ID),
+    "team.remove_member": lambda: TeamRepository().remove_member(Team(id="t", client_id=CLIENT_ID), USER_ID),
+    "refresh_token.get_by_token_hash": lambda: RefreshTokenRepository().get_by_token_hash("h"),
+    "refresh_token.mark_used": lambda: RefreshTokenRepository().mark_used("r", NOW),
+    "refresh_token.revoke_family": lambda: RefreshTokenRepository().revoke_family("f", CLIENT_ID, NOW),
+    "refresh_token.revoke_user": lambda: RefreshTokenRepository().revoke_user(USER_ID, CLIENT_ID, NOW),
+    "revoked_token.get_by_jti": lambda: RevokedTokenRepository().get_by_jti("j"),
+    "revoked_token.list_by_jtis": lambda: RevokedTokenRepository().list_by_jtis(["j"]),
+    "revoked_token.list_keys_since": lambda: RevokedTokenRepository().list_keys_since(0),
+    "revoked_token.list_active_keys": lambda: RevokedTokenRepository().list_active_keys(NOW),
+    "revoked_token.delete_expired": lambda: RevokedTokenRepository().delete_expired(NOW),
+    "invitation.get_active_by_email": lambda: UserInvitationRepository().get_active_by_email(
+        CLIENT_ID, "a@example.com", NOW
+    ),
+    "invitation.get_by_token_hash": lambda: UserInvitationRepository().get_by_token_hash("h"),
+    "role.get_by_id": lambda: RoleRepository().get_by_id("r"),
+    "role.get_by_name_tenant": lambda: RoleRepository().get_by_name("Admin", "tenant", CLIENT_ID),
+    "role.get_by_name_platform": lambda: RoleRepository().get_by_name("Super Admin", "platform", None),
+    "role.list_for_client": lambda: RoleRepository().list_for_client(CLIENT_ID),
+    "permission.get_by_code": lambda: PermissionRepository().get_by_code("company.read"),
+    "authz.load_context": lambda: AuthorizationService().load_context(USER_ID, CLIENT_ID, COMPANY_ID),
+}
+
+# Queries that read a whole (small) table by design.
+FULL_SCANS_ALLOWED = {
+    "permission.list_all": lambda: PermissionRepository().list_all(),
+}
+
+_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def capture_statements(func) -> list[tuple[str, tuple]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(("INSERT", "EXPLAIN")):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return statements
+
+
+def table_scans(statement: str, parameters) -> list[str]:
+    connection = db.session.connection()
+    plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    scans = []
+    for row in plan:
+        match = _SCAN.match(row[-1])
+        if match and match.group(1) in db.metadata.tables:
+            scans.append(row[-1])
+    return scans
+
+
+@pytest.mark.parametrize("name", sorted(QUERY_SHAPES))
+def test_repository_query_uses_an_index(db_session, name):
+    statements = capture_statements(QUERY_SHAPES[name])
+
+    assert statements, f"{name} issued no queries"
+    for statement, parameters in statements:
+        assert table_scans(statement, parameters) == [], statement
+
+
+def test_allowed_full_scans_are_still_full_scans(db_session):
+    # Keeps the allow-list honest: drop entries once they stop scanning.
+    for name, func in FULL_SCANS_ALLOWED.items():
+        statements = capture_statements(func)
+        assert any(table_scans(statement, parameters) for statement, parameters in statements), name
+
+
+@pytest.mark.parametrize("name", ["company.list_page", "employee.list_by_company_page"])
+def test_keyset_pages_are_read_in_index_order(db_session, name):
+    connection = db.session.connection()
+    for statement, parameters in capture_statements(QUERY_SHAPES[name]):
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        assert not any("TEMP B-TREE" in row[-1] for row in plan), plan
@@ -0,0 +1,85 @@
+import pytest
+
+from app.common.jwt import create_access_token
+from app.common.rate_limits import init_rate_limits
+from app.common.tenant_registry import get_tenant_registry
+from app.extensions import db
+from app.models.client import Client
+from app.models.user import User
+
+
+@pytest.fixture()
+def db_session(app):
+    app.config["RATE_LIMIT_PLANS"] = "starter=3/minute,enterprise=100/minute"
+    app.config["RATE_LIMIT_TENANT_DEFAULT"] = "50/minute"
+    app.config["RATE_LIMIT_PER_USER"] = "2/minute"
+    init_rate_limits(app)
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_tenant(db_session, plan: str | None, users: int = 1) -> list[tuple[str, str]]:
+    tenant = Client(name=f"Tenant {plan}", plan=plan)
+    db_session.add(tenant)
+    db_session.commit()
+    created = [User(client_id=tenant.id, email=f"user{index}@example.com", status="active") for index in range(users)]
+    db_session.add_all(created)
+    db_session.commit()
+    get_tenant_registry().refresh(force=True)
+    return [(user.id, user.client_id) for user in created]
+
+
+def me(client, identity: tuple[str, str]):
+    token = create_access_token(*identity)
+    return client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_authenticated_responses_carry_rate_limit_headers(client, db_session):
+    (user,) = create_tenant(db_session, "enterprise")
+
+    response = me(client, user)
+
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Limit"] == "2"
+    assert response.headers["X-RateLimit-Remaining"] == "1"
+    assert int(response.headers["X-RateLimit-Reset"]) > 0
+    assert "Retry-After" not in response.headers
+
+
+def test_user_bucket_is_keyed_by_user_not_ip(client, db_session):
+    first, second = create_tenant(db_session, "enterprise", users=2)
+
+    assert [me(client, first).status_code for _ in range(3)] == [200, 200, 429]
+    response = me(client, first)
+    assert response.get_json()["message"] == "user_rate_limited"
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Same address, different user: its own bucket.
+    assert me(client, second).status_code == 200
+
+
+def test_tenant_bucket_follows_plan(client, db_session):
+    users = create_tenant(db_session, "starter", users=4)
+
+    statuses = [me(client, user).status_code for user in users]
+
+    assert statuses == [200, 200, 200, 429]
+    assert me(client, users[3]).get_json()["message"] == "tenant_rate_limited"
+
+
+def test_unknown_plan_uses_tenant_default(app, client, db_session):
+    app.config["RATE_LIMIT_TENANT_DEFAULT"] = "1/minute"
+    first, second = create_tenant(db_session, "legacy", users=2)
+
+    assert me(client, first).status_code == 200
+    assert me(client, second).status_code == 429
+
+
+def test_anonymous_requests_skip_tenant_buckets(client, db_session):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert "X-RateLimit-Limit" not in response.headers
@@ -0,0 +1,107 @@
+import pytest
+from flask import g
+from sqlalchemy import event, insert, update
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.common.rbac_cache import get_rbac_cache
+from app.extensions import db
+from app.models.client import Client
+from app.models.rbac import user_roles
+from app.models.rbac_version import RbacVersion
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session) -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(client_id=tenant.id, email="user@example.com", status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def assign_role(db_session, user: User, role_name: str) -> None:
+    role = Role.query.filter_by(name=role_name, scope="tenant", client_id=user.client_id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+
+
+def count_queries(func) -> int:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def get_permissions(client, headers) -> set[str]:
+    # The test app context outlives requests, so drop the request-scoped RBAC cache.
+    g.pop("_authz_cache", None)
+    response = client.get("/rbac/me/permissions", headers=headers)
+    assert response.status_code == 200
+    return set(response.get_json()["permissions"])
+
+
+def test_steady_state_permission_checks_skip_the_database(client, db_session):
+    user = create_user(db_session)
+    seed_rbac()
+    assign_role(db_session, user, "Asesor")
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+    get_permissions(client, headers)
+
+    queries = count_queries(lambda: get_permissions(client, headers))
+
+    assert queries == 0
+    stats = get_rbac_cache().stats()
+    assert stats["hit_rate"] > 0
+    assert stats["user_roles"]["hits"] >= 1
+    assert stats["staleness_seconds"] is not None
+
+
+def test_role_assignment_invalidates_snapshot(client, db_session):
+    user = create_user(db_session)
+    seed_rbac()
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+    assert get_permissions(client, headers) == set()
+
+    assign_role(db_session, user, "Asesor")
+
+    assert "case.write" in get_permissions(client, headers)
+
+
+def test_version_bump_from_another_worker_is_seen_after_ttl(app, client, db_session):
+    app.config["RBAC_VERSION_TTL_SECONDS"] = 0
+    user = create_user(db_session)
+    seed_rbac()
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+    assert get_permissions(client, headers) == set()
+    invalidations = get_rbac_cache().stats()["invalidations"]
+
+    # Simulate another worker: change roles and bump the version row without
+    # touching this worker's in-process state.
+    role = Role.query.filter_by(name="Asesor", scope="tenant", client_id=user.client_id).one()
+    db_session.execute(insert(user_roles).values(user_id=user.id, role_id=role.id))
+    db_session.execute(update(RbacVersion).values(version=RbacVersion.version + 1))
+    db_session.commit()
+
+    assert "case.write" in get_permissions(client, headers)
+    assert get_rbac_cache().stats()["invalidations"] == invalidations + 1
@@ -0,0 +1,129 @@
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.extensions import db
+from app.models.client import Client
+from app.models.company import Company
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session) -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(client_id=tenant.id, email="user@example.com", status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def create_company(db_session, client_id: str, name: str, tax_id: str) -> Company:
+    company = Company(client_id=client_id, name=name, tax_id=tax_id)
+    db_session.add(company)
+    db_session.commit()
+    return company
+
+
+def assign_role(db_session, user: User, role_name: str) -> None:
+    role = Role.query.filter_by(name=role_name, scope="tenant", client_id=user.client_id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+
+
+def auth_header_for(user: User) -> dict[str, str]:
+    token = create_access_token(user.id, user.client_id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_batch_check_returns_every_decision(client, db_session):
+    user = create_user(db_session)
+    seed_rbac()
+    assign_role(db_session, user, "Asesor")
+    alpha = create_company(db_session, user.client_id, "Alpha", "A-1")
+    beta = create_company(db_session, user.client_id, "Beta", "B-1")
+    gamma = create_company(db_session, user.client_id, "Gamma", "C-1")
+    repository = UserCompanyAccessRepository(db_session)
+    repository.upsert_access(user.id, alpha.id, user.client_id, "operator")
+    repository.upsert_access(user.id, beta.id, user.client_id, "viewer")
+    db_session.commit()
+
+    response = client.post(
+        "/rbac/check",
+        headers=auth_header_for(user),
+        json={
+            "checks": [
+                {"permission": "company.read"},
+                {"permission": "company.write"},
+                {"permission": "case.write", "company_id": alpha.id, "access_level": "operator"},
+                {"permission": "case.write", "company_id": beta.id, "access_level": "operator"},
+                {"permission": "company.read", "company_id": gamma.id},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [(result["allowed"], result["reason"]) for result in results] == [
+        (True, None),
+        (False, "missing_permission"),
+        (True, None),
+        (False, "insufficient_access_level"),
+        (False, "company_access_not_found"),
+    ]
+    assert results[4]["access_level"] == "viewer"
+
+
+def test_batch_check_fetches_acl_rows_with_one_query(client, db_session):
+    user = create_user(db_session)
+    seed_rbac()
+    assign_role(db_session, user, "Asesor")
+    companies = [create_company(db_session, user.client_id, f"Co {i}", f"T-{i}") for i in range(5)]
+    headers = auth_header_for(user)
+    checks = [{"permission": "company.read", "company_id": company.id} for company in companies]
+    # Warm up worker-level caches so only the ACL lookup remains.
+    client.post("/rbac/check", headers=headers, json={"checks": checks})
+    g.pop("_authz_cache", None)
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.post("/rbac/check", headers=headers, json={"checks": checks})
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert "user_company_access" in statements[0] and " IN " in statements[0]
+
+
+def test_batch_check_validates_payload(client, db_session):
+    user = create_user(db_session)
+    headers = auth_header_for(user)
+
+    assert client.post("/rbac/check", headers=headers, json={}).status_code == 400
+    response = client.post(
+        "/rbac/check",
+        headers=headers,
+        json={"checks": [{"permission": "company.read", "access_level": "owner", "company_id": "x"}]},
+    )
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "invalid_access_level"
@@ -0,0 +1,115 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app.extensions import db
+from app.models.client import Client
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session, status: str = "active") -> User:
+    tenant = Client(name="Acme")
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(
+        client_id=tenant.id,
+        email="user@example.com",
+        status=status,
+        password_hash=generate_password_hash("supersecret"),
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def login(client, user: User) -> dict:
+    response = client.post(
+        "/auth/login",
+        json={"email": user.email, "password": "supersecret", "client_id": user.client_id},
+    )
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_refresh_rotates_without_password_verification(client, db_session, monkeypatch):
+    user = create_user(db_session)
+    tokens = login(client, user)
+    assert tokens["refresh_token"]
+
+    def fail_check(*args, **kwargs):
+        raise AssertionError("refresh must not verify the password")
+
+    monkeypatch.setattr("app.common.passwords.check_password_hash", fail_check)
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 200
+    refreshed = response.get_json()
+    assert refreshed["refresh_token"] != tokens["refresh_token"]
+    me = client.get("/auth/me", headers={"Authorization": f"Bearer {refreshed['access_token']}"})
+    assert me.status_code == 200
+    stored = db_session.query(RefreshToken).filter_by(user_id=user.id).all()
+    assert len(stored) == 2
+    assert all(token.token_hash not in {tokens["refresh_token"], refreshed["refresh_token"]} for token in stored)
+
+
+def test_reused_refresh_token_revokes_family(client, db_session):
+    user = create_user(db_session)
+    tokens = login(client, user)
+
+    first = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert first.status_code == 200
+    successor = first.get_json()["refresh_token"]
+
+    replay = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert replay.status_code == 401
+    assert replay.get_json()["message"] == "refresh_token_reused"
+
+    revoked = client.post("/auth/refresh", json={"refresh_token": successor})
+    assert revoked.status_code == 401
+    assert revoked.get_json()["message"] == "refresh_token_reused"
+
+
+def test_refresh_rejects_unknown_token(client, db_session):
+    create_user(db_session)
+
+    response = client.post("/auth/refresh", json={"refresh_token": "not-a-token"})
+
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "refresh_token_invalid"
+
+
+def test_refresh_is_refused_for_a_suspended_tenant(app, client, db_session):
+    user = create_user(db_session)
+    tokens = login(client, user)
+
+    result = app.test_cli_runner().invoke(args=["set-tenant-status", user.client_id, "suspended"])
+    assert result.exit_code == 0, result.output
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "tenant_suspended"
+
+    app.test_cli_runner().invoke(args=["set-tenant-status", user.client_id, "active"])
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "refresh_token_reused"
+
+
+def test_refresh_revokes_the_family_of_an_inactive_user(client, db_session):
+    user = create_user(db_session)
+    tokens = login(client, user)
+
+    user.status = "disabled"
+    db_session.commit()
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "user_inactive"
+    assert all(token.revoked_at is not None for token in RefreshToken.query.filter_by(user_id=user.id))
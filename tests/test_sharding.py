@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+
+import pytest
+from flask import g
+from sqlalchemy import insert, select, text, union_all
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token
+from app.common.sharding import bind_tenant, get_shard_router, init_tenant_shards
+from app.common.tenant_registry import get_tenant_registry
+from app.config import parse_mapping
+from app.extensions import db
+from app.models.client import Client
+from app.models.company import Company
+from app.models.revoked_token import RevokedToken
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_role_repository import UserRoleRepository
+
+
+@pytest.fixture()
+def db_session(app, tmp_path):
+    app.config["TENANT_SHARDS"] = f"whale=sqlite:///{tmp_path / 'whale.db'}"
+    init_tenant_shards(app)
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+        get_shard_router().dispose()
+
+
+def create_tenant(db_session, name: str) -> tuple[User, Company]:
+    tenant = Client(name=name)
+    db_session.add(tenant)
+    db_session.commit()
+    user = User(client_id=tenant.id, email=f"admin@{name.lower()}.example.com", status="active")
+    company = Company(client_id=tenant.id, name=f"{name} Co", tax_id=f"{name}-1")
+    db_session.add_all([user, company])
+    db_session.commit()
+    return user, company
+
+
+def grant_admin(db_session, user: User, company: Company) -> None:
+    role = Role.query.filter_by(name="Admin Cliente", scope="tenant", client_id=user.client_id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    UserCompanyAccessRepository(db_session).upsert_access(user.id, company.id, user.client_id, "admin")
+    db_session.commit()
+
+
+def call(client, method: str, path: str, user: tuple[str, str], payload: dict | None = None):
+    # The test app context outlives each request, so drop what the last one left on g.
+    g.pop("_authz_cache", None)
+    g.pop("_company_access_maps", None)
+    g.pop("tenant_shard", None)
+    token = create_access_token(*user)
+    return client.open(path, method=method, json=payload, headers={"Authorization": f"Bearer {token}"})
+
+
+def post_anonymously(client, path: str, payload: dict):
+    # No bearer token: nothing from the previous request may pick the tenant.
+    for key in ("user", "client_id", "tenant_shard"):
+        g.pop(key, None)
+    return client.post(path, json=payload)
+
+
+def company_name(shard: str, company_id: str) -> str | None:
+    with get_shard_router().engine(shard).connect() as connection:
+        return connection.execute(
+            text("SELECT name FROM companies WHERE id = :id"), {"id": company_id}
+        ).scalar()
+
+
+@pytest.fixture()
+def tenants(app, db_session):
+    small_user, small_company = create_tenant(db_session, "Small")
+    whale_user, whale_company = create_tenant(db_session, "Whale")
+    seed_rbac()
+    grant_admin(db_session, small_user, small_company)
+    grant_admin(db_session, whale_user, whale_company)
+    ids = (
+        (small_user.id, small_user.client_id),
+        small_company.id,
+        (whale_user.id, whale_user.client_id),
+        whale_company.id,
+        whale_user.client_id,
+    )
+
+    result = app.test_cli_runner().invoke(
+        args=["copy-tenant", whale_user.client_id, "--to", "whale", "--create-schema", "--switch"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "companies: 1 rows" in result.output
+    get_tenant_registry().refresh(force=True)
+    return ids
+
+
+def test_requests_route_to_the_tenant_shard(client, db_session, tenants):
+    small_user, small_company_id, whale_user, whale_company_id, _ = tenants
+
+    response = call(client, "PATCH", f"/companies/{whale_company_id}", whale_user, {"name": "Whale Sharded"})
+    assert response.status_code == 200
+    assert company_name("whale", whale_company_id) == "Whale Sharded"
+    assert company_name("default", whale_company_id) == "Whale Co"
+
+    response = call(client, "PATCH", f"/companies/{small_company_id}", small_user, {"name": "Small Renamed"})
+    assert response.status_code == 200
+    assert company_name("default", small_company_id) == "Small Renamed"
+    assert company_name("whale", small_company_id) is None
+
+
+def test_copy_refuses_to_duplicate_a_tenant(app, db_session, tenants):
+    *_, whale_client_id = tenants
+
+    result = app.test_cli_runner().invoke(args=["copy-tenant", whale_client_id, "--to", "whale"])
+
+    assert result.exit_code == 1
+    assert "already has" in result.output
+
+
+def test_unknown_shards_are_rejected(app, db_session, tenants):
+    *_, whale_client_id = tenants
+
+    result = app.test_cli_runner().invoke(args=["copy-tenant", whale_client_id, "--to", "nowhere"])
+
+    assert result.exit_code == 2
+
+
+def test_parse_mapping_keeps_equals_in_urls():
+    assert parse_mapping("a=postgresql://h/db?sslmode=require, b=sqlite:///b.db,") == {
+        "a": "postgresql://h/db?sslmode=require",
+        "b": "sqlite:///b.db",
+    }
+
+
+def test_revocation_for_a_user_that_only_exists_on_a_shard(client, db_session, tenants):
+    _, _, whale_admin, _, whale_client_id = tenants
+    user_id = "00000000-0000-0000-0000-00000000beef"
+    now = datetime.now(timezone.utc)
+    with get_shard_router().engine("whale").begin() as connection:
+        connection.execute(
+            insert(User.__table__),
+            {
+                "id": user_id,
+                "client_id": whale_client_id,
+                "email": "new@whale.example.com",
+                "status": "active",
+                "created_at": now,
+                "updated_at": now,
+            },
+        )
+    # revoked_tokens lives on the default database, which has no such user.
+    db_session.execute(text("PRAGMA foreign_keys=ON"))
+
+    response = call(client, "POST", "/auth/logout", (user_id, whale_client_id))
+
+    assert response.status_code == 200
+    response = call(client, "POST", f"/auth/users/{user_id}/sign-out", whale_admin)
+    assert response.status_code == 200
+    assert [entry.user_id for entry in RevokedToken.query.all()] == [user_id, user_id]
+
+
+def test_invited_user_activates_and_signs_in_on_a_shard(client, db_session, tenants):
+    *_, whale_admin, _, whale_client_id = tenants
+    response = call(client, "POST", "/auth/invite", whale_admin, {"email": "hire@whale.example.com"})
+    assert response.status_code == 201
+    invite_token = response.get_json()["invite_token"]
+
+    response = post_anonymously(client, "/auth/activate", {"token": invite_token, "password": "s3cret-pass"})
+    assert response.status_code == 200
+    with get_shard_router().engine("whale").connect() as connection:
+        status = connection.execute(
+            text("SELECT status FROM users WHERE email = :email"), {"email": "hire@whale.example.com"}
+        ).scalar()
+    assert status == "active"
+
+    response = post_anonymously(client, "/auth/login", {"email": "hire@whale.example.com", "password": "s3cret-pass"})
+    assert response.status_code == 200
+    refresh_token = response.get_json()["refresh_token"]
+
+    response = post_anonymously(client, "/auth/refresh", {"refresh_token": refresh_token})
+    assert response.status_code == 200
+
+
+def test_platform_roles_move_with_the_tenant(app, client, db_session):
+    user, _ = create_tenant(db_session, "Platform")
+    seed_rbac()
+    super_admin = Role.query.filter_by(name="Super Admin", scope="platform", client_id=None).one()
+    UserRoleRepository(db_session).assign_role(user.id, super_admin.id)
+    db_session.commit()
+
+    result = app.test_cli_runner().invoke(args=["copy-tenant", user.client_id, "--to", "whale", "--create-schema", "--switch"])
+    assert result.exit_code == 0, result.output
+    assert "platform roles: 1 rows" in result.output
+    get_tenant_registry().refresh(force=True)
+
+    response = call(client, "POST", "/auth/invite", (user.id, user.client_id), {"email": "ops@platform.example.com"})
+    assert response.status_code == 201
+    with get_shard_router().engine("whale").connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM user_invitations")).scalar() == 1
+
+
+def test_control_tables_stay_on_the_default_database(db_session, tenants):
+    (_, small_client_id), *_, whale_client_id = tenants
+    clients = Client.__table__
+    users = User.__table__
+    router = get_shard_router()
+    bind_tenant(whale_client_id)
+
+    assert router.route(clause=select(clients)) is None
+    joined = select(clients.c.id).join_from(clients, RevokedToken.__table__, clients.c.id == RevokedToken.client_id)
+    assert router.route(clause=joined) is None
+    assert router.route(clause=text("SELECT 1")) is None
+    tenant_union = union_all(select(users.c.id), select(Company.__table__.c.id))
+    assert router.route(clause=tenant_union) is router.engine("whale")
+    # Only the default database has the other tenants' clients rows.
+    assert db_session.execute(select(clients.c.id).where(clients.c.id == small_client_id)).scalar() == small_client_id
@@ -0,0 +1,166 @@
+import pytest
+from flask import g
+from werkzeug.exceptions import Forbidden, NotFound
+
+from app.cli import seed_rbac
+from app.common.acl_cache import init_company_access_cache
+from app.common.jwt import create_access_token
+from app.extensions import db
+from app.models.client import Client
+from app.models.company import Company
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_company_access_repository import UserCompanyAccessRepository
+from app.repositories.user_role_repository import UserRoleRepository
+from app.services.company_access_service import CompanyAccessService
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_client(db_session) -> Client:
+    client = Client(name="Acme")
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def create_user(db_session, client_id: str, email: str) -> User:
+    user = User(client_id=client_id, email=email, status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def create_company(db_session, client_id: str, name: str, tax_id: str) -> Company:
+    company = Company(client_id=client_id, name=name, tax_id=tax_id)
+    db_session.add(company)
+    db_session.commit()
+    return company
+
+
+def assign_role(db_session, user: User, role_name: str) -> None:
+    role = Role.query.filter_by(name=role_name, scope="tenant", client_id=user.client_id).one()
+    UserRoleRepository(db_session).assign_role(user.id, role.id)
+    db_session.commit()
+
+
+def call(client, method: str, path: str, user: User, payload: dict | None = None):
+    g.pop("_authz_cache", None)
+    g.pop("_company_access_maps", None)
+    token = create_access_token(user.id, user.client_id)
+    return client.open(path, method=method, json=payload, headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture()
+def tenant_setup(db_session):
+    tenant = create_client(db_session)
+    admin = create_user(db_session, tenant.id, "admin@example.com")
+    advisor = create_user(db_session, tenant.id, "advisor@example.com")
+    seed_rbac()
+    assign_role(db_session, admin, "Admin Cliente")
+    assign_role(db_session, advisor, "Admin Cliente")
+    company = create_company(db_session, tenant.id, "Alpha", "A-123")
+    return tenant, admin, advisor, company
+
+
+def create_team_with_member(client, admin: User, advisor: User) -> str:
+    response = call(client, "POST", "/teams", admin, {"name": "Payroll"})
+    assert response.status_code == 201
+    team_id = response.get_json()["team"]["id"]
+    response = call(client, "POST", f"/teams/{team_id}/members", admin, {"user_id": advisor.id})
+    assert response.get_json() == {"added": True}
+    return team_id
+
+
+def test_team_grant_gives_members_company_access(client, tenant_setup):
+    _, admin, advisor, company = tenant_setup
+    team_id = create_team_with_member(client, admin, advisor)
+
+    assert call(client, "GET", f"/companies/{company.id}", advisor).status_code == 404
+
+    response = call(client, "PUT", f"/teams/{team_id}/companies/{company.id}", admin, {"access_level": "manager"})
+    assert response.status_code == 200
+
+    assert call(client, "GET", f"/companies/{company.id}", advisor).status_code == 200
+    response = call(client, "PATCH", f"/companies/{company.id}", advisor, {"name": "Alpha 2"})
+    assert response.status_code == 200
+    response = call(client, "POST", f"/companies/{company.id}/deactivate", advisor)
+    assert response.status_code == 403
+
+    listed = call(client, "GET", "/companies", advisor).get_json()["companies"]
+    assert [(entry["id"], entry["access_level"]) for entry in listed] == [(company.id, "manager")]
+
+
+def test_effective_level_is_highest_grant(client, db_session, tenant_setup):
+    tenant, admin, advisor, company = tenant_setup
+    other = create_company(db_session, tenant.id, "Beta", "B-456")
+    team_id = create_team_with_member(client, admin, advisor)
+    call(client, "PUT", f"/teams/{team_id}/companies/{company.id}", admin, {"access_level": "viewer"})
+    call(client, "PUT", f"/teams/{team_id}/companies/{other.id}", admin, {"access_level": "admin"})
+    UserCompanyAccessRepository(db_session).upsert_access(advisor.id, company.id, tenant.id, "operator")
+    UserCompanyAccessRepository(db_session).upsert_access(advisor.id, other.id, tenant.id, "viewer")
+    db_session.commit()
+    g.pop("_company_access_maps", None)
+
+    service = CompanyAccessService()
+    assert service.get_access_map(advisor.id, tenant.id) == {company.id: "operator", other.id: "admin"}
+    assert service.require_access(advisor.id, other.id, tenant.id, "admin") == "admin"
+    with pytest.raises(Forbidden):
+        service.require_access(advisor.id, company.id, tenant.id, "manager")
+    with pytest.raises(NotFound):
+        service.require_access(admin.id, company.id, tenant.id, "viewer")
+
+    listed = call(client, "GET", "/companies", advisor).get_json()["companies"]
+    assert {entry["id"]: entry["access_level"] for entry in listed} == {company.id: "operator", other.id: "admin"}
+
+
+def test_removing_member_drops_cached_access(app, client, tenant_setup):
+    _, admin, advisor, company = tenant_setup
+    app.config["COMPANY_ACCESS_CACHE_SIZE"] = 128
+    init_company_access_cache(app)
+    team_id = create_team_with_member(client, admin, advisor)
+    call(client, "PUT", f"/teams/{team_id}/companies/{company.id}", admin, {"access_level": "viewer"})
+
+    assert call(client, "GET", f"/companies/{company.id}", advisor).status_code == 200
+
+    response = call(client, "DELETE", f"/teams/{team_id}/members/{advisor.id}", admin)
+    assert response.get_json() == {"removed": True}
+    assert call(client, "GET", f"/companies/{company.id}", advisor).status_code == 404
+
+
+def test_team_endpoints_are_tenant_scoped(client, db_session, tenant_setup):
+    _, admin, advisor, _ = tenant_setup
+    team_id = create_team_with_member(client, admin, advisor)
+    other_tenant = Client(name="Globex")
+    db_session.add(other_tenant)
+    db_session.commit()
+    outsider = create_user(db_session, other_tenant.id, "outsider@example.com")
+
+    response = call(client, "POST", f"/teams/{team_id}/members", admin, {"user_id": outsider.id})
+    assert response.status_code == 404
+    response = call(client, "PUT", f"/teams/{team_id}/companies/missing", admin, {"access_level": "viewer"})
+    assert response.status_code == 404
+
+
+def test_duplicate_team_name_is_a_conflict(client, db_session, tenant_setup):
+    _, admin, advisor, _ = tenant_setup
+    create_team_with_member(client, admin, advisor)
+
+    response = call(client, "POST", "/teams", admin, {"name": " Payroll "})
+
+    assert response.status_code == 409
+    assert response.get_json()["message"] == "team_name_taken"
+    other_tenant = Client(name="Globex")
+    db_session.add(other_tenant)
+    db_session.commit()
+    outsider = create_user(db_session, other_tenant.id, "outsider@example.com")
+    seed_rbac()
+    assign_role(db_session, outsider, "Admin Cliente")
+    assert call(client, "POST", "/teams", outsider, {"name": "Payroll"}).status_code == 201
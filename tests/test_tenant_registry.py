@@ -0,0 +1,138 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app.common.jwt import create_access_token
+from app.common.tenant import _parse_uuid
+from app.common.tenant_registry import get_tenant_registry
+from app.extensions import db
+from app.models.client import Client
+from app.models.user import User
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        get_tenant_registry().expire()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_client(db_session, name: str = "Acme", status: str = "active") -> Client:
+    client = Client(name=name, status=status)
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+def create_user(db_session, client_id: str, email: str = "user@example.com") -> User:
+    user = User(client_id=client_id, email=email, status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def auth_header_for(user: User) -> dict[str, str]:
+    token = create_access_token(user.id, user.client_id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def count_queries(func) -> tuple[object, int]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        result = func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_suspended_tenant_is_rejected_without_queries(app, client, db_session):
+    app.config["ALLOW_X_CLIENT_ID_HEADER"] = True
+    active_id = create_client(db_session).id
+    suspended_id = create_client(db_session, "Globex", status="suspended").id
+    get_tenant_registry().refresh(force=True)
+
+    response, queries = count_queries(
+        lambda: client.get("/health/tenant", headers={"X-Client-Id": suspended_id})
+    )
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "tenant_suspended"
+    assert queries == 0
+
+    response, queries = count_queries(lambda: client.get("/health/tenant", headers={"X-Client-Id": active_id}))
+    assert response.status_code == 200
+    assert queries == 0
+
+
+def test_token_for_disabled_tenant_is_rejected(client, db_session):
+    tenant = create_client(db_session, status="disabled")
+    user = create_user(db_session, tenant.id)
+
+    response = client.get("/auth/me", headers=auth_header_for(user))
+
+    assert response.status_code == 403
+    assert response.get_json()["message"] == "tenant_disabled"
+
+
+def test_status_change_reaches_registry(app, client, db_session):
+    tenant = create_client(db_session)
+    user = create_user(db_session, tenant.id)
+    assert client.get("/auth/me", headers=auth_header_for(user)).status_code == 200
+
+    result = app.test_cli_runner().invoke(args=["set-tenant-status", tenant.id, "suspended"])
+    assert result.exit_code == 0
+    assert client.get("/auth/me", headers=auth_header_for(user)).status_code == 403
+
+    app.test_cli_runner().invoke(args=["set-tenant-status", tenant.id, "active"])
+    assert client.get("/auth/me", headers=auth_header_for(user)).status_code == 200
+
+
+def test_registry_fails_open_when_clients_cannot_be_read(app, client, db_session):
+    tenant_id = create_client(db_session, status="suspended").id
+    registry = get_tenant_registry()
+    registry.refresh(force=True)
+    errors = registry.stats()["errors"]
+    db.session.execute(db.text("DROP TABLE clients"))
+    db.session.commit()
+
+    registry.refresh(force=True)
+    assert registry.stats()["errors"] == errors + 1
+    # The last good snapshot still applies.
+    assert registry.get(tenant_id).status == "suspended"
+
+    registry._tenants.clear()
+    assert registry.get(tenant_id) is None
+
+
+def test_refresh_leaves_the_request_transaction_alone(db_session, monkeypatch):
+    registry = get_tenant_registry()
+    pending = Client(name="Pending")
+    db_session.add(pending)
+    db_session.flush()
+
+    registry.refresh(force=True)
+
+    def fail(self):
+        raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr("app.repositories.client_repository.ClientRepository.list_registry_rows", fail)
+    registry.refresh(force=True)
+
+    db_session.commit()
+    assert db_session.get(Client, pending.id) is not None
+    assert Client.query.filter_by(name="Pending").count() == 1
+
+
+def test_client_id_parsing_is_memoized():
+    _parse_uuid.cache_clear()
+    value = "6f1c0b7e-3c1a-4e7b-9c57-2b1d6a0c9e11"
+
+    assert _parse_uuid(value) is _parse_uuid(value)
+    assert _parse_uuid.cache_info().hits == 1
@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.cli import seed_rbac
+from app.common.jwt import create_access_token, decode_token
+from app.common.revocation import BloomFilter, RevocationList, _issued_by, get_revocation_list
+from app.extensions import db
+from app.models.client import Client
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.user_role_repository import UserRoleRepository
+from app.services.refresh_token_service import RefreshTokenService
+from app.services.token_revocation_service import TokenRevocationService
+
+
+@pytest.fixture()
+def db_session(app):
+    with app.app_context():
+        db.create_all()
+        yield db.session
+        db.session.remove()
+        db.drop_all()
+
+
+def create_user(db_session, tenant: Client | None = None, email: str = "user@example.com") -> User:
+    if tenant is None:
+        tenant = Client(name="Acme")
+        db_session.add(tenant)
+        db_session.commit()
+    user = User(client_id=tenant.id, email=email, status="active")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def count_queries(func) -> int:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"jti-{index}" for index in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{index}" in bloom for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_logout_revokes_access_token(client, db_session):
+    user = create_user(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+    response = client.get("/auth/me", headers=headers)
+
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "token_revoked"
+    other_headers = {"Authorization": f"Bearer {create_access_token(user.id, user.client_id)}"}
+    assert client.get("/auth/me", headers=other_headers).status_code == 200
+
+
+def test_unrevoked_token_check_does_not_query(client, db_session):
+    user = create_user(db_session)
+    token = create_access_token(user.id, user.client_id)
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    revocation_list = get_revocation_list()
+    queries = count_queries(lambda: revocation_list.is_revoked(decode_token(token)))
+
+    assert queries == 0
+    assert revocation_list.stats()["filter_hits"] == 0
+
+
+def test_other_worker_picks_up_revocation_on_refresh(app, db_session):
+    user = create_user(db_session)
+    token = create_access_token(user.id, user.client_id)
+    claims = decode_token(token)
+    other_worker = RevocationList(capacity=100, refresh_seconds=60)
+    assert not other_worker.is_revoked(claims)
+
+    TokenRevocationService().revoke_token(claims)
+    db_session.commit()
+    assert not other_worker.is_revoked(claims)
+
+    other_worker.refresh(force=True)
+    assert other_worker.is_revoked(claims)
+    assert other_worker.stats()["confirmed"] == 1
+
+
+def token_issued_seconds_ago(monkeypatch, user: User, seconds: int) -> str:
+    issued_at = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return issued_at
+
+    with monkeypatch.context() as patch:
+        patch.setattr("app.common.jwt.datetime", Clock)
+        return create_access_token(user.id, user.client_id)
+
+
+def test_forced_sign_out_revokes_existing_tokens(client, db_session, monkeypatch):
+    admin = create_user(db_session, email="admin@example.com")
+    tenant = db_session.get(Client, admin.client_id)
+    target = create_user(db_session, tenant, email="target@example.com")
+    seed_rbac()
+    role = Role.query.filter_by(name="Admin Cliente", scope="tenant", client_id=tenant.id).one()
+    UserRoleRepository(db_session).assign_role(admin.id, role.id)
+    db_session.commit()
+    target_headers = {"Authorization": f"Bearer {token_issued_seconds_ago(monkeypatch, target, 2)}"}
+    admin_headers = {"Authorization": f"Bearer {create_access_token(admin.id, admin.client_id)}"}
+
+    response = client.post(f"/auth/users/{target.id}/sign-out", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert client.get("/auth/me", headers=target_headers).status_code == 401
+    # Logging in again once the sign-out's second has passed yields a usable token.
+    fresh_headers = {"Authorization": f"Bearer {token_issued_seconds_ago(monkeypatch, target, -1)}"}
+    assert client.get("/auth/me", headers=fresh_headers).status_code == 200
+    assert client.get("/auth/me", headers=admin_headers).status_code == 200
+
+
+def test_user_revocation_outlives_tokens_with_configured_lifetime(app, db_session):
+    app.config["JWT_ACCESS_TOKEN_MINUTES"] = 240
+    user = create_user(db_session)
+    claims = decode_token(create_access_token(user.id, user.client_id))
+
+    entry = TokenRevocationService().revoke_user(user.id, user.client_id)
+
+    assert entry.expires_at.timestamp() >= claims["exp"]
+
+
+def test_user_revocation_covers_tokens_from_the_same_second():
+    revoked_at = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    second = int(revoked_at.timestamp())
+
+    assert _issued_by({"iat": second - 1}, revoked_at)
+    assert _issued_by({"iat": second}, revoked_at)
+    assert not _issued_by({"iat": second + 1}, revoked_at)
+    assert not _issued_by({}, revoked_at)
+
+
+def test_refresh_token_minted_in_the_sign_out_second_is_rejected(client, db_session):
+    user = create_user(db_session)
+    entry = TokenRevocationService().revoke_user(user.id, user.client_id)
+    assert entry.revoked_at.microsecond == 0
+    # A rotation that read its token before the sign-out committed stores a successor afterwards.
+    raced = RefreshTokenService().issue(user.id, user.client_id)
+    raced.refresh_token.created_at = entry.revoked_at
+    db_session.commit()
+
+    response = client.post("/auth/refresh", json={"refresh_token": raced.token, "client_id": user.client_id})
+
+    assert response.status_code == 401
+    assert response.get_json()["message"] == "refresh_token_revoked"
+    assert RefreshToken.query.filter_by(family_id=raced.refresh_token.family_id).one().revoked_at is not None
+
+
+def test_pruned_revocations_leave_the_table_and_filter(app, db_session):
+    user = create_user(db_session)
+    revocation_list = get_revocation_list()
+    revocation_list.refresh(force=True)
+    now = datetime.now(timezone.utc)
+    expired = RevokedToken(
+        jti="expired-jti",
+        client_id=user.client_id,
+        user_id=user.id,
+        revoked_at=now - timedelta(hours=2),
+        expires_at=now - timedelta(hours=1),
+    )
+    active = RevokedToken(
+        jti="active-jti",
+        client_id=user.client_id,
+        user_id=user.id,
+        revoked_at=now,
+        expires_at=now + timedelta(hours=1),
+    )
+    db_session.add_all([expired, active])
+    db_session.commit()
+    # Incremental refreshes load every new row, expired or not.
+    revocation_list.refresh(force=True)
+    assert "expired-jti" in revocation_list._filter
+
+    result = app.test_cli_runner().invoke(args=["prune-revoked-tokens"])
+
+    assert result.exit_code == 0, result.output
+    assert "Deleted 1 expired" in result.output
+    assert RevokedToken.query.filter_by(jti="expired-jti").count() == 0
+    rebuilds = revocation_list.stats()["rebuilds"]
+    revocation_list.refresh()
+    assert revocation_list.stats()["rebuilds"] == rebuilds + 1
+    assert "expired-jti" not in revocation_list._filter
+    assert "active-jti" in revocation_list._filter